@@ -1,62 +1,136 @@
+from bisect import bisect_left
+
 import numpy as np
 
 
 class AnimationCurve:
     def __init__(self, x_range, y_range):
-        self.points = []
-        self.tangents = {}
+        self._points = []
+        self._tangents = {}
+        self._knots = None  # cached sorted knots and Hermite coefficients
+        self._knot_arrays = None  # the same as NumPy arrays
         self.x_range = x_range
         self.y_range = y_range
 
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self.invalidate()
+
+    @property
+    def tangents(self):
+        return self._tangents
+
+    @tangents.setter
+    def tangents(self, tangents):
+        self._tangents = tangents
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop the cached knots; to be called when points or tangents change."""
+        self._knots = None
+        self._knot_arrays = None
+
+    def knots(self):
+        """
+        Return the sorted x coordinates of the points and, for each segment,
+        the tuple (x0, x1, a, b, c, d) of the Hermite polynomial
+        y = a*t^3 + b*t^2 + c*t + d, with t = (x - x0) / (x1 - x0).
+        The result is cached until the curve changes.
+        """
+        if self._knots is None:
+            points = sorted(self._points)
+            segments = []
+            for p0, p1 in zip(points, points[1:]):
+                y0, y1 = p0[1], p1[1]
+                m0, m1 = self._tangents[p0][1], self._tangents[p1][1]
+                segments.append((
+                    p0[0], p1[0],
+                    2 * y0 - 2 * y1 + m0 + m1,
+                    -3 * y0 + 3 * y1 - 2 * m0 - m1,
+                    m0,
+                    y0))
+            self._knots = ([p[0] for p in points], segments)
+        return self._knots
+
+    def knot_arrays(self):
+        """
+        Return the cached knots() as NumPy arrays: the knot x coordinates
+        and a (segments, 6) array of (x0, x1, a, b, c, d).
+        """
+        if self._knot_arrays is None:
+            xs, segments = self.knots()
+            self._knot_arrays = (
+                np.array(xs, dtype=float),
+                np.array(segments, dtype=float).reshape(-1, 6))
+        return self._knot_arrays
+
     def duration(self):
-        points = sorted(self.points)
-        return points[-1][0]
+        xs, _ = self.knots()
+        return xs[-1]
 
     def add_point(self, x, y):
-        self.points.append((x, y))
-        self.tangents[(x, y)] = ((self.x_range // 25) + 1, 0)
+        self._points.append((x, y))
+        self._tangents[(x, y)] = ((self.x_range // 25) + 1, 0)
+        self.invalidate()
 
     def move_point(self, index, x, y):
-        if index is not None and 0 <= index < len(self.points):
-            old_point = self.points[index]
+        if index is not None and 0 <= index < len(self._points):
+            old_point = self._points[index]
             new_point = (x, y)
-            self.points[index] = new_point
-            self.tangents[new_point] = self.tangents.pop(old_point)
+            self._points[index] = new_point
+            self._tangents[new_point] = self._tangents.pop(old_point)
+            self.invalidate()
 
     def adjust_tangent(self, index, tx, ty):
-        if index is not None and 0 <= index < len(self.points):
-            px, py = self.points[index]
+        if index is not None and 0 <= index < len(self._points):
+            px, py = self._points[index]
             tangent = (tx - px, ty - py)
-            self.tangents[(px, py)] = tangent
+            self._tangents[(px, py)] = tangent
+            self.invalidate()
 
     def remove_point(self, index):
-        if index is not None and 0 <= index < len(self.points):
-            point = self.points[index]
-            del self.points[index]
-            del self.tangents[point]
+        if index is not None and 0 <= index < len(self._points):
+            point = self._points[index]
+            del self._points[index]
+            del self._tangents[point]
+            self.invalidate()
 
     def evaluate(self, x):
-        points = sorted(self.points)
-
-        for i in range(len(points) - 1):
-            p0, p1 = points[i], points[i + 1]
-            t0, t1 = self.tangents[p0], self.tangents[p1]
-
-            if p0[0] <= x <= p1[0]:
-                t = (x - p0[0]) / (p1[0] - p0[0])
-
-                hermite_basis = np.array([
-                    [2, -2, 1, 1],
-                    [-3, 3, -2, -1],
-                    [0, 0, 1, 0],
-                    [1, 0, 0, 0]
-                ])
-                parameters = np.array([t**3, t**2, t, 1])
-
-                control = np.array([p0[1], p1[1], t0[1], t1[1]])
-                basis_with_params = np.matmul(parameters, hermite_basis)
-                hermite_blend = np.dot(basis_with_params, control)
-
-                return hermite_blend
+        xs, segments = self.knots()
+        # first segment whose end is not before x
+        i = bisect_left(xs, x, 1) - 1
+        if i >= len(segments) or not xs[i] <= x:
+            return 0.0
+        x0, x1, a, b, c, d = segments[i]
+        t = (x - x0) / (x1 - x0)
+        return ((a * t + b) * t + c) * t + d
 
-        return 0.0
+    def evaluate_many(self, xs):
+        """
+        Evaluate the curve at many x coordinates at once (ref. evaluate()).
+        :param xs: array of x coordinates
+        :return: array of y values (0.0 outside the curve, nan on zero-width
+                segments, where evaluate() raises ZeroDivisionError)
+        """
+        xs = np.asarray(xs, dtype=float)
+        knots, segments = self.knot_arrays()
+        result = np.zeros(xs.shape)
+        if not len(segments):
+            return result
+        # first segment whose end is not before x
+        i = np.searchsorted(knots[1:], xs, side='left')
+        inside = i < len(segments)
+        i = np.minimum(i, len(segments) - 1)
+        inside &= knots[i] <= xs
+        x0, x1, a, b, c, d = segments[i].T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = (xs - x0) / (x1 - x0)
+            y = ((a * t + b) * t + c) * t + d
+        y[(x1 == x0) & inside] = np.nan
+        result[inside] = y[inside]
+        return result
@@ -4,6 +4,8 @@ import numpy as np
 
 from elm_emulator.animation_curve import AnimationCurve
 
+CURVE_SAMPLES = 100  # samples of each segment of the drawn curve
+
 
 class AnimationCurveEditor(Frame):
     def __init__(self, parent):
@@ -33,6 +35,13 @@ class AnimationCurveEditor(Frame):
         self.canvas.bind("<ButtonRelease-3>", self.remove_point)
 
         self.canvas.bind("<MouseWheel>", self.zoom)
+        self.canvas.bind("<Configure>", lambda event: self.draw_curve())
+
+        # persistent canvas items, updated in place by redraw()
+        self.axes_key = None  # canvas size and zoom of the drawn axes
+        self.point_items = []  # (oval, tangent line, tangent line) per point
+        self.curve_item = None  # polyline of the curve
+        self.pending_redraw = None  # after_idle id of the scheduled redraw
 
         self.draw_curve()
 
@@ -89,8 +98,18 @@ class AnimationCurveEditor(Frame):
             self.draw_curve()
 
     def draw_curve(self):
-        self.canvas.delete("all")
-        self.draw_axes()
+        # coalesce the redraw requests to one per idle cycle
+        if self.pending_redraw is None:
+            self.pending_redraw = self.canvas.after_idle(self.redraw)
+
+    def redraw(self):
+        self.pending_redraw = None
+        axes_key = (self.canvas.winfo_width(), self.canvas.winfo_height(), self.zoom_level)
+        if axes_key != self.axes_key:
+            self.axes_key = axes_key
+            self.canvas.delete("axes")
+            self.draw_axes()
+            self.canvas.tag_lower("axes")
         self.draw_points()
         self.draw_bezier_curve()
 
@@ -100,56 +119,56 @@ class AnimationCurveEditor(Frame):
 
         for x in np.linspace(self.x_range[0], self.x_range[1], num=11):
             canvas_x, _ = self.world_to_canvas(x, 0)
-            self.canvas.create_line(canvas_x, self.padding['top'], canvas_x, height - self.padding['bottom'], fill="grey", dash=(4, 2))
+            self.canvas.create_line(canvas_x, self.padding['top'], canvas_x, height - self.padding['bottom'], fill="grey", dash=(4, 2), tags="axes")
             if self.padding['left'] <= canvas_x <= width - self.padding['right']:
-                self.canvas.create_text(canvas_x, height - self.padding['bottom'] + 15, text=f"{x/1000.0:.1f} s", fill="grey")
+                self.canvas.create_text(canvas_x, height - self.padding['bottom'] + 15, text=f"{x/1000.0:.1f} s", fill="grey", tags="axes")
 
         for y in np.linspace(self.y_range[0], self.y_range[1], num=13):
             _, canvas_y = self.world_to_canvas(0, y)
-            self.canvas.create_line(self.padding['left'], canvas_y, width - self.padding['right'], canvas_y, fill="grey", dash=(4, 2))
+            self.canvas.create_line(self.padding['left'], canvas_y, width - self.padding['right'], canvas_y, fill="grey", dash=(4, 2), tags="axes")
             if self.padding['top'] <= canvas_y <= height - self.padding['bottom']:
-                self.canvas.create_text(self.padding['left'] - 32, canvas_y, text=f"{y:.0f} km/h", fill="grey")
+                self.canvas.create_text(self.padding['left'] - 32, canvas_y, text=f"{y:.0f} km/h", fill="grey", tags="axes")
 
     def draw_points(self):
-        for x, y in self.curve.points:
+        points = self.curve.points
+        # create or delete the items, so that there is a set for each point
+        while len(self.point_items) < len(points):
+            self.point_items.append((
+                self.canvas.create_oval(0, 0, 0, 0, fill="red", tags="points"),
+                self.canvas.create_line(0, 0, 0, 0, fill="blue", tags="points"),
+                self.canvas.create_line(0, 0, 0, 0, fill="blue", tags="points")))
+            self.canvas.tag_raise("curve")  # the curve is drawn over the points
+        while len(self.point_items) > len(points):
+            self.canvas.delete(*self.point_items.pop())
+        for (x, y), (oval, line1, line2) in zip(points, self.point_items):
             canvas_x, canvas_y = self.world_to_canvas(x, y)
-            self.canvas.create_oval(canvas_x - 5, canvas_y - 5, canvas_x + 5, canvas_y + 5, fill="red")
+            self.canvas.coords(oval, canvas_x - 5, canvas_y - 5, canvas_x + 5, canvas_y + 5)
             tangent = self.curve.tangents[(x, y)]
             t1_x, t1_y = self.world_to_canvas(x + tangent[0], y + tangent[1])
             t2_x, t2_y = self.world_to_canvas(x - tangent[0], y - tangent[1])
-            self.canvas.create_line(canvas_x, canvas_y, t1_x, t1_y, fill="blue")
-            self.canvas.create_line(canvas_x, canvas_y, t2_x, t2_y, fill="blue")
+            self.canvas.coords(line1, canvas_x, canvas_y, t1_x, t1_y)
+            self.canvas.coords(line2, canvas_x, canvas_y, t2_x, t2_y)
 
     def draw_bezier_curve(self):
+        if self.curve_item is None:
+            self.curve_item = self.canvas.create_line(0, 0, 0, 0, fill="black", tags="curve")
         if len(self.curve.points) < 2:
+            self.canvas.itemconfigure(self.curve_item, state=HIDDEN)
             return
 
-        points = sorted(self.curve.points)
-        curve_points = []
-
-        for i in range(len(points) - 1):
-            p0, p1 = points[i], points[i + 1]
-            t0, t1 = self.curve.tangents[p0], self.curve.tangents[p1]
-
-            for t in np.linspace(0, 1, 100):
-                hermite_basis = np.array([
-                    [2, -2, 1, 1],
-                    [-3, 3, -2, -1],
-                    [0, 0, 1, 0],
-                    [1, 0, 0, 0]
-                ])
-                parameters = np.array([t**3, t**2, t, 1])
-
-                controls = np.array([p0, p1, t0, t1])
-                basis_with_params = np.matmul(parameters, hermite_basis)
-                x, y = np.dot(basis_with_params, controls[:, 0]), np.dot(basis_with_params, controls[:, 1])
-
-                curve_points.append((x, y))
-
-        for i in range(len(curve_points) - 1):
-            x1, y1 = self.world_to_canvas(*curve_points[i])
-            x2, y2 = self.world_to_canvas(*curve_points[i + 1])
-            self.canvas.create_line(x1, y1, x2, y2, fill="black", tags="curve")
+        # CURVE_SAMPLES samples per segment, evaluated at once
+        knots, _ = self.curve.knot_arrays()
+        t = np.linspace(0, 1, CURVE_SAMPLES)
+        xs = (knots[:-1, None] + (knots[1:] - knots[:-1])[:, None] * t).ravel()
+        ys = self.curve.evaluate_many(xs)
+        finite = np.isfinite(ys)
+        canvas_x, canvas_y = self.world_to_canvas(xs[finite], ys[finite])
+        coords = np.column_stack((canvas_x, canvas_y)).ravel().tolist()
+        if len(coords) >= 4:
+            self.canvas.coords(self.curve_item, coords)
+            self.canvas.itemconfigure(self.curve_item, state=NORMAL)
+        else:
+            self.canvas.itemconfigure(self.curve_item, state=HIDDEN)
 
     def zoom(self, event):
         if event.delta > 0:
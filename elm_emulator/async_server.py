@@ -0,0 +1,125 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+POLL_INTERVAL = 0.1  # seconds - check of the emulator thread state
+# Output of a client buffered by the transport before its requests stop
+# being processed (i.e., until the client reads its answers)
+WRITE_BUFFER_LIMIT = 64 * 1024  # bytes
+
+
+class AsyncElmServer:
+    """
+    asyncio TCP/IP server accepting many concurrent clients, each one with
+    its own ELM session (ref. ElmSession). Network I/O is performed by the
+    event loop, while requests are processed by a single worker thread, so
+    that the emulator (and the simulated car) is accessed by one request
+    at a time. The worker thread does not sleep: the emulated bus timings
+    of the responses are scheduled by the timers of the event loop (ref.
+    PacedOutput). The requests of a client which does not read its answers
+    are not processed while its output exceeds WRITE_BUFFER_LIMIT.
+    """
+
+    def __init__(self, emulator, host="", port=None, read_size=4096):
+        self.emulator = emulator
+        self.host = host or None  # None = all interfaces
+        self.port = port
+        self.read_size = read_size
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='elm-session')
+        self.sessions = set()
+
+    def is_running(self):
+        return (self.emulator.threadState !=
+                self.emulator.THREAD.STOPPED and
+                self.emulator.threadState !=
+                self.emulator.THREAD.TERMINATED)
+
+    async def serve(self):
+        """
+        Accept clients until the emulator is stopped or terminated.
+        """
+        server = await asyncio.start_server(
+            self.handle_client, self.host, self.port)
+        async with server:
+            while self.is_running():
+                await asyncio.sleep(POLL_INTERVAL)
+        self.executor.shutdown(wait=False)
+
+    def echo_enabled(self, session):
+        emulator = self.emulator
+        counters = (emulator.counters if emulator.session is session
+                    else session.counters)
+        return counters.echo
+
+    async def handle_client(self, reader, writer):
+        """
+        Read the requests of a client, echo them and process them through
+        the emulator.
+        """
+        loop = asyncio.get_running_loop()
+        peer = writer.get_extra_info('peername')
+        logging.debug("Connected by %s", peer)
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_LIMIT)
+
+        def call_at(when, callback):  # called by the worker thread
+            loop.call_soon_threadsafe(loop.call_at, when, callback)
+
+        session = await loop.run_in_executor(
+            self.executor, self.open_session, writer.write, peer, call_at)
+        self.sessions.add(session)
+        try:
+            while self.is_running():
+                if self.emulator.threadState == self.emulator.THREAD.PAUSED:
+                    await asyncio.sleep(POLL_INTERVAL)
+                    continue
+                line, raw = session.framer.pop()
+                if raw and self.echo_enabled(session):
+                    session.output.write(raw)  # after the queued answers
+                if line is not None:
+                    await writer.drain()  # wait for a slow client
+                    await loop.run_in_executor(
+                        self.executor,
+                        self.emulator.process_session_command,
+                        session, line)
+                    continue
+                req_timeout = session.counters.get(
+                    'req_timeout', self.emulator.max_req_timeout)
+                prev_time = loop.time()
+                data = await reader.read(self.read_size)
+                if not data:
+                    logging.debug(
+                        "TCP/IP communication terminated by the client %s.",
+                        peer)
+                    break
+                try:
+                    expired = prev_time + float(req_timeout) < loop.time()
+                except (TypeError, ValueError):
+                    expired = False
+                if session.framer.feed(data, expired):
+                    logging.debug(
+                        "'req_timeout' timeout while reading data: %s", data)
+        except ConnectionError:
+            logging.warning("Session terminated by the client %s.", peer)
+        finally:
+            self.sessions.discard(session)
+            session.output.close()
+            await loop.run_in_executor(
+                self.executor, self.close_session, session)
+            writer.close()
+
+    def open_session(self, writer, peer, call_at):
+        with self.emulator.session_lock:
+            return self.emulator.new_session(
+                writer=writer, peer=peer, call_at=call_at)
+
+    def close_session(self, session):
+        with self.emulator.session_lock:
+            self.emulator.close_session(session)
@@ -0,0 +1,399 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+"""
+Benchmark of the request -> response pipeline of the emulator.
+
+    python -m elm_emulator.bench [-t inprocess tcp pty] [-m MIX ...]
+                                 [-n REQUESTS] [--json FILE]
+                                 [--compare FILE]
+
+Each command mix is run in-process (Elm.handle_request() and
+Elm.handle_response()), through the TCP/IP server via loopback and
+through the pseudo-tty; ops/sec, p50/p99 latency and memory allocated per
+request (in-process only) are reported and can be saved as JSON, to be
+compared with the results of another commit through --compare.
+The simulated delays of the emulator (e.g., ATZ) are skipped.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import select
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .elm_emulator import Elm
+from .session_log import FastTime
+
+BENCH_REQUESTS = 5000  # timed requests of each mix and transport
+BENCH_WARMUP = 200  # untimed requests before the measurement
+BENCH_ALLOC_REQUESTS = 500  # requests traced to measure the allocations
+BENCH_NET_PORT = 35199  # loopback TCP/IP port
+BENCH_TIMEOUT = 2  # seconds waiting for the prompt of a response
+BENCH_PROMPT = b'>'
+BENCH_FORMAT_VERSION = 1
+
+TRANSPORTS = ('inprocess', 'tcp', 'pty')
+
+# Command mixes: scenario, setup commands (not timed) and the commands
+# repeated during the measurement
+MIXES = {
+    'at_init': (
+        'car',
+        ['ATE0'],
+        ['ATZ', 'ATE0', 'ATL0', 'ATS0', 'ATH1', 'ATSP0', 'ATDPN', 'ATI',
+         'AT@1', 'ATRV']),
+    'mode01': (
+        'car',
+        ['ATE0', 'ATH1', 'ATSP6', '0100'],
+        ['0100', '0101', '0104', '0105', '010B', '010C', '010D', '010F',
+         '0111', '0120', '0121']),
+    'mode09_vin': (
+        'car',
+        ['ATE0', 'ATH1', 'ATSP6'],
+        ['0900', '0902', '0904', '0906']),
+    'uds_22': (
+        'car',
+        ['ATE0', 'ATH1', 'ATSP6', 'ATSH7E0'],
+        ['22116B', '220200', '227A76', '221093', '221089']),
+    'isotp_multiframe': (
+        'car',
+        ['ATE0', 'ATH1', 'ATS0', 'ATSP6', 'ATSH7E5', 'ATCAF0'],
+        ['100B2EF190313233', '213435363738']),
+}
+
+
+def percentile(sorted_values, pct):
+    """
+    :param sorted_values: sorted list of values
+    :param pct: percentile (0-100)
+    :return: nearest-rank percentile, or None if no values
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(mix, transport, latencies, elapsed, errors, alloc=None):
+    """
+    :param latencies: list of latencies in nanoseconds
+    :param elapsed: seconds of the measurement
+    :param errors: number of requests without a valid response
+    :param alloc: (bytes, blocks) allocated per request, or None
+    :return: dictionary of the results
+    """
+    latencies = sorted(latencies)
+    result = {
+        'mix': mix,
+        'transport': transport,
+        'requests': len(latencies),
+        'errors': errors,
+        'ops_sec': round(len(latencies) / elapsed, 1) if elapsed else None,
+        'p50_us': round(percentile(latencies, 50) / 1000, 2),
+        'p99_us': round(percentile(latencies, 99) / 1000, 2),
+        'alloc_bytes': None,
+        'alloc_blocks': None,
+    }
+    if alloc:
+        result['alloc_bytes'], result['alloc_blocks'] = alloc
+    return result
+
+
+def new_emulator(scenario, **kwargs):
+    emulator = Elm(batch_mode=True, **kwargs)
+    emulator.time = FastTime()
+    emulator.set_sorted_obd_msg(scenario)
+    return emulator
+
+
+def inprocess_request(emulator, cmd):
+    """
+    Process a request like Elm.process_command(), without writing the
+    response.
+    :return: computed response, or None
+    """
+    header, data, resp = emulator.handle_request(cmd)
+    if resp is None:
+        return None
+    return emulator.handle_response(
+        resp, request_header=header, request_data=data)
+
+
+def measure_allocations(emulator, commands, requests):
+    """
+    Trace the memory allocated by the pipeline.
+    :return: (peak bytes allocated per request, net memory blocks retained
+            per request), as averages
+    """
+    tracemalloc.start()
+    try:
+        peak_bytes = 0
+        blocks = sys.getallocatedblocks()
+        for i in range(requests):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            inprocess_request(emulator, commands[i % len(commands)])
+            peak_bytes += tracemalloc.get_traced_memory()[1] - current
+        blocks = sys.getallocatedblocks() - blocks
+    finally:
+        tracemalloc.stop()
+    return (round(peak_bytes / requests, 1), round(blocks / requests, 3))
+
+
+def run_inprocess(mix, requests, warmup):
+    scenario, setup, commands = MIXES[mix]
+    emulator = new_emulator(scenario)
+    emulator.load_plugins()
+    for cmd in setup:
+        inprocess_request(emulator, cmd)
+    for i in range(warmup):
+        inprocess_request(emulator, commands[i % len(commands)])
+    latencies = []
+    clock = time.perf_counter_ns
+    start = clock()
+    for i in range(requests):
+        t = clock()
+        inprocess_request(emulator, commands[i % len(commands)])
+        latencies.append(clock() - t)
+    elapsed = (clock() - start) / 1e9
+    alloc = measure_allocations(
+        emulator, commands, min(requests, BENCH_ALLOC_REQUESTS))
+    emulator.terminate()
+    return summarize(mix, 'inprocess', latencies, elapsed, 0, alloc)
+
+
+class WireClient:
+    """
+    Client application of the emulator: send a request and read the
+    response until the prompt.
+    """
+
+    def __init__(self, write, read):
+        """
+        :param write: function writing bytes to the emulator
+        :param read: function reading the available bytes (b'' = timeout)
+        """
+        self.write = write
+        self.read = read
+
+    def request(self, cmd):
+        """
+        :param cmd: request
+        :return: True if the response ends with the prompt
+        """
+        self.write(cmd.encode() + b'\r')
+        deadline = time.monotonic() + BENCH_TIMEOUT
+        while time.monotonic() < deadline:
+            data = self.read()
+            if data and data.rstrip().endswith(BENCH_PROMPT):
+                return True
+        return False
+
+
+def tcp_client(emulator, port):
+    """
+    Connect to the TCP/IP server of the emulator, waiting for it to listen.
+    :return: (WireClient, socket)
+    """
+    deadline = time.monotonic() + BENCH_TIMEOUT
+    while True:
+        try:
+            sock = socket.create_connection(('127.0.0.1', port), timeout=1)
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.settimeout(BENCH_TIMEOUT)
+
+    def read():
+        try:
+            return sock.recv(4096)
+        except socket.timeout:
+            return b''
+    return WireClient(sock.sendall, read), sock
+
+
+def pty_client(emulator):
+    """
+    Use the slave side of the pty of the emulator.
+    :return: (WireClient, None)
+    """
+    fd = emulator.slave_fd
+
+    def write(data):
+        os.write(fd, data)
+
+    def read():
+        if not select.select([fd], [], [], BENCH_TIMEOUT)[0]:
+            return b''
+        return os.read(fd, 4096)
+    return WireClient(write, read), None
+
+
+def run_wire(mix, transport, requests, warmup, port):
+    scenario, setup, commands = MIXES[mix]
+    if transport == 'tcp':
+        emulator = new_emulator(scenario, net_port=port)
+    else:
+        emulator = new_emulator(scenario)
+        if not emulator.get_pty():
+            raise OSError('Pseudo-tty not available')
+    sock = None
+    with emulator:
+        try:
+            if transport == 'tcp':
+                client, sock = tcp_client(emulator, port)
+            else:
+                client, sock = pty_client(emulator)
+            errors = 0
+            for cmd in setup:
+                client.request(cmd)
+            for i in range(warmup):
+                client.request(commands[i % len(commands)])
+            latencies = []
+            clock = time.perf_counter_ns
+            start = clock()
+            for i in range(requests):
+                t = clock()
+                if not client.request(commands[i % len(commands)]):
+                    errors += 1
+                latencies.append(clock() - t)
+            elapsed = (clock() - start) / 1e9
+        finally:
+            if sock:
+                sock.close()
+    return summarize(mix, transport, latencies, elapsed, errors)
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(mixes=tuple(MIXES), transports=TRANSPORTS, requests=BENCH_REQUESTS,
+        warmup=BENCH_WARMUP, port=BENCH_NET_PORT):
+    """
+    Run the benchmark.
+    :param mixes: names of the command mixes (ref. MIXES)
+    :param transports: names of the transports (ref. TRANSPORTS)
+    :param requests: timed requests of each mix and transport
+    :param warmup: untimed requests before the measurement
+    :param port: loopback TCP/IP port
+    :return: dictionary with the environment and the list of results
+    """
+    results = []
+    for transport in transports:
+        for mix in mixes:
+            try:
+                if transport == 'inprocess':
+                    result = run_inprocess(mix, requests, warmup)
+                else:
+                    result = run_wire(mix, transport, requests, warmup, port)
+            except OSError as e:
+                logging.critical("Cannot run %s over %s: %s",
+                                 mix, transport, e)
+                continue
+            print_result(result)
+            results.append(result)
+    return {
+        'version': BENCH_FORMAT_VERSION,
+        'revision': git_revision(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'requests': requests,
+        'results': results,
+    }
+
+
+def print_result(result, baseline=None):
+    line = ('%-17s %-9s %10s ops/s  p50 %9s us  p99 %9s us' % (
+        result['mix'], result['transport'], result['ops_sec'],
+        result['p50_us'], result['p99_us']))
+    if result['alloc_bytes'] is not None:
+        line += '  %8s B/req' % result['alloc_bytes']
+    if result['errors']:
+        line += '  %s errors' % result['errors']
+    if baseline and baseline.get('ops_sec') and result['ops_sec']:
+        line += '  %+.1f%%' % (
+            (result['ops_sec'] / baseline['ops_sec'] - 1) * 100)
+    print(line)
+
+
+def compare(report, path):
+    """
+    Print the results with the ops/sec change from a saved report.
+    :param report: results of run()
+    :param path: JSON file saved with --json
+    """
+    with open(path) as f:
+        saved = json.load(f)
+    baseline = {(r['mix'], r['transport']): r for r in saved['results']}
+    print('\nCompared with %s (revision %s):' % (path, saved.get('revision')))
+    for result in report['results']:
+        print_result(result, baseline.get(
+            (result['mix'], result['transport'])))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m elm_emulator.bench',
+        description='Benchmark of the request -> response pipeline of the '
+                    'ELM327 emulator.')
+    parser.add_argument(
+        '-m', '--mix', nargs='+', choices=list(MIXES), default=list(MIXES),
+        help='command mixes (default: all)')
+    parser.add_argument(
+        '-t', '--transport', nargs='+', choices=TRANSPORTS,
+        default=list(TRANSPORTS), help='transports (default: all)')
+    parser.add_argument(
+        '-n', '--requests', type=int, default=BENCH_REQUESTS,
+        help='timed requests of each mix and transport (default: %(default)s)')
+    parser.add_argument(
+        '-w', '--warmup', type=int, default=BENCH_WARMUP,
+        help='untimed requests before the measurement '
+             '(default: %(default)s)')
+    parser.add_argument(
+        '-p', '--port', type=int, default=BENCH_NET_PORT,
+        help='loopback TCP/IP port (default: %(default)s)')
+    parser.add_argument(
+        '--json', metavar='FILE', help='save the results to a JSON file')
+    parser.add_argument(
+        '--compare', metavar='FILE',
+        help='compare the results with a JSON file saved with --json')
+    parser.add_argument(
+        '--log-level', default='CRITICAL',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+        help='logging level of the emulator (default: %(default)s)')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=getattr(logging, args.log_level))
+
+    report = run(args.mix, args.transport, args.requests, args.warmup,
+                 args.port)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == '__main__':
+    main()
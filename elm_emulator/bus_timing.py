@@ -0,0 +1,277 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import collections
+import re
+import threading
+import time
+
+# Inter-byte pacing (UDS P1) is performed by writing chunks of bytes, each
+# one lasting about PACING_RESOLUTION seconds at the inter-byte time
+PACING_RESOLUTION = 0.01  # seconds
+
+# Bus of each ELM327 protocol (ATSP): name, bit rate, CAN identifier bits
+# (None for the serial buses)
+PROTOCOL_BUSES = {
+    '1': ('SAE J1850 PWM', 41600, None),
+    '2': ('SAE J1850 VPW', 10400, None),
+    '3': ('ISO 9141-2', 10400, None),
+    '4': ('ISO 14230-4 KWP (5 baud init)', 10400, None),
+    '5': ('ISO 14230-4 KWP (fast init)', 10400, None),
+    '6': ('ISO 15765-4 CAN (11 bit ID, 500 kbaud)', 500000, 11),
+    '7': ('ISO 15765-4 CAN (29 bit ID, 500 kbaud)', 500000, 29),
+    '8': ('ISO 15765-4 CAN (11 bit ID, 250 kbaud)', 250000, 11),
+    '9': ('ISO 15765-4 CAN (29 bit ID, 250 kbaud)', 250000, 29),
+    'A': ('SAE J1939 CAN (29 bit ID, 250 kbaud)', 250000, 29),
+    'B': ('USER1 CAN (11 bit ID, 125 kbaud)', 125000, 11),
+    'C': ('USER2 CAN (11 bit ID, 50 kbaud)', 50000, 11),
+}
+DEFAULT_PROTOCOL = '6'  # found by the automatic search (ATSP0, ref. ATDP)
+ISO_BAUD_RATES = {'10': 10400, '48': 4800, '96': 9600}  # ATIB, ISO 9141/KWP
+# Bits of a CAN frame besides the data (SOF, identifier, control, CRC, ACK,
+# EOF, interframe space; bit stuffing is not considered); the frames have
+# 8 data bytes, as ISO 15765-4 requires padding
+CAN_FRAME_BITS = {11: 47, 29: 67}
+CAN_DATA_BITS = 64
+SERIAL_FRAME_BYTES = 4  # bytes of a J1850/K-line frame besides the data
+SERIAL_BYTE_BITS = 10  # start, 8 data and stop bits (UART and K-line)
+# Line of the output including a bus frame: hex bytes, optionally with the
+# header and the frame number of the ISO-TP frames shown without headers
+FRAME_LINE = re.compile(rb'(?:[0-9A-F]: )?([0-9A-F ]{4,})')
+
+
+def paced_chunks(data, interbyte):
+    """
+    Split data into chunks paced by the inter-byte time.
+    :param data: bytes-like object
+    :param interbyte: seconds of the transmission of a byte
+    :return: iterator of (chunk, seconds of the transmission of the chunk)
+    """
+    size = max(1, int(PACING_RESOLUTION / interbyte))
+    view = memoryview(data)
+    for offset in range(0, len(view), size):
+        chunk = view[offset:offset + size]
+        yield chunk, len(chunk) * interbyte
+
+
+class PacedOutput:
+    """
+    Output of a client session written at the emulated bus times by a
+    scheduler (e.g., the timers of an asyncio loop), so that the thread
+    processing the requests never sleeps.
+    While a request of the session is processed, it replaces the time
+    module of the emulator (ref. Elm.time): sleep() does not block but
+    delays the following output (UDS P2, ISO-TP flow control wait, <exec>
+    delays), and the returned times include the pending delay. The output
+    data are queued with their due time and written in chunks paced by
+    the inter-byte time (UDS P1). The other functions are the ones of the
+    time module (e.g., strftime() called by the scenario snippets).
+    """
+
+    def __init__(self, write, call_at, clock=time.monotonic):
+        """
+        :param write: function writing bytes to the client, invoked by the
+                scheduler
+        :param call_at: thread-safe function scheduling a call at a time
+                of clock: call_at(when, callback)
+        :param clock: monotonic clock of the scheduler
+        """
+        self.writer = write
+        self.call_at = call_at
+        self.clock = clock
+        self.due = 0.0  # time when the bus is free
+        self.queue = collections.deque()  # (due time, data)
+        self.scheduled = False  # a drain() is scheduled
+        self.lock = threading.Lock()
+
+    def lag(self):
+        """
+        :return: seconds of the output already queued or delayed
+        """
+        return max(0.0, self.due - self.clock())
+
+    def sleep(self, seconds):
+        """
+        Delay the following output, without blocking.
+        :param seconds: delay
+        """
+        if seconds > 0:
+            with self.lock:
+                self.due = max(self.due, self.clock()) + seconds
+
+    def time(self):
+        return time.time() + self.lag()
+
+    def monotonic(self):
+        return time.monotonic() + self.lag()
+
+    def perf_counter(self):
+        return time.perf_counter() + self.lag()
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    def write(self, data, interbyte=0):
+        """
+        Queue data to be written when the bus is free.
+        :param data: bytes-like object
+        :param interbyte: seconds of the transmission of a byte (0 = no
+                pacing)
+        """
+        if not data:
+            return
+        with self.lock:
+            due = max(self.due, self.clock())
+            if interbyte > 0:
+                for chunk, duration in paced_chunks(data, interbyte):
+                    self.queue.append((due, chunk))
+                    due += duration
+            else:
+                self.queue.append((due, data))
+            self.due = due
+            if not self.scheduled:
+                self.scheduled = True
+                self.call_at(self.queue[0][0], self.drain)
+
+    def drain(self):
+        """
+        Write the queued data which are due (invoked by the scheduler at
+        the due time of the first item).
+        """
+        with self.lock:
+            if not self.queue:
+                self.scheduled = False
+                return
+            self.writer(self.queue.popleft()[1])
+            now = self.clock()
+            while self.queue and self.queue[0][0] <= now:
+                self.writer(self.queue.popleft()[1])
+            if self.queue:
+                self.call_at(self.queue[0][0], self.drain)
+            else:
+                self.scheduled = False
+
+    def close(self):
+        """
+        Discard the queued data.
+        """
+        with self.lock:
+            self.queue.clear()
+
+
+class TokenBucket:
+    """
+    Token bucket of a link, whose tokens are the bits transmitted at the
+    bit rate. A transmission takes its bits from the bucket, which can go
+    negative: the deficit is the time the transmission still needs.
+    """
+    __slots__ = ('rate', 'burst', 'tokens', 'last')
+
+    def __init__(self, rate, burst=0):
+        """
+        :param rate: bits per second
+        :param burst: bits sent with no delay after an idle time (0 = each
+                transmission lasts its full time)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = None
+
+    def reserve(self, bits, now):
+        """
+        Reserve a transmission.
+        :param bits: bits to be transmitted
+        :param now: current time (seconds of a monotonic clock)
+        :return: seconds until the transmission is completed
+        """
+        if self.last is not None:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= bits
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+def frame_sizes(data):
+    """
+    :param data: bytes written by the ELM327 (without the echo)
+    :return: iterator of the number of bytes shown in each line including
+            a bus frame
+    """
+    for line in data.split(b'\r'):
+        match = FRAME_LINE.fullmatch(line.strip())
+        if match:
+            yield len(match.group(1).replace(b' ', b'')) // 2
+
+
+def protocol_bus(proto, iso_baud=None):
+    """
+    :param proto: ELM327 protocol (ATSP value; None or '0' = automatic)
+    :param iso_baud: ATIB value
+    :return: (bit rate, CAN identifier bits or None) of the bus
+    """
+    _, rate, can_id_bits = PROTOCOL_BUSES.get(
+        proto or DEFAULT_PROTOCOL, PROTOCOL_BUSES[DEFAULT_PROTOCOL])
+    if proto in ('3', '4') and iso_baud in ISO_BAUD_RATES:
+        rate = ISO_BAUD_RATES[iso_baud]
+    return rate, can_id_bits
+
+
+class LinkThroughput:
+    """
+    Throughput model of the links of the ELM327: the UART towards the
+    application and the vehicle bus of the selected protocol (ATSP). The
+    output of each client session is paced by a token bucket for each
+    link, and the delay of a response is the time needed by the slower
+    one, as the two transmissions overlap.
+    """
+
+    def __init__(self, uart_baudrate, burst=0):
+        """
+        :param uart_baudrate: baud rate of the UART
+        :param burst: bits of each link sent with no delay after an idle
+                time (ref. TokenBucket)
+        """
+        self.uart_baudrate = uart_baudrate
+        self.burst = burst
+        self.links = {}  # session id -> (UART bucket, bus bucket, bus)
+
+    def delay(self, session_id, data, proto, iso_baud, now):
+        """
+        Reserve the transmission of an output.
+        :param session_id: id of the client session
+        :param data: bytes written to the application
+        :param proto: ELM327 protocol (ATSP value)
+        :param iso_baud: ATIB value
+        :param now: current time (seconds of the monotonic clock used by the
+                caller to wait)
+        :return: seconds to wait before writing the data
+        """
+        bus = protocol_bus(proto, iso_baud)
+        uart, bus_bucket, link_bus = self.links.get(
+            session_id, (None, None, None))
+        if uart is None:
+            uart = TokenBucket(self.uart_baudrate, self.burst)
+        if link_bus != bus:  # protocol changed: new bus
+            bus_bucket = TokenBucket(bus[0], self.burst)
+        self.links[session_id] = uart, bus_bucket, bus
+        rate, can_id_bits = bus
+        bits = 0
+        for size in frame_sizes(data):
+            if can_id_bits:
+                bits += CAN_FRAME_BITS[can_id_bits] + CAN_DATA_BITS
+            else:
+                bits += (size + SERIAL_FRAME_BYTES) * SERIAL_BYTE_BITS
+        return max(uart.reserve(len(data) * SERIAL_BYTE_BITS, now),
+                   bus_bucket.reserve(bits, now))
+
+    def discard(self, session_id):
+        """
+        :param session_id: id of a closed client session
+        """
+        self.links.pop(session_id, None)
@@ -7,18 +7,22 @@ from tkinter import *
 from tkinter import ttk, messagebox
 
 from elm_emulator.animation_curve_editor import AnimationCurveEditor
-from elm_emulator.car_emulator import Car
+
+GUI_REFRESH_INTERVAL = 50  # ms - refresh of the car state labels
 
 
 class CarEmulatorGUI:
     def __init__(self, emulator):
         self.emulator = emulator
-        self.car = Car()
+        self.car = emulator.car  # simulated by emulator.simulation
+        self.simulation = None
         self.lock = False
         self.presets = [x for x in os.listdir(
             os.path.curdir) if x.endswith("json")]
 
     def start(self):
+        # the car physics runs in the simulation thread, not in the Tk loop
+        self.simulation = self.emulator.start_simulation()
         root = Tk()
         root.title("Engine Control")
         
@@ -61,7 +65,8 @@ class CarEmulatorGUI:
                 throttle_value = throttle_slider.get()
                 brake_value = brake_slider.get()
                 # pass values in range [0, 1]
-                self.car.update(throttle_value / 100, brake_value / 100)
+                self.simulation.set_inputs(
+                    throttle_value / 100, brake_value / 100)
                 throttle_label.config(text=f"Throttle\n{throttle_value:.0f} %")
                 brake_label.config(text=f"Brake\n{brake_value:.0f} %")
                 anim_scale_value = anim_speed_slider.get()
@@ -187,6 +192,7 @@ class CarEmulatorGUI:
         def animate_curve():
             if len(animation_curve_gui.curve.points) > 1:
                 self.lock = True
+                self.simulation.paused = True
                 throttle_slider.config(state=DISABLED)
                 brake_slider.config(state=DISABLED)
                 duration = animation_curve_gui.curve.duration() / anim_speed_slider.get()
@@ -201,23 +207,26 @@ class CarEmulatorGUI:
                 y = animation_curve_gui.curve.evaluate(
                     t * animation_curve_gui.curve.duration())
 
-                self.car.speed = y
+                with self.simulation.lock:
+                    self.car.speed = y
+                    self.emulator.database["speed"] = y
+                    # Calculate and update the engine temperature based on the speed
+                    # 70°C at speed 0, increases by 0.1°C per km/h
+                    self.car.engine_temp = 70 + (self.car.speed * 0.1)
+                    self.emulator.database["engine_temp"] = self.car.engine_temp
                 speed_label.config(text=f"Current Speed: {y:.1f} km/h")
-                self.emulator.database["speed"] = y
-                # Calculate and update the engine temperature based on the speed
-                # 70°C at speed 0, increases by 0.1°C per km/h
-                self.car.engine_temp = 70 + (self.car.speed * 0.1)
                 temp_label.config(
                     text=f"Engine Temperature: {self.car.engine_temp:.1f} °C")
-                self.emulator.database["engine_temp"] = self.car.engine_temp
                 if t < 1.0:
                     root.after(10, animate, duration, start_time)
                 else:
                     self.lock = False
+                    self.simulation.paused = False
                     throttle_slider.config(state=NORMAL)
                     brake_slider.config(state=NORMAL)
             else:
                 self.lock = False
+                self.simulation.paused = False
                 throttle_slider.config(state=NORMAL)
                 brake_slider.config(state=NORMAL)
 
@@ -240,24 +249,26 @@ class CarEmulatorGUI:
                         padx=2, pady=2, sticky=(N, S, E, W))
         animation_curve_gui = AnimationCurveEditor(graphframe)
 
-        def update_values():  # updates rpm, speed,gear, gear position and engine temperature
+        def update_values():  # shows rpm, speed,gear, gear position and engine temperature
             if not self.lock:
-                self.car.update(self.car.throttle_position,
-                                self.car.brake_position)
-                rpm_label.config(text=f"Current RPM: {self.car.rpm:.0f}")
-                self.emulator.database["rpm"] = self.car.rpm
+                # the car state is updated by the simulation thread
+                with self.simulation.lock:
+                    rpm = self.car.rpm
+                    speed = self.car.speed
+                    engine_temp = self.car.engine_temp
+                    gear = self.car.gear
+                    gear_position = self.car.gear_position
+                rpm_label.config(text=f"Current RPM: {rpm:.0f}")
                 speed_label.config(
-                    text=f"Current Speed: {self.car.speed:.1f} km/h")
-                self.emulator.database["speed"] = self.car.speed
+                    text=f"Current Speed: {speed:.1f} km/h")
                 temp_label.config(
-                    text=f"Engine Temperature: {self.car.engine_temp:.1f} °C")
-                self.emulator.database["engine_temp"] = self.car.engine_temp
+                    text=f"Engine Temperature: {engine_temp:.1f} °C")
                 
                 # Update gear information
-                gear_label.config(text=f"Gear: {self.car.gear}")
-                gear_position_label.config(text=f"Gear Position: {self.car.gear_position}")
+                gear_label.config(text=f"Gear: {gear}")
+                gear_position_label.config(text=f"Gear Position: {gear_position}")
 
-            root.after(10, update_values)
+            root.after(GUI_REFRESH_INTERVAL, update_values)
 
         # fill extra space, if window is resized
         mainframe.columnconfigure([0, 1, 2, 3], weight=1)
@@ -265,4 +276,7 @@ class CarEmulatorGUI:
         mainframe.rowconfigure([0, 4, 5, 6, 7, 9], weight=1)
 
         update_values()
-        root.mainloop()
+        try:
+            root.mainloop()
+        finally:
+            self.emulator.stop_simulation()
@@ -0,0 +1,318 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from .car_emulator import Car
+from .simulation import CarSimulation
+
+
+class CarFleet:
+    """
+    Physics of N cars stored in NumPy arrays and advanced all together by
+    update(), with the same constants and formulas of Car.
+    Each slot can be the data source of a separate Elm instance (ref.
+    attach()). A single CarSimulation drives the whole fleet, as update()
+    has the same signature of Car.update(): Elm.start_simulation() of an
+    attached endpoint returns a FleetSimulation of its slot, which shares
+    the simulation of the fleet (ref. simulate()), so N endpoints are
+    stepped together by one thread.
+    """
+
+    def __init__(self, size):
+        """
+        :param size: number of cars
+        """
+        self.size = size
+        self.rpm = np.full(size, Car.RPM[0], dtype=float)
+        self.speed = np.full(size, Car.SPEED[0], dtype=float)
+        self.throttle_position = np.zeros(size)
+        self.brake_position = np.zeros(size)
+        self.gear = np.ones(size, dtype=int)
+        self.gear_position = np.full(size, "N", dtype='U1')
+        self.engine_temp = np.full(size, 70, dtype=float)
+        self.fuel_level = np.full(size, Car.FUEL_TANK_CAPACITY, dtype=float)
+        self.fuel_consumption_rate = np.full(size, 0.002)
+        self.gear_ratios = np.array(Car.GEAR_RATIOS)
+        self.simulation = None  # CarSimulation shared by the slots
+        self.drivers = set()  # running FleetSimulation of the slots
+
+    def __len__(self):
+        return self.size
+
+    def update(self, throttle_position=None, brake_position=None):
+        """
+        Advance all the cars of one step (ref. Car.update()).
+        :param throttle_position: array (or scalar) of throttle positions;
+                None = keep the current ones
+        :param brake_position: array (or scalar) of brake positions;
+                None = keep the current ones
+        """
+        if throttle_position is not None:
+            self.throttle_position[:] = throttle_position
+        if brake_position is not None:
+            self.brake_position[:] = brake_position
+        self.update_rpm()
+        self.update_speed()
+        self.update_engine_temp()
+        self.update_fuel_consumption()
+
+    def update_rpm(self):
+        max_torque = 400  # Max torque in Nm
+        torque = max_torque * np.sin(
+            np.pi * (self.rpm - Car.RPM[0]) / (Car.RPM[1] - Car.RPM[0]))
+        self.rpm += (self.throttle_position * torque) / (
+            self.gear_ratios[self.gear - 1] * Car.FINAL_DRIVE_RATIO *
+            Car.WHEEL_RADIUS)
+        np.clip(self.rpm, Car.RPM[0], Car.RPM[1], out=self.rpm)
+
+    def update_speed(self):
+        max_power = 200  # Max power in kW
+        power = max_power * (self.rpm / Car.RPM[1]) * self.throttle_position
+        force = (power * 1000) / (self.speed / 3.6 + 0.1)  # Force in N
+        drag_force = 0.5 * Car.DRAG_COEFFICIENT * Car.FRONTAL_AREA * \
+            Car.AIR_DENSITY * (self.speed / 3.6) ** 2
+        brake_force = self.brake_position * Car.BRAKE_FORCE
+        net_force = force - drag_force - brake_force
+        acceleration = net_force / Car.CAR_MASS
+        self.speed += acceleration * 3.6  # Convert m/s^2 to km/h
+        np.clip(self.speed, Car.SPEED[0], Car.SPEED[1], out=self.speed)
+        self.update_gear()
+
+    def update_gear(self):
+        up = (self.speed > 20) & (self.gear < 6)
+        down = ~up & (self.speed < 10) & (self.gear > 1)
+        self.gear += up
+        self.gear -= down
+
+    def update_engine_temp(self):
+        throttle = self.throttle_position
+        brake = self.brake_position
+        self.engine_temp += np.where(throttle > 0, throttle * 0.1, 0)
+        self.engine_temp -= np.where(brake > 0, brake * 0.05, 0)
+        np.clip(self.engine_temp, 40, 120, out=self.engine_temp)
+
+    def update_fuel_consumption(self):
+        self.fuel_consumption_rate = (
+            Car.BASE_FUEL_CONSUMPTION_RATE *
+            (self.rpm / 1000) *
+            (self.throttle_position / 100) *
+            (1 / (self.gear + 1))
+        )
+        self.fuel_level -= self.fuel_consumption_rate
+        np.maximum(self.fuel_level, 0, out=self.fuel_level)
+
+    def car(self, slot):
+        """
+        Return a Car-like view of a slot.
+        :param slot: index of the car
+        :return: FleetCar
+        """
+        return FleetCar(self, slot)
+
+    def simulate(self, slot, **kwargs):
+        """
+        Start the simulation of the fleet, if not running, and return the
+        driver of a slot; the simulation is stopped with the last driver.
+        :param slot: index of the car
+        :param kwargs: arguments of CarSimulation (tick_rate, policy,
+                max_catch_up), used when the simulation is started
+        :return: FleetSimulation
+        """
+        driver = FleetSimulation(self, slot)
+        if not (self.simulation and self.simulation.is_running()):
+            self.simulation = CarSimulation(self, **kwargs).start()
+        self.drivers.add(driver)
+        return driver
+
+    def release(self, driver):
+        """
+        Stop a driver of a slot (ref. FleetSimulation.stop()).
+        :param driver: FleetSimulation
+        """
+        self.drivers.discard(driver)
+        if not self.drivers and self.simulation:
+            self.simulation.stop()
+
+    def attach(self, emulator, slot):
+        """
+        Use a slot as the car and database of an Elm instance.
+        :param emulator: Elm instance
+        :param slot: index of the car
+        :return: FleetCar
+        """
+        car = self.car(slot)
+        emulator.car = car
+        emulator.database = FleetDatabase(car)
+        return car
+
+
+def _slot_property(name):
+    def getter(self):
+        return getattr(self.fleet, name)[self.slot].item()
+
+    def setter(self, value):
+        getattr(self.fleet, name)[self.slot] = value
+
+    return property(getter, setter)
+
+
+class FleetCar:
+    """
+    Car-like view of a slot of a CarFleet, used by Elm as self.car.
+    """
+    RPM = Car.RPM
+    SPEED = Car.SPEED
+    FUEL_TANK_CAPACITY = Car.FUEL_TANK_CAPACITY
+
+    rpm = _slot_property('rpm')
+    speed = _slot_property('speed')
+    throttle_position = _slot_property('throttle_position')
+    brake_position = _slot_property('brake_position')
+    gear = _slot_property('gear')
+    gear_position = _slot_property('gear_position')
+    engine_temp = _slot_property('engine_temp')
+    fuel_level = _slot_property('fuel_level')
+    fuel_consumption_rate = _slot_property('fuel_consumption_rate')
+
+    def __init__(self, fleet, slot):
+        if not 0 <= slot < len(fleet):
+            raise IndexError('Invalid fleet slot %s' % repr(slot))
+        self.fleet = fleet
+        self.slot = slot
+        self.database = FleetCarDatabase(self)
+
+    def get_fuel_level_percentage(self):
+        return (self.fuel_level / self.FUEL_TANK_CAPACITY) * 100
+
+    def get_engine_temp(self):
+        return self.engine_temp
+
+    def get_gear_position(self):
+        return self.gear_position
+
+    def get_gear(self):
+        return self.gear
+
+    def __repr__(self):
+        return '<FleetCar %s>' % self.slot
+
+
+class FleetSimulation:
+    """
+    Driver of a slot of a CarFleet, with the interface of CarSimulation used
+    by the GUI: the pedal inputs are set in the slot, while the steps of all
+    the cars are run by the simulation of the fleet (ref.
+    CarFleet.simulate()); pausing it pauses the whole fleet.
+    """
+
+    def __init__(self, fleet, slot):
+        if not 0 <= slot < len(fleet):
+            raise IndexError('Invalid fleet slot %s' % repr(slot))
+        self.fleet = fleet
+        self.slot = slot
+
+    @property
+    def lock(self):
+        return self.fleet.simulation.lock
+
+    @property
+    def paused(self):
+        return self.fleet.simulation.paused
+
+    @paused.setter
+    def paused(self, value):
+        self.fleet.simulation.paused = value
+
+    @property
+    def ticks(self):
+        return self.fleet.simulation.ticks
+
+    def set_inputs(self, throttle_position, brake_position):
+        """
+        Set the pedal inputs of the slot (ref. CarSimulation.set_inputs()).
+        """
+        with self.lock:
+            self.fleet.throttle_position[self.slot] = throttle_position
+            self.fleet.brake_position[self.slot] = brake_position
+
+    def stop(self):
+        self.fleet.release(self)
+
+    def is_running(self):
+        return (self in self.fleet.drivers and
+                self.fleet.simulation.is_running())
+
+    def __repr__(self):
+        return '<FleetSimulation %s>' % self.slot
+
+
+class FleetDatabase(MutableMapping):
+    """
+    Mapping of a FleetCar state with the keys of Elm.database; other keys
+    are stored in a dictionary of the slot.
+    """
+    KEYS = {
+        "rpm": lambda car: car.rpm,
+        "speed": lambda car: car.speed,
+        "engine_temp": lambda car: car.engine_temp,
+        "fuel_level": lambda car: car.get_fuel_level_percentage(),
+        "gear": lambda car: car.gear,
+        "gear_position": lambda car: car.gear_position,
+    }
+
+    def __init__(self, car):
+        self.car = car
+        self.extra = {}
+
+    def __getitem__(self, key):
+        if key in self.KEYS:
+            return self.KEYS[key](self.car)
+        return self.extra[key]
+
+    def __setitem__(self, key, value):
+        if key == "fuel_level":
+            self.car.fuel_level = value * self.car.FUEL_TANK_CAPACITY / 100
+        elif key in self.KEYS:
+            setattr(self.car, key, value)
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self.KEYS:
+            raise KeyError('Cannot delete the car state %s' % repr(key))
+        del self.extra[key]
+
+    def __iter__(self):
+        yield from self.KEYS
+        yield from self.extra
+
+    def __len__(self):
+        return len(self.KEYS) + len(self.extra)
+
+
+class FleetCarDatabase(FleetDatabase):
+    """
+    Mapping of a FleetCar state with the keys of Car.database.
+    """
+    KEYS = {
+        "rpm": lambda car: car.rpm,
+        "speed": lambda car: car.speed,
+        "gear": lambda car: car.gear,
+        "engine_temp": lambda car: car.engine_temp,
+        "fuel_level": lambda car: car.fuel_level,
+        "fuel_consumption_rate": lambda car: car.fuel_consumption_rate,
+        "gear_position": lambda car: car.gear_position,
+    }
+
+    def __setitem__(self, key, value):
+        if key in self.KEYS:
+            setattr(self.car, key, value)
+        else:
+            self.extra[key] = value
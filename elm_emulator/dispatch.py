@@ -0,0 +1,230 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import logging
+import re
+
+from .expressions import compile_snippet
+from .stats import pid_slot
+from .response_template import compile_response
+
+# Characters which end the literal prefix of a 'Request' regular expression
+REGEX_SPECIAL_CHARS = set('.^$*+?{}[]\\|()')
+# Quantifiers which make the preceding character optional
+REGEX_OPTIONAL_QUANTIFIERS = set('?*{')
+MAX_CACHED_COMMANDS = 4096
+
+
+def literal_prefix(pattern):
+    """
+    Return the literal prefix of a regular expression used with re.match(),
+    i.e., the string that any matching request must start with.
+    :param pattern: regular expression string (e.g., '^010C[0123456]?$')
+    :return: literal prefix (e.g., '010C'); empty string if no prefix can be
+            safely computed (e.g., alternations).
+    """
+    if '|' in pattern:
+        return ''
+    i = 1 if pattern.startswith('^') else 0
+    prefix = ''
+    while i < len(pattern) and pattern[i] not in REGEX_SPECIAL_CHARS:
+        prefix += pattern[i]
+        i += 1
+    if (prefix and i < len(pattern) and
+            pattern[i] in REGEX_OPTIONAL_QUANTIFIERS):
+        prefix = prefix[:-1]  # the last char might not be present
+    return prefix
+
+
+class DispatchEntry:
+    """
+    Element of the dispatch index, related to a single PID of sortedOBDMsg
+    """
+    __slots__ = ('slot', 'pid', 'val', 'uc_val', 'pattern', '_regex',
+                 'prefix', 'exec_snippet', 'log_snippet', 'counter_slot')
+
+    def __init__(self, slot, pid, val, regex, prefix, snippets=None):
+        """
+        :param slot: position in sortedOBDMsg
+        :param pid: PID label
+        :param val: dictionary element of the PID
+        :param regex: compiled 'Request' regular expression, or its string
+                (compiled on first use)
+        :param prefix: literal prefix of the 'Request' expression
+        :param snippets: precompiled (exec_snippet, log_snippet), e.g. read
+                from the scenario cache; None = compile them together with
+                the responses
+        """
+        self.slot = slot  # position in sortedOBDMsg (priority order)
+        self.pid = pid  # PID label
+        # slot of the request counter of the PID (ref. PidCounters)
+        self.counter_slot = pid_slot(pid if pid else 'UNKNOWN')
+        self.val = val  # original dictionary element
+        self.uc_val = {k.upper(): v for k, v in val.items()}  # uppercase keys
+        if isinstance(regex, str):
+            self.pattern = regex
+            self._regex = None
+        else:
+            self.pattern = regex.pattern
+            self._regex = regex
+        self.prefix = prefix  # literal prefix of the 'Request' expression
+        if snippets is not None:
+            self.exec_snippet, self.log_snippet = snippets
+            return
+        uc_val = self.uc_val
+        # compiled 'Exec' code (None if missing or invalid)
+        self.exec_snippet = None
+        if 'EXEC' in uc_val:
+            self.exec_snippet = compile_snippet(
+                uc_val['EXEC'], filename='<%s Exec>' % pid)
+        # compiled 'Info', 'Warning' or 'Log' logging call
+        self.log_snippet = None
+        log_string = log_call(uc_val)
+        if log_string:
+            self.log_snippet = compile_snippet(
+                log_string, 'eval', filename='<%s Log>' % pid)
+        # parse the XML responses (and their Python code) in advance
+        for response in responses(uc_val):
+            compile_response(response)
+
+    @property
+    def regex(self):
+        """
+        Compiled 'Request' regular expression
+        """
+        if self._regex is None:
+            self._regex = re.compile(self.pattern)
+        return self._regex
+
+
+def log_call(uc_val):
+    """
+    :param uc_val: PID dictionary with uppercase keys
+    :return: logging call of the 'Info', 'Warning' or 'Log' attribute
+            ("" if missing)
+    """
+    log_string = ""
+    if 'INFO' in uc_val:
+        log_string = "logging.info(%s)" % uc_val['INFO']
+    if 'WARNING' in uc_val:
+        log_string = "logging.warning(%s)" % uc_val['WARNING']
+    if 'LOG' in uc_val:
+        log_string = "logging.debug(%s)" % uc_val['LOG']
+    return log_string
+
+
+def responses(uc_val):
+    """
+    :param uc_val: PID dictionary with uppercase keys
+    :return: list of the XML response strings of the 'Response' attribute
+    """
+    value = uc_val.get('RESPONSE')
+    if isinstance(value, str):
+        return [value]
+    return [r for r in value or [] if isinstance(r, str)]
+
+
+def request_pattern(val):
+    """
+    :param val: PID dictionary
+    :return: 'Request' regular expression string, or None if missing
+    """
+    request = None
+    for k, v in val.items():
+        if k.upper() == 'REQUEST':
+            request = v
+    return request
+
+
+class DispatchIndex:
+    """
+    Precompiled index of sortedOBDMsg, returning the PIDs whose 'Request'
+    regular expression matches a command, in the same 'Priority' order
+    used by sortedOBDMsg.
+    PIDs are bucketed by the literal prefix of their 'Request' expression;
+    expressions without a literal prefix are checked through a combined
+    alternation regex before being tested one by one. Results are cached
+    per command, so that repeated PIDs are resolved with a dict lookup.
+    """
+
+    def __init__(self, sorted_obd_msg, compiled=None):
+        """
+        :param sorted_obd_msg: sortedOBDMsg list of (PID, dictionary)
+        :param compiled: list with an element for each item of
+                sorted_obd_msg, i.e., None for items without valid 'Request'
+                or the tuple (prefix, exec_snippet, log_snippet) read from
+                the scenario cache (ref. scenario_cache.py); when used, the
+                regular expressions are compiled on first use
+        """
+        self.source = sorted_obd_msg  # sortedOBDMsg list used to build it
+        self.entries = []
+        self.buckets = {}  # literal prefix -> list of entries
+        self.prefix_lengths = ()  # lengths of the literal prefixes
+        self.fallback = []  # entries without literal prefix
+        self.fallback_regex = None  # alternation of the fallback entries
+        self.cache = {}  # command -> tuple of matching entries
+        for slot, (pid, val) in enumerate(sorted_obd_msg):
+            if compiled is not None:
+                if compiled[slot] is None:
+                    continue
+                prefix, exec_snippet, log_snippet = compiled[slot]
+                entry = DispatchEntry(
+                    slot, pid, val, request_pattern(val), prefix,
+                    (exec_snippet, log_snippet))
+            else:
+                request = request_pattern(val)
+                if request is None:
+                    continue
+                try:
+                    regex = re.compile(request)
+                except re.error as e:
+                    logging.error(
+                        "Invalid 'Request' expression %s for PID %s: %s",
+                        repr(request), repr(pid), e)
+                    continue
+                entry = DispatchEntry(
+                    slot, pid, val, regex, literal_prefix(request))
+            self.entries.append(entry)
+            if entry.prefix:
+                self.buckets.setdefault(entry.prefix, []).append(entry)
+            else:
+                self.fallback.append(entry)
+        self.prefix_lengths = tuple(
+            sorted({len(prefix) for prefix in self.buckets}))
+        if self.fallback:
+            try:
+                self.fallback_regex = re.compile('|'.join(
+                    '(?:' + e.pattern + ')' for e in self.fallback))
+            except re.error:
+                self.fallback_regex = None  # test entries one by one
+
+    def match(self, cmd):
+        """
+        Return the entries whose 'Request' expression matches the command.
+        :param cmd: sanitized request (unspaced uppercase chars)
+        :return: tuple of DispatchEntry in priority order
+        """
+        try:
+            return self.cache[cmd]
+        except KeyError:
+            pass
+        candidates = []
+        for length in self.prefix_lengths:
+            if length > len(cmd):
+                break
+            bucket = self.buckets.get(cmd[:length])
+            if bucket:
+                candidates += bucket
+        if self.fallback and (self.fallback_regex is None or
+                              self.fallback_regex.match(cmd)):
+            candidates += self.fallback
+        candidates.sort(key=lambda e: e.slot)
+        result = tuple(e for e in candidates if e.regex.match(cmd))
+        if len(self.cache) >= MAX_CACHED_COMMANDS:
+            self.cache.clear()
+        self.cache[cmd] = result
+        return result
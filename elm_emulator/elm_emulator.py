@@ -5,6 +5,8 @@
 # (C) Ircama 2021 - CC-BY-NC-SA-4.0
 ###########################################################################
 
+import asyncio
+import functools
 import logging
 import logging.config
 import os
@@ -26,17 +28,37 @@ import time
 import traceback
 import errno
 from random import choices
-from .obd_message import ObdMessage
+from .scenarios import ObdMessage
 from .obd_message import ELM_R_UNKNOWN, ST
 from .obd_message import ECU_ADDR_E
+from .framing import LineFramer
+from .dispatch import DispatchIndex
+from .scenario_cache import load_dispatch_index
+from .plugin_registry import PluginRegistry, ECU_TASK
+from .session import ElmSession, SessionCounters, SESSION_ATTRIBUTES
+from .response_template import (
+    compile_response, OP_TEXT, OP_RH, OP_RD, OP_STRING, OP_WRITELN, OP_SPACE,
+    OP_EVAL, OP_FLOW, OP_ANSWER, OP_POS_ANSWER, OP_NEG_ANSWER, OP_HEADER,
+    OP_ABORT)
+from .async_server import AsyncElmServer
+from .uds_encoder import HEX_BYTE, encode_iso_tp, encode_kwp
+from .bus_timing import PacedOutput, LinkThroughput, paced_chunks
+from .simulation import CarSimulation, CATCH_UP
+from .session_log import SessionRecorder
+from .scenario_capture import ScenarioCapture
+from .scenario_file import load_scenario
+from .value_providers import resolve_providers
+from .forwarder import Forwarder, FORWARD_SETTING
+from .stats import PidCounters, UnknownCommands
+from .profiling import (
+    StageProfiler, STAGE_READ, STAGE_RENDER, STAGE_TASK, STAGE_UDS,
+    STAGE_WRITE)
 import string
-from xml.etree.ElementTree import fromstring, ParseError
-import importlib
-import pkgutil
-import inspect
 
 # Configuration constants__________________________________________________
 FORWARD_READ_TIMEOUT = 0.2  # seconds
+FORWARD_MAX_WAIT = 2  # seconds waiting for the queued forwarded requests
+READ_BUFFER_SIZE = 4096  # max bytes read from the device at a time
 SERIAL_BAUDRATE = 38400  # bps
 NETWORK_INTERFACES = ""
 PLUGIN_DIR = __package__ + ".plugins"
@@ -46,10 +68,25 @@ ISO_TP_MULTIFRAME_MODULE = 'ISO-TP request pending'
 MIN_SIZE_UDS_LENGTH = 20
 INTERRUPT_TASK_IF_NOT_HEX = False
 ELM_VALID_CHARS = r"^[a-zA-Z0-9 \n\r\b\t@,.?]*$"
-ECU_TASK = "task_ecu_"
 DEFAULT_ECU_TASK = 'Default ECU Task module'
 ELM_VERSION = "ELM327 v1.5"
 ELM_HEADER_VERSION = "\r\r"
+MAX_RENDERED_RESPONSES = 4096
+SCENARIO_CACHE = True  # use the on-disk cache of the compiled scenarios
+SIMULATION_TICK_RATE = 100  # car simulation steps per second
+SIMULATION_POLICY = CATCH_UP  # when steps are missed: CATCH_UP or SKIP
+SIMULATION_MAX_CATCH_UP = 5  # max steps run at once by CATCH_UP
+PROFILING_DUMP_INTERVAL = 0  # seconds between latency dumps (0 = no dump)
+# Methods timed while profiling (ref. start_profiling())
+PROFILED_METHODS = {
+    'task_action': STAGE_TASK,
+    'uds_answer': STAGE_UDS,
+    'write_to_device': STAGE_WRITE,
+}
+# Pace the output at the rate of the UART and of the bus of the selected
+# protocol (ref. start_throughput())
+LINK_THROUGHPUT = False
+THROUGHPUT_BURST = 0  # bits of each link sent with no delay when idle
 
 """
 Ref. to ISO 14229-1 and ISO 14230, this is a list of SIDs (UDS service
@@ -352,6 +389,44 @@ def len_hex(s):
         return False
 
 
+def write_vectored(write, fragments):
+    """
+    Write a sequence of buffers with a single gather system call, looping
+    on partial writes.
+    :param write: function writing a list of buffers and returning the
+            number of written bytes (e.g., socket.sendmsg, os.writev)
+    :param fragments: sequence of bytes-like objects
+    :return: (none)
+    """
+    views = [memoryview(f) for f in fragments]
+    while views:
+        written = write(views)
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            del views[0]
+        if views:
+            views[0] = views[0][written:]
+
+
+class EchoTime:
+    """
+    time module of the emulator (ref. Elm.time): the pending echo of the
+    request (ref. Elm.pending_echo) is written before sleeping, as the
+    ELM327 echoes the request at once; the other functions are the ones of
+    the time module.
+    """
+
+    def __init__(self, emulator):
+        self.emulator = emulator
+
+    def sleep(self, seconds):
+        self.emulator.flush_echo()
+        time.sleep(seconds)
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
 class Elm:
     """
     Main class of the ELM327-emulator
@@ -397,7 +472,7 @@ class Elm:
         Called by __init__(), ATZ and ATD.  
         """
         logging.debug("Resetting counters and sleeping for %s seconds", sleep)
-        time.sleep(sleep)
+        self.time.sleep(sleep)
         for i in [k for k in self.counters if k.startswith('cmd_')]:
             del (self.counters[i])
         self.counters['ELM_PIDS_A'] = 0
@@ -407,6 +482,23 @@ class Elm:
         self.counters['cmd_version'] = self.version
         self.counters.update(self.presets)
 
+    def stats_snapshot(self, top=None):
+        """
+        Copy of the request statistics, which can be taken from any thread.
+        :param top: max number of unknown commands (None = all the tracked
+                ones)
+        :return: dictionary with the request counters of the PIDs, summed
+                over all the client sessions ('pids': {PID: count}), the
+                most frequent unknown commands
+                ('unknown': list of (cmd, count, error, forwarded answer))
+                and the total number of unknown requests ('unknown_total')
+        """
+        return {
+            'pids': dict(self.pid_stats.items()),
+            'unknown': self.unknown_commands.top(top),
+            'unknown_total': self.unknown_commands.total,
+        }
+
     def set_defaults(self):
         """
         Called by __init__() and terminate()
@@ -420,44 +512,102 @@ class Elm:
         # seconds - UDS P4 timer - Inter byte time for tester request (ref. req_timeout counter)
         self.max_req_timeout = 1440
         self.answer = {}
-        self.counters = {}
-        self.counters.update(self.presets)
+        self.rendered_responses = {}  # cache of static responses
+        self.counters = SessionCounters(self.presets)
+        self.pid_stats = PidCounters()  # requests of all the sessions
+        self.unknown_commands = UnknownCommands()
         if hasattr(self, "tasks"):
-            for ecu in self.tasks:
-                for i in reversed(self.tasks[ecu]):
-                    logging.debug(
-                        'Stopping task "%s", ECU="%s", '
-                        'method=stop()',
-                        i.__module__,
-                        ecu)
-                    try:  # Run the stop() method
-                        i.stop(None)
-                    except Exception as e:
-                        logging.critical(
-                            'Error while stopping task "%s", ECU="%s", '
-                            'method=stop(): %s',
-                            i.__module__,
-                            ecu,
-                            e, exc_info=True)
+            self.stop_tasks()
         self.tasks = {}
-        if hasattr(self, "task_shared_ns"):
-            for ecu in self.task_shared_ns:
+        self.task_shared_ns = {}
+        self.shared = None
+
+    def stop_tasks(self):
+        """
+        Run the stop() method of all the active tasks and ECU tasks of the
+        current session.
+        """
+        for ecu in self.tasks:
+            for i in reversed(self.tasks[ecu]):
                 logging.debug(
-                    'Stopping ECU task "%s", ECU="%s", '
+                    'Stopping task "%s", ECU="%s", '
                     'method=stop()',
-                    self.task_shared_ns[ecu].__module__,
+                    i.__module__,
                     ecu)
                 try:  # Run the stop() method
-                    self.task_shared_ns[ecu].stop(None)
+                    i.stop(None)
                 except Exception as e:
                     logging.critical(
-                        'Error while stopping ECU task "%s", ECU="%s", '
+                        'Error while stopping task "%s", ECU="%s", '
                         'method=stop(): %s',
-                        self.task_shared_ns[ecu].__module__,
+                        i.__module__,
                         ecu,
                         e, exc_info=True)
+        for ecu in self.task_shared_ns:
+            logging.debug(
+                'Stopping ECU task "%s", ECU="%s", '
+                'method=stop()',
+                self.task_shared_ns[ecu].__module__,
+                ecu)
+            try:  # Run the stop() method
+                self.task_shared_ns[ecu].stop(None)
+            except Exception as e:
+                logging.critical(
+                    'Error while stopping ECU task "%s", ECU="%s", '
+                    'method=stop(): %s',
+                    self.task_shared_ns[ecu].__module__,
+                    ecu,
+                    e, exc_info=True)
+
+    def new_session(self, writer=None, peer=None, call_at=None):
+        """
+        Create a client session with default settings and make it current.
+        :param writer: function writing bytes to the client (None to use
+                the configured port)
+        :param peer: address of the client
+        :param call_at: thread-safe function scheduling a call at a
+                time.monotonic() time: call_at(when, callback); when set,
+                the output of the writer is scheduled at the emulated bus
+                times instead of sleeping (ref. PacedOutput)
+        :return: the new ElmSession
+        """
+        session = ElmSession(
+            self.newline, writer=writer, peer=peer,
+            output=PacedOutput(writer, call_at) if call_at else None)
+        session.counters.update(self.presets)
+        self.switch_session(session)
+        self.reset(0)
+        return session
+
+    def switch_session(self, session):
+        """
+        Save the state of the current session and load the state of the
+        given one, so that requests are processed with its settings.
+        :param session: ElmSession to make current
+        :return: (none)
+        """
+        if session is self.session:
+            return
+        if self.session is not None:
+            for name in SESSION_ATTRIBUTES:
+                setattr(self.session, name, getattr(self, name))
+        for name in SESSION_ATTRIBUTES:
+            setattr(self, name, getattr(session, name))
+        self.session = session
+
+    def close_session(self, session):
+        """
+        Stop the tasks of a client session which is terminated.
+        :param session: ElmSession to close
+        :return: (none)
+        """
+        self.switch_session(session)
+        self.stop_tasks()
+        self.tasks = {}
         self.task_shared_ns = {}
         self.shared = None
+        if self.throughput:
+            self.throughput.discard(session.session_id)
 
     def set_sorted_obd_msg(self, scenario=None):
         """
@@ -487,6 +637,28 @@ class Elm:
         self.sortedOBDMsg = sorted(
             self.sortedOBDMsg.items(),
             key=lambda x: x[1]['Priority'] if 'Priority' in x[1] else 10)
+        self.dispatch_index = self.build_dispatch_index()
+        self.plugins.missing_tasks(self.sortedOBDMsg)
+
+    def build_dispatch_index(self):
+        """
+        Compile sortedOBDMsg, reading the result from the scenario cache
+        if SCENARIO_CACHE is set (ref. scenario_cache.py).
+        :return: DispatchIndex
+        """
+        if SCENARIO_CACHE:
+            return load_dispatch_index(self.sortedOBDMsg)
+        return DispatchIndex(self.sortedOBDMsg)
+
+    def get_dispatch_index(self):
+        """
+        Return the dispatch index of sortedOBDMsg, rebuilding it if
+        sortedOBDMsg was replaced without invoking set_sorted_obd_msg().
+        :return: DispatchIndex
+        """
+        if self.dispatch_index.source is not self.sortedOBDMsg:
+            self.dispatch_index = self.build_dispatch_index()
+        return self.dispatch_index
 
     def __init__(
             self,
@@ -501,8 +673,18 @@ class Elm:
             forward_net_port=None,
             forward_serial_port=None,
             forward_serial_baudrate=None,
-            forward_timeout=None):
+            forward_timeout=None,
+            multi_client=False):
+        # time module used for the simulated delays (ATZ, P2, scenarios)
+        self.pending_echo = None  # echo of a request, written with its answer
+        self.time = EchoTime(self)
         self.car = Car()
+        self.simulation = None  # headless car simulation (CarSimulation)
+        self.recorder = None  # binary session log (SessionRecorder)
+        self.capture = None  # capture of forwarded traffic (ScenarioCapture)
+        self.profiler = None  # latency histograms (StageProfiler)
+        self.throughput = None  # link throughput model (LinkThroughput)
+        self.logger = logging.getLogger()  # also used without run()
         self.database = {
             "rpm": 0,
             "speed": 0,
@@ -514,12 +696,15 @@ class Elm:
         self.version = ELM_VERSION
         self.header_version = ELM_HEADER_VERSION
         self.presets = {}
+        self.session = None  # current client session
+        self.plugins = PluginRegistry(PLUGIN_DIR)  # imported when used
         self.ObdMessage = ObdMessage
         self.ELM_R_UNKNOWN = ELM_R_UNKNOWN
         self.set_defaults()
         self.set_sorted_obd_msg()
         self.batch_mode = batch_mode
         self.newline = newline
+        self.framer = LineFramer(newline)
         self.no_echo = no_echo
         self.serial_port = serial_port
         self.device_port = device_port
@@ -530,6 +715,8 @@ class Elm:
         self.forward_serial_port = forward_serial_port
         self.forward_serial_baudrate = forward_serial_baudrate
         self.forward_timeout = forward_timeout
+        self.multi_client = multi_client  # asyncio server with many clients
+        self.session_lock = threading.Lock()
         self.reset(0)
         self.slave_name = None  # pty port name, if pty is used
         # pty port FD, if pty is used, or device com port FD (IO)
@@ -537,15 +724,16 @@ class Elm:
         self.slave_fd = None  # pty side used by the client application
         self.serial_fd = None  # serial COM port file descriptor (pySerial)
         self.sock_inet = None
-        self.fw_sock_inet = None
-        self.fw_serial_fd = None
+        self.forwarder = None  # I/O thread of the forwarded adapter
+        self.forward_pending = None  # last ForwardRequest of a read command
         self.sock_conn = None
         self.sock_addr = None
         self.thread = None
-        self.plugins = {}
         self.request_timer = {}
         self.choice_mode = self.Choice.SEQUENTIAL
         self.choice_weights = [1]
+        if LINK_THROUGHPUT:
+            self.start_throughput()
 
     class Choice(Enum):
         SEQUENTIAL = 0
@@ -568,6 +756,12 @@ class Elm:
         Termination procedure.
         """
         logging.debug("Start termination procedure.")
+        self.stop_simulation()
+        self.stop_recording()
+        self.stop_profiling()
+        if self.forwarder:
+            self.forwarder.close()
+            self.forwarder = None
         if (self.thread and
                 self.threadState != self.THREAD.STOPPED and
                 self.threadState != self.THREAD.TERMINATED):
@@ -604,6 +798,190 @@ class Elm:
         logging.debug("Terminated.")
         return True
 
+    def start_simulation(self,
+                         tick_rate=SIMULATION_TICK_RATE,
+                         policy=SIMULATION_POLICY,
+                         max_catch_up=SIMULATION_MAX_CATCH_UP):
+        """
+        Start the headless simulation of self.car, publishing its state
+        into self.database. If self.car is a slot of a CarFleet (ref.
+        CarFleet.attach()), the slot is driven by the simulation shared by
+        the whole fleet.
+        :param tick_rate: simulation steps per second
+        :param policy: CATCH_UP or SKIP (ref. CarSimulation)
+        :param max_catch_up: max steps run at once by CATCH_UP
+        :return: CarSimulation, or FleetSimulation of the slot
+        """
+        if self.simulation and self.simulation.is_running():
+            return self.simulation
+        fleet = getattr(self.car, 'fleet', None)
+        if fleet is not None:
+            self.simulation = fleet.simulate(
+                self.car.slot, tick_rate=tick_rate, policy=policy,
+                max_catch_up=max_catch_up)
+            return self.simulation
+        self.simulation = CarSimulation(
+            self.car, self.database, tick_rate=tick_rate, policy=policy,
+            max_catch_up=max_catch_up)
+        return self.simulation.start()
+
+    def stop_simulation(self):
+        """
+        Stop the headless simulation of self.car, if running.
+        """
+        if self.simulation:
+            self.simulation.stop()
+
+    def start_profiling(self, dump_interval=PROFILING_DUMP_INTERVAL):
+        """
+        Start recording the latency of each stage of the request processing
+        (ref. StageProfiler), if not already started.
+        :param dump_interval: seconds between two dumps of the latency
+                report to the log (0 = no periodic dump)
+        :return: StageProfiler
+        """
+        if self.profiler:
+            return self.profiler
+        profiler = StageProfiler()
+        # methods replaced in the instance, to be restored
+        profiler.overridden = {name: self.__dict__[name]
+                               for name in PROFILED_METHODS
+                               if name in self.__dict__}
+        for name, stage in PROFILED_METHODS.items():
+            setattr(self, name, profiler.timed(stage, getattr(self, name)))
+        profiler.start_dump(dump_interval)
+        self.profiler = profiler
+        return profiler
+
+    def stop_profiling(self):
+        """
+        Stop recording the latencies.
+        :return: the stopped StageProfiler (with its histograms), or None
+        """
+        profiler = self.profiler
+        if not profiler:
+            return None
+        self.profiler = None
+        for name in PROFILED_METHODS:
+            self.__dict__.pop(name, None)
+        self.__dict__.update(profiler.overridden)
+        profiler.stop_dump()
+        return profiler
+
+    def profiling_stats(self, stage=None, pid=None):
+        """
+        Query the latency histograms (ref. StageProfiler.stats()).
+        :param stage: stage name (None = all stages)
+        :param pid: PID (None = all PIDs)
+        :return: dictionary of the latency summaries, or None if not
+                profiling
+        """
+        if not self.profiler:
+            return None
+        return self.profiler.stats(stage, pid)
+
+    def profiling_report(self):
+        """
+        Answer of the ATPROF debug command.
+        :return: response with a line for each stage and PID
+        """
+        if not self.profiler:
+            return ST('OFF')
+        return ''.join(ST(line) for line in self.profiler.report()) or ST(
+            'NO DATA')
+
+    def start_throughput(self, uart_baudrate=None, burst=THROUGHPUT_BURST):
+        """
+        Pace the output at the effective rate of the links of the adapter:
+        the UART and the vehicle bus of the protocol selected by ATSP (ref.
+        LinkThroughput). The waits use self.time, so they do not block the
+        worker thread of the multi-client server (ref. PacedOutput).
+        :param uart_baudrate: baud rate of the UART (default: the one of
+                the serial port, or SERIAL_BAUDRATE)
+        :param burst: bits of each link sent with no delay when idle
+        :return: LinkThroughput
+        """
+        self.throughput = LinkThroughput(
+            int(uart_baudrate or self.serial_baudrate or SERIAL_BAUDRATE),
+            burst)
+        return self.throughput
+
+    def stop_throughput(self):
+        """
+        Write the output with no throughput limit.
+        """
+        self.throughput = None
+
+    def start_recording(self, path):
+        """
+        Record the received commands and the data written to the device
+        into a binary session log (ref. SessionRecorder); the log can be
+        replayed through SessionReplayer.
+        :param path: log file name (data are appended)
+        :return: SessionRecorder
+        """
+        self.stop_recording()
+        self.recorder = SessionRecorder(path)
+        logging.debug("Recording session log %s", path)
+        return self.recorder
+
+    def stop_recording(self):
+        """
+        Stop recording the session log, if active.
+        """
+        if self.recorder:
+            recorder = self.recorder
+            self.recorder = None
+            recorder.close()
+
+    def start_capture(self):
+        """
+        Collect the requests forwarded to the real adapter with their
+        answers, to be compiled into a scenario (ref. stop_capture()).
+        :return: ScenarioCapture
+        """
+        self.capture = ScenarioCapture()
+        return self.capture
+
+    def stop_capture(self, path=None, name='captured'):
+        """
+        Stop the capture of the forwarded traffic.
+        :param path: data file where the captured scenario is saved
+                (ref. load_scenario_file()); None = do not save
+        :param name: name of the saved scenario
+        :return: ScenarioCapture, or None if no capture is active
+        """
+        capture = self.capture
+        self.capture = None
+        if capture and path:
+            n_pids = capture.save(path, name)
+            logging.info("Captured scenario %s saved to %s: %s PIDs.",
+                         repr(name), path, n_pids)
+        return capture
+
+    def load_scenario_file(self, path, scenario=None):
+        """
+        Add a scenario stored in a data file (e.g., produced by
+        stop_capture()) to self.ObdMessage.
+        :param path: data file
+        :param scenario: name of the scenario (None = name in the file)
+        :return: name of the scenario, or None in case of error
+        """
+        try:
+            name, pids = load_scenario(path)
+            resolve_providers(pids)
+        except (OSError, ValueError) as e:
+            logging.error("Cannot load scenario file %s: %s", path, e)
+            return None
+        name = scenario or name
+        # self.ObdMessage might be the module dictionary shared by all the
+        # instances: replace it instead of updating it; copy() does not load
+        # the data files of a ScenarioCatalog
+        obd_message = self.ObdMessage.copy()
+        obd_message[name] = pids
+        self.ObdMessage = obd_message
+        return name
+
     def socket_server(self):
         """
         Create an INET, STREAMing socket
@@ -767,6 +1145,8 @@ class Elm:
         No return code.
         """
         self.logger = logging.getLogger()
+        if self.net_port and self.multi_client:
+            return self.run_async_server()
         if self.net_port:
             if not self.socket_server():
                 logging.critical("Net connection failed.")
@@ -790,34 +1170,10 @@ class Elm:
                 msg = 'with no open TCP/IP port.'
         else:
             msg = 'on ' + self.get_port_name()
-        if self.batch_mode:
-            logging.debug(
-                'ELM327 OBD-II adapter emulator started '
-                '%s_______________', msg)
-        else:
-            logging.info(
-                '\n\nELM327 OBD-II adapter emulator started '
-                '%s\n', msg)
+        self.log_started(msg)
         """ the ELM's main IO loop """
 
-        # Load and validate plugins
-        self.plugins = {
-            name: importlib.import_module(PLUGIN_DIR + "." + name)
-            for finder, name, ispkg
-            in pkgutil.iter_modules(
-                importlib.import_module(PLUGIN_DIR).__path__)
-            if name.startswith('task_')
-        }
-        remove = []
-        for k, v in self.plugins.items():
-            if (not (hasattr(v, "Task")) or
-                    not inspect.isclass(v.Task)):
-                logging.critical(
-                    "Task class not available in plugin %s", k)
-                remove += [k]
-                continue
-        for k in remove:
-            del self.plugins[k]
+        self.load_plugins()
 
         self.threadState = self.THREAD.ACTIVE
         while (self.threadState != self.THREAD.STOPPED and
@@ -833,34 +1189,123 @@ class Elm:
                 return True
             if self.cmd is None:
                 continue
+            self.process_command()
+            self.flush_echo()  # request without response
+        return True
 
-            # process 'fast' option (command repetition)
-            if re.match('^ *$', self.cmd) and "cmd_last_cmd" in self.counters:
-                self.cmd = self.counters["cmd_last_cmd"]
-                logging.debug("repeating previous command: %s", repr(self.cmd))
-            else:
-                self.counters["cmd_last_cmd"] = self.cmd
-                logging.debug("Received %s", repr(self.cmd))
-
-            # if the request includes valid data, handle it
-            if re.match(ELM_VALID_CHARS, self.cmd):
-                try:
-                    request_header, request_data, resp = self.handle_request(
-                        self.cmd, do_write=True)
-                except Exception as e:
-                    logging.critical("Error while processing %s:\n%s\n%s",
-                                     repr(self.cmd), e, traceback.format_exc())
-                    continue
-                if resp is not None:
-                    self.handle_response(
-                        resp,
-                        do_write=True,
-                        request_header=request_header,
-                        request_data=request_data)
-            else:
-                logging.warning("Invalid request: %s", repr(self.cmd))
+    def run_async_server(self):
+        """
+        Core method used with multi_client: serve many concurrent TCP/IP
+        clients through an asyncio server, each one with its own session.
+        It is run within the thread of the Context Manager (ref. run()).
+        :return: True when terminated, False in case of error
+        """
+        self.log_started(
+            'at ' + self.get_port_name() + ' (multi-client server)')
+        self.load_plugins()
+        self.threadState = self.THREAD.ACTIVE
+        try:
+            asyncio.run(AsyncElmServer(
+                self, host=NETWORK_INTERFACES, port=self.net_port,
+                read_size=READ_BUFFER_SIZE).serve())
+        except OSError as e:
+            logging.critical("Net connection failed: %s", e)
+            self.terminate()
+            return False
         return True
 
+    def log_started(self, msg):
+        """
+        Log the startup message of the emulator.
+        :param msg: description of the port
+        :return: (none)
+        """
+        if self.batch_mode:
+            logging.debug(
+                'ELM327 OBD-II adapter emulator started '
+                '%s_______________', msg)
+        else:
+            logging.info(
+                '\n\nELM327 OBD-II adapter emulator started '
+                '%s\n', msg)
+
+    def load_plugins(self):
+        """
+        Index the plugins, which are imported when first used.
+        :return: (none)
+        """
+        self.plugins = PluginRegistry(PLUGIN_DIR)
+        self.plugins.missing_tasks(self.sortedOBDMsg)
+
+    def process_command(self):
+        """
+        Process the request stored in self.cmd, writing the response to
+        the device.
+        :return: (none)
+        """
+        profiler = self.profiler
+        if profiler:
+            start = profiler.begin()
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        # process 'fast' option (command repetition)
+        if re.match('^ *$', self.cmd) and "cmd_last_cmd" in self.counters:
+            self.cmd = self.counters["cmd_last_cmd"]
+            if debug:
+                logging.debug("repeating previous command: %r", self.cmd)
+        else:
+            self.counters["cmd_last_cmd"] = self.cmd
+            if debug:
+                logging.debug("Received %r", self.cmd)
+        if self.recorder:
+            self.recorder.command(
+                self.session.session_id if self.session else 0,
+                self.scenario, self.cmd)
+
+        # if the request includes valid data, handle it
+        if re.match(ELM_VALID_CHARS, self.cmd):
+            try:
+                request_header, request_data, resp = self.handle_request(
+                    self.cmd, do_write=True)
+            except Exception as e:
+                logging.critical("Error while processing %s:\n%s\n%s",
+                                 repr(self.cmd), e, traceback.format_exc())
+                return
+            if resp is not None:
+                self.handle_response(
+                    resp,
+                    do_write=True,
+                    request_header=request_header,
+                    request_data=request_data)
+        else:
+            logging.warning("Invalid request: %s", repr(self.cmd))
+        if profiler:
+            profiler.end(start)
+
+    def process_session_command(self, session, cmd):
+        """
+        Process a request of a client session (used by the multi-client
+        server); requests of different sessions are serialized.
+        :param session: ElmSession of the client
+        :param cmd: request read from the client
+        :return: (none)
+        """
+        with self.session_lock:
+            self.switch_session(session)
+            try:
+                self.submit_forward((cmd + '\r').encode())
+            except Exception as e:
+                logging.error('Forward Write error: %s', e)
+            self.cmd = cmd
+            if session.output is None:
+                self.process_command()
+                return
+            # the delays of the request are scheduled, not slept
+            emulator_time, self.time = self.time, session.output
+            try:
+                self.process_command()
+            finally:
+                self.time = emulator_time
+
     def accept_connection(self):
         """
         Perform the "accept" socket method of an INET connection.
@@ -882,115 +1327,84 @@ class Elm:
             logging.debug("Connected by %s", self.sock_addr)
         return True
 
-    def serial_client(self):
-        """
-        Internally used by send_receive_forward().
-        Open the forwarded port if serial mode is used..
-        :return: True when successfully opened, otherwise False
+    def get_forwarder(self):
         """
-        if self.fw_serial_fd:
-            return True
-        try:
-            self.fw_serial_fd = serial.Serial(
-                port=self.forward_serial_port,
-                baudrate=int(self.forward_serial_baudrate)
-                if self.forward_serial_baudrate else SERIAL_BAUDRATE,
-                timeout=self.forward_timeout or FORWARD_READ_TIMEOUT)
-            return True
-        except Exception as e:
-            logging.error('Cannot open forward port: %s', e)
-            return False
-
-    def net_client(self):
+        Return the Forwarder of the real adapter, creating it if a forward
+        serial port or host and port are configured.
+        :return: Forwarder, or None if forwarding is not configured
         """
-        Internally used by send_receive_forward()
-        Open a socket connection if socket mode is used.
-        :return: (not really used)
-        """
-        if (self.fw_sock_inet
-                or self.forward_net_host is None
-                or self.forward_net_port is None):
-            return False
-        s = None
-        for res in socket.getaddrinfo(
-                self.forward_net_host, self.forward_net_port,
-                socket.AF_UNSPEC, socket.SOCK_STREAM):
-            af, socktype, proto, canonname, sa = res
-            try:
-                s = socket.socket(af, socktype, proto)
-                self.sock_inet.setsockopt(
-                    socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                self.sock_inet.setsockopt(
-                    socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-            except OSError as msg:
-                s = None
-                continue
-            try:
-                s.connect(sa)
-                s.settimeout(self.forward_timeout or FORWARD_READ_TIMEOUT)
-            except OSError as msg:
-                s.close()
-                s = None
-                continue
-            break
-        if s is None:
-            logging.critical(
-                "Cannot connect to host %s with port %s",
-                self.forward_net_host, self.forward_net_port)
-            self.terminate()
-            return False
-        self.fw_sock_inet = s
-        return True
+        if self.forwarder:
+            return self.forwarder
+        if not self.forward_serial_port and (
+                not self.forward_net_host or not self.forward_net_port):
+            return None
+        self.forwarder = Forwarder(
+            serial_port=self.forward_serial_port,
+            serial_baudrate=self.forward_serial_baudrate or SERIAL_BAUDRATE,
+            net_host=self.forward_net_host,
+            net_port=self.forward_net_port,
+            timeout=self.forward_timeout or FORWARD_READ_TIMEOUT,
+            on_answer=self.forward_answered,
+            on_error=self.terminate)
+        return self.forwarder
+
+    def forward_answered(self, request):
+        """
+        Called by the I/O thread of the Forwarder with each answered
+        request; feed the capture of the forwarded traffic.
+        :param request: ForwardRequest (context is the header)
+        """
+        capture = self.capture
+        if capture:
+            capture.add(request.data, request.answer, request.context)
+
+    def submit_forward(self, i):
+        """
+            If a forwarder is active, queue data in background, without
+            waiting for the answer, which can be later collected by
+            send_receive_forward(). Only the settings (AT/ST commands),
+            keeping the real adapter aligned with the client, are queued,
+            or any request while a capture is active; the other requests
+            are only forwarded if the emulator does not answer them.
+
+            return None: no forwarder or request not queued
+            return ForwardRequest
+        """
+        self.forward_pending = None
+        forwarder = self.get_forwarder()
+        if forwarder is None or not i:
+            return None
+        if (not self.capture and
+                not FORWARD_SETTING.match(forwarder.normalize_request(i))):
+            return None
+        self.forward_pending = forwarder.submit(
+            i, self.counters.get('cmd_set_header'), background=True)
+        return self.forward_pending
 
     def send_receive_forward(self, i):
         """
             If a forwarder is active, send data if it is not None
-            and try receiving data until a timeout.
-            Then received data are logged and returned.
+            and wait for the answer, read until the prompt or a timeout.
+            If the same request was just queued by submit_forward(), its
+            answer is returned without sending it again. The request goes
+            ahead of the background ones (ref. Forwarder.wait_answer()).
+            Received data are logged by the Forwarder.
 
             return False: no connection
             return None: no data
             return data: decoded string
         """
-
-        if self.forward_serial_port:
-            if self.fw_serial_fd is None:
-                if not self.serial_client():
-                    return False
-            if self.fw_serial_fd:
-                if i:
-                    self.fw_serial_fd.write(i)
-                    logging.info(
-                        "Write forward data: %s", repr(i))
-                proxy_data = self.fw_serial_fd.read(1024)
-                logging.info(
-                    "Read forward data: %s", repr(proxy_data))
-                return repr(proxy_data)
+        forwarder = self.get_forwarder()
+        if forwarder is None:
             return False
-
-        if not self.forward_net_host or not self.forward_net_port:
-            return False
-        if self.fw_sock_inet is None:
-            self.net_client()
-        if self.fw_sock_inet:
-            if i:
-                try:
-                    self.fw_sock_inet.sendall(i)
-                    logging.info(
-                        "Write forward data: %s", repr(i))
-                except BrokenPipeError:
-                    logging.error(
-                        "The network link of the OBDII interface dropped.")
-            try:
-                proxy_data = self.fw_sock_inet.recv(1024)
-                logging.info(
-                    "Read forward data: %s", repr(proxy_data))
-                return proxy_data.decode("utf-8", "ignore")
-            except socket.timeout:
-                logging.info(
-                    "No forward data received.")
+        request = self.forward_pending
+        self.forward_pending = None
+        if (request is None or
+                request.cmd != forwarder.normalize_request(i or b'')):
+            if not i:
                 return None
-        return False
+            request = forwarder.submit(i, self.counters.get('cmd_set_header'))
+        return forwarder.wait_answer(request, FORWARD_MAX_WAIT)
 
     def get_port_name(self, extended=False):
         """
@@ -998,6 +1412,8 @@ class Elm:
         :param extended: False or True
         :return: string
         """
+        if self.net_port and self.multi_client:
+            return 'TCP/IP network port ' + str(self.net_port) + '.'
         if self.sock_inet:
             if self.net_port:
                 postfix = ''
@@ -1046,13 +1462,15 @@ class Elm:
 
         return 'unknown port.'
 
-    def read_from_device(self, bytes):
+    def read_from_device(self, bytes, echo=True):
         """
-        Read from the port; returns up to bytes characters (generally 1).
+        Read from the port; returns up to bytes characters (whatever is
+        available, without waiting for the buffer to be filled).
         Manage socket, serial or device output.
         Process echo; returns None in case of error
 
-        :param bytes: max number of bytes to read (we use 1 byte a time)
+        :param bytes: max number of bytes to read
+        :param echo: False if the caller echoes the data with echo_to_device()
         :return: Read character(s) or None if error.
         """
 
@@ -1068,6 +1486,7 @@ class Elm:
                         "TCP/IP communication terminated by the client.")
                     self.sock_conn = None
                     self.sock_addr = None
+                    self.framer.clear()
                     self.reset(0)
                     return None
             except ConnectionResetError:
@@ -1075,6 +1494,7 @@ class Elm:
                     "Session terminated by the client.")
                 self.sock_conn = None
                 self.sock_addr = None
+                self.framer.clear()
                 self.reset(0)
                 return None
             except UnicodeDecodeError as msg:
@@ -1085,10 +1505,8 @@ class Elm:
                 logging.error(
                     "Error while reading from network: %s", msg)
                 return None
-            if 'cmd_echo' not in self.counters or (
-                    'cmd_echo' in self.counters and
-                    self.counters['cmd_echo']):
-                self.sock_conn.sendall(c)
+            if echo and not self.echo_to_device(c):
+                return None
             return c
 
         # Process serial (COM or device)
@@ -1100,15 +1518,13 @@ class Elm:
             # Serial COM port (uses pySerial)
             if self.serial_fd and self.serial_port:
                 try:
-                    c = self.serial_fd.read(bytes)
+                    # block for the first byte, then get what is available
+                    c = self.serial_fd.read(
+                        min(bytes, self.serial_fd.in_waiting) or 1)
                 except Exception:
                     logging.debug(
                         'Error while reading from %s', self.get_port_name())
                     return None
-                if 'cmd_echo' not in self.counters or (
-                        'cmd_echo' in self.counters and
-                        self.counters['cmd_echo']):
-                    self.serial_fd.write(c)
 
             # Device port (use os IO)
             else:
@@ -1118,23 +1534,8 @@ class Elm:
                     self.terminate()
                     return None
                 c = os.read(self.master_fd, bytes)
-                if 'cmd_echo' not in self.counters or (
-                        'cmd_echo' in self.counters and
-                        self.counters['cmd_echo']):
-                    try:
-                        os.write(self.master_fd, c)
-                    except OSError as e:
-                        # [Errno 9] Bad file descriptor/[Errno 5] Input/output error
-                        if e.errno == errno.EBADF or e.errno == errno.EIO:
-                            logging.debug("Read interrupted. Terminating.")
-                            self.terminate()
-                            return None
-                        else:
-                            logging.critical(
-                                "PANIC - Internal OSError in read(): %s",
-                                e, exc_info=True)
-                            self.terminate()
-                            return None
+            if echo and not self.echo_to_device(c):
+                return None
         except UnicodeDecodeError as e:
             logging.warning("Invalid character received: %s", e)
             return None
@@ -1142,17 +1543,50 @@ class Elm:
             return None
         return c
 
-    def normalized_read_line(self):
+    def echo_to_device(self, c):
         """
-            Read the next newline delimited command invoking read_from_device()
-            Concatenate read characters until newline.
-            Manage req_timeout input UDS P4 timer.
-            Manage send_receive_forward()
-            returns a normalized string command
+        Echo received data to the port, if echo is enabled (ATE1).
+        :param c: bytes to echo
+        :return: False if the device cannot be written, otherwise True.
+        """
+        if not c or not self.counters.echo:
+            return True
+        if self.sock_inet:
+            if self.sock_conn:
+                self.sock_conn.sendall(c)
+            return True
+        if self.serial_fd and self.serial_port:
+            self.serial_fd.write(c)
+            return True
+        try:
+            os.write(self.master_fd, c)
+        except OSError as e:
+            # [Errno 9] Bad file descriptor/[Errno 5] Input/output error
+            if e.errno == errno.EBADF or e.errno == errno.EIO:
+                logging.debug("Read interrupted. Terminating.")
+                self.terminate()
+                return False
+            else:
+                logging.critical(
+                    "PANIC - Internal OSError in read(): %s",
+                    e, exc_info=True)
+                self.terminate()
+                return False
+        return True
+
+    def flush_echo(self):
         """
-        buffer = ""
-        first = True
+        Write the pending echo of the request, if any (ref.
+        normalized_read_line()).
+        """
+        if self.pending_echo:
+            self.write_to_device(b'')
 
+    def get_req_timeout(self):
+        """
+        Return the UDS P4 timer (inter byte time for tester request) in
+        seconds, configured through self.counters['req_timeout'].
+        """
         req_timeout = self.max_req_timeout
         try:
             req_timeout = float(self.counters['req_timeout'])
@@ -1165,41 +1599,88 @@ class Elm:
                               self.max_req_timeout
                               )
             self.counters['req_timeout'] = req_timeout
+        return req_timeout
+
+    def normalized_read_line(self):
+        """
+            Read the next newline delimited command invoking read_from_device()
+            Data are read in chunks of up to READ_BUFFER_SIZE bytes and split
+            into lines by self.framer; consumed data are echoed line by line,
+            so that ATE0 is honoured also for pipelined commands.
+            Manage req_timeout input UDS P4 timer.
+            Queue the command to the forwarder (ref. submit_forward())
+            returns a normalized string command
+        """
+        req_timeout = self.get_req_timeout()
+        self.framer.newline = self.newline
+        profiler = self.profiler
+        if profiler:
+            start = profiler.clock()
         while True:
+            buffer, raw = self.framer.pop()
+            if (raw and buffer is not None and self.counters.echo and
+                    not self.interbyte_out_delay and not self.throughput):
+                # the echo of a request is written with its response
+                self.pending_echo = raw
+                break
+            if raw and not self.echo_to_device(raw):
+                return None
+            if buffer is not None:
+                break
             prev_time = time.time()
-            c = self.read_from_device(1)
+            c = self.read_from_device(READ_BUFFER_SIZE, echo=False)
             if c is None:
                 return None
-            c = c.decode("utf-8", "ignore")
-            if prev_time + req_timeout < time.time() and first == False:
-                buffer = ""
+            if profiler:
+                start = profiler.clock()
+            if self.framer.feed(c, prev_time + req_timeout < time.time()):
                 logging.debug(
                     "'req_timeout' timeout while reading data: %s", c)
-            if c == '\r':
-                if self.newline:
-                    continue
-                break
-            if c == '\n':
-                if self.newline:
-                    break
-                continue  # ignore newlines
-            first = False
-            buffer += c
 
         try:
-            self.send_receive_forward((buffer + '\r').encode())
+            self.submit_forward((buffer + '\r').encode())
         except Exception as e:
             logging.error('Forward Write error: %s', e)
+        if profiler:
+            profiler.record(STAGE_READ, profiler.clock() - start)
         return buffer
 
     def write_to_device(self, i):
         """
         Write a response to the port (no data returned).
         Manage socket, serial or device output.
+        The pending echo of the request (ref. normalized_read_line()) is
+        written together with the response by a single sendmsg()/writev(),
+        unless a sleep occurred in between (ref. EchoTime).
         No return code.
-        :param i: encoded bytearray to be written
+        :param i: encoded bytes (or memoryview) to be written
         :return: (none)
         """
+        if self.recorder and i:
+            self.recorder.output(
+                self.session.session_id if self.session else 0, i)
+
+        # Wait for the transmission over the UART and the bus
+        if self.throughput and i:
+            delay = self.throughput.delay(
+                self.session.session_id if self.session else 0, i,
+                self.counters.get('cmd_proto'),
+                self.counters.get('cmd_iso_baud'), self.time.monotonic())
+            if delay:
+                self.time.sleep(delay)
+
+        # Process the client of a multi-client session
+        if self.session and self.session.writer:
+            if self.session.output:
+                self.session.output.write(i, self.interbyte_out_delay)
+            else:
+                self.session.writer(i)
+            return
+
+        fragments = None
+        if self.pending_echo:
+            fragments = (self.pending_echo, i) if i else (self.pending_echo,)
+            self.pending_echo = None
 
         # Process inet
         if self.sock_inet:
@@ -1208,11 +1689,15 @@ class Elm:
                 return
             try:
                 if self.interbyte_out_delay:
-                    for j in i:
-                        self.sock_conn.sendall(bytes([j]))
-                        time.sleep(self.interbyte_out_delay)
+                    for chunk, duration in paced_chunks(
+                            i, self.interbyte_out_delay):
+                        self.sock_conn.sendall(chunk)
+                        time.sleep(duration)
+                elif fragments and hasattr(self.sock_conn, 'sendmsg'):
+                    write_vectored(self.sock_conn.sendmsg, fragments)
                 else:
-                    self.sock_conn.sendall(i)
+                    self.sock_conn.sendall(
+                        b''.join(fragments) if fragments else i)
             except BrokenPipeError:
                 logging.error("Connection dropped.")
             return
@@ -1223,12 +1708,14 @@ class Elm:
             # Serial COM port (uses pySerial)
             try:
                 if self.interbyte_out_delay:
-                    for j in i:
-                        self.serial_fd.write(bytes([j]))
+                    for chunk, duration in paced_chunks(
+                            i, self.interbyte_out_delay):
+                        self.serial_fd.write(chunk)
                         self.serial_fd.flush()
-                        time.sleep(self.interbyte_out_delay)
+                        time.sleep(duration)
                 else:
-                    self.serial_fd.write(i)
+                    self.serial_fd.write(
+                        b''.join(fragments) if fragments else i)
             except Exception:
                 logging.debug(
                     'Error while writing to %s', self.get_port_name())
@@ -1243,12 +1730,17 @@ class Elm:
                 return
             try:
                 if self.interbyte_out_delay:
-                    for j in i:
-                        os.write(self.master_fd, bytes([j]))
-                        os.fsync(self.master_fd)
-                        time.sleep(self.interbyte_out_delay)
+                    for chunk, duration in paced_chunks(
+                            i, self.interbyte_out_delay):
+                        os.write(self.master_fd, chunk)  # unbuffered
+                        time.sleep(duration)
+                elif fragments and hasattr(os, 'writev'):
+                    write_vectored(
+                        functools.partial(os.writev, self.master_fd),
+                        fragments)
                 else:
-                    os.write(self.master_fd, i)
+                    os.write(self.master_fd,
+                             b''.join(fragments) if fragments else i)
             except OSError as e:
                 # [Errno 9] Bad file descriptor/[Errno 5] Input/output error
                 if e.errno == errno.EBADF or e.errno == errno.EIO:
@@ -1282,17 +1774,15 @@ class Elm:
         :return: string including the formatted UDS answer
         """
         answer = ""
-        if request_header is None and "cmd_set_header" in self.counters:
-            request_header = self.counters['cmd_set_header']
+        if request_header is None:
+            request_header = self.counters.header
         request_header = (request_header or '').translate(
             (request_header or '').maketrans('', '', string.whitespace)).upper()
         if not request_header:
             logging.error('Invalid request header; request %s', repr(data))
             return ""
         try:
-            length = len(bytearray.fromhex(data))
-            data = (sp.join('{:02x}'.format(x)
-                            for x in bytearray.fromhex(data)).upper())
+            payload = bytes.fromhex(data)
         except ValueError:
             logging.error('Invalid data in answer: %s', repr(data))
             return ""
@@ -1306,95 +1796,41 @@ class Elm:
         if len(request_header) == 3 and is_flow_control:  # 11 bit header + FC
             if use_headers:
                 answer = answer_header + sp
-            answer += is_flow_control + sp + data
-        elif len(request_header) == 3:  # ISO-TP 11 bit CAN identifier
-            if use_headers:
-                if length > 7:  # produce a multframe output
-                    answer = (answer_header +
-                              sp + "10" + sp + "%02X" % length + sp)
-                    bytes_to_add = 6
-                    answer += data[:(3 if sp else 2) * bytes_to_add] + nl
-                    remaining_length = length - bytes_to_add
-                    remaining_data = data[(3 if sp else 2) * bytes_to_add:]
-                    bytes_to_add += 1
-                    frame_count = 1
-                    while remaining_length > 0:
-                        if frame_count == 0x10:
-                            frame_count = 0
-                        answer += (answer_header
-                                   + sp + "%02X" % (frame_count + 0x20) + sp)
-                        remaining_length -= bytes_to_add
-                        answer += (remaining_data[
-                                   :(3 if sp else 2) * bytes_to_add] + nl)
-                        remaining_data = remaining_data[
-                            (3 if sp else 2) * bytes_to_add:]
-                        frame_count += 1
-                    answer = answer.rstrip(sp + nl)
-                else:
-                    answer = answer_header + sp + "%02X" % length + sp + data
-            else:
-                if length > 7:  # produce a multframe output
-                    if ('cmd_caf' in self.counters and
-                            not self.counters[
-                                'cmd_caf']):  # PCI byte in requests
-                        answer = "10" + sp + "%02X" % length + sp
-                        pci = True
-                    else:
-                        pci = False
-                        answer = "%03X" % length + nl + "0: "
-                    bytes_to_add = 6
-                    answer += data[:(3 if sp else 2) * bytes_to_add] + nl
-                    remaining_length = length - bytes_to_add
-                    remaining_data = data[(3 if sp else 2) * bytes_to_add:]
-                    bytes_to_add += 1
-                    frame_count = 1
-                    while remaining_length > 0:
-                        if frame_count == 0x10:
-                            frame_count = 0
-                        if pci:
-                            answer += "%02X" % (frame_count + 0x20) + sp
-                        else:
-                            answer += "%01X" % frame_count + ": "
-                        remaining_length -= bytes_to_add
-                        answer += (remaining_data[
-                                   :(3 if sp else 2) * bytes_to_add] + nl)
-                        remaining_data = remaining_data[
-                            (3 if sp else 2) * bytes_to_add:]
-                        frame_count += 1
-                    answer = answer.rstrip(sp + nl)
-                else:
-                    if ('cmd_caf' in self.counters and
-                            not self.counters[
-                                'cmd_caf']):  # PCI byte in requests
-                        answer = "%02X" % length + sp + data
-                    else:
-                        answer = data
-        elif len(request_header) == 6 and is_flow_control:  # KWP2000 FC
+            return (answer + is_flow_control + sp +
+                    sp.join([HEX_BYTE[x] for x in payload]) + sp + nl)
+        if len(request_header) == 3:  # ISO-TP 11 bit CAN identifier
+            return encode_iso_tp(
+                payload, answer_header, use_headers,
+                self.counters.pci, sp, nl)  # PCI byte in requests with ATCAF0
+        if len(request_header) == 6 and is_flow_control:  # KWP2000 FC
             logging.error(
                 'KWP2000 format with flow control: unimplemented case.')
             return ""
-        elif len(request_header) == 6:  # KWP2000 encoding including length and checksum
+        if len(request_header) == 6:  # KWP2000 encoding including length and checksum
             if not use_headers:
                 logging.error(
                     'KWP2000 format without headers: unimplemented case.')
                 return ""
-            if length < MIN_SIZE_UDS_LENGTH:
-                answer = (("%02X" % (128 + length) + sp +
-                           request_header[4:6] + sp +
-                           request_header[2:4]) + sp + data)
+            answer = encode_kwp(
+                payload, request_header, sp, nl, MIN_SIZE_UDS_LENGTH)
+            if answer is not None:
+                return answer
+            # the length cannot be encoded in a byte: no checksum
+            data = sp.join([HEX_BYTE[x] for x in payload])
+            if len(payload) < MIN_SIZE_UDS_LENGTH:
+                answer = ("%02X" % (128 + len(payload)) + sp +
+                          request_header[4:6] + sp +
+                          request_header[2:4] + sp + data)
             else:
                 answer = ("80" + sp +  # Extra length byte follows
                           request_header[4:6] + sp +
                           request_header[2:4] + sp +
-                          "%02X" % length + sp + data)
-            try:  # calculate checksum
-                answer += sp + "%02X" % (sum(bytearray.fromhex(answer)) % 256)
-            except ValueError as e:
-                logging.error("Error in generated answer %s from HEX data "
-                              "%s with header %s: %s",
-                              answer, repr(data), repr(request_header), e)
-        else:
-            logging.error('Invalid request header: %s', repr(request_header))
+                          "%02X" % len(payload) + sp + data)
+            logging.error("Error in generated answer %s from HEX data "
+                          "%s with header %s: invalid length",
+                          answer, repr(data), repr(request_header))
+            return answer + sp + nl
+        logging.error('Invalid request header: %s', repr(request_header))
         return answer + sp + nl
 
     def handle_response(self,
@@ -1415,125 +1851,145 @@ class Elm:
         :return: computed response, or empty (no output) or None (error).
         """
 
-        logging.debug("Processing: %s", repr(resp))
-
-        # Compute cra_pattern (ATCRA filter)
-        cra_pattern = r'[0-9A-F]+'
-        cra = self.counters["cmd_cra"] if "cmd_cra" in self.counters else None
-        if cra:
-            cra_pattern = (r'^' + cra
-                           .replace('X', '[0-9A-F]').replace('W', '[0-9A-F]+')
-                           + r'$')
-
-        # Compute use_headers
-        use_headers = ("cmd_use_header" in self.counters and
-                       self.counters["cmd_use_header"])
-
-        # Compute sp (space)
-        if ('cmd_spaces' in self.counters
-                and self.counters['cmd_spaces'] == 0):
-            sp = ''
-        else:
-            sp = ' '
-
-        # Compute nl (newline)
-        nl_type = {
-            0: "\r",
-            1: "\r\n",
-            2: "\n",
-            3: "\r",
-            4: "\r\n",
-            5: "\n"
-        }
-        nl = "\r"
-        if 'cmd_linefeeds' in self.counters:
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logging.debug("Processing: %r", resp)
+        profiler = self.profiler
+        if profiler:
+            start = profiler.clock()
+
+        # Settings of the session (ATCRA, ATH, ATS, ATL)
+        counters = self.counters
+        cra_pattern = counters.cra_pattern
+        use_headers = counters.use_headers
+        sp = counters.sp
+        nl = counters.nl
+
+        # Use the cached output of a static response, with its encoding
+        template = compile_response(resp)
+        encoded = None
+        if template.static:
+            key = (resp, sp, nl, use_headers, cra_pattern,
+                   counters.no_prompt_nl)
+            if template.uses_request:
+                key += (request_header, request_data,
+                        counters.get('cmd_caf'), counters.header)
             try:
-                nl = nl_type[int(self.counters['cmd_linefeeds'])]
-            except Exception:
-                logging.error(
-                    'Invalid "cmd_linefeeds" value: %s.',
-                    repr(self.counters['cmd_linefeeds']))
+                answ, encoded = self.rendered_responses[key]
+            except KeyError:
+                answ = self.render_response(
+                    template, resp, do_write, request_header, request_data,
+                    cra_pattern, use_headers, sp, nl)
+                if answ:
+                    encoded = answ.encode()
+                if len(self.rendered_responses) >= MAX_RENDERED_RESPONSES:
+                    self.rendered_responses.clear()
+                self.rendered_responses[key] = answ, encoded
+        else:
+            answ = self.render_response(
+                template, resp, do_write, request_header, request_data,
+                cra_pattern, use_headers, sp, nl)
+        if profiler:
+            profiler.record(STAGE_RENDER, profiler.clock() - start)
+        if answ is None:
+            if debug:
+                logging.debug(
+                    'Null response received after processing "%s".', resp)
+            return None
+        if do_write and answ:
+            if debug:
+                logging.debug("Write: %r", answ)
+            self.write_to_device(encoded or answ.encode())
+        return answ
 
-        # Generate string
-        incomplete_resp = False
-        root = None
-        resp = resp.replace('\x00', '\\x00').replace('\x0d', '&#13;')
-        try:
-            root = fromstring('<xml>' + resp + '</xml>')
-            s = iter(root)
-        except ParseError as e:
-            incomplete_resp = True
+    def render_response(self, template, resp, do_write, request_header,
+                        request_data, cra_pattern, use_headers, sp, nl):
+        """
+        Render a compiled response template (ref. handle_response()).
+        Data is written to the device only by <exec> tags (the rendered
+        response is written by the caller). The rendered fragments are
+        joined once, when the response is completed or before an <exec>.
+        :return: rendered response, or empty (error) or None (no output).
+        """
+        incomplete_resp = template.error is not None
+        if incomplete_resp:
             logging.error(
-                'Wrong response format for "%s"; %s', resp, e)
-        answ = root.text.strip() if root is not None and root.text else ""
+                'Wrong response format for "%s"; %s',
+                template.resp, template.error)
+        parts = []  # fragments of the response
+        append = parts.append
         answers = False
-        i = None
-
-        while not incomplete_resp:
-            try:
-                i = next(s)
-            except StopIteration:
-                answ += i.tail.strip() if i is not None and i.tail else ""
-                break
-            if i.tag.lower() == 'rh':
-                request_header = (i.text or "")
-            elif i.tag.lower() == 'rd':
-                request_data = (i.text or "")
-            elif i.tag.lower() == 'string':
-                answ += (i.text or "")
-            elif i.tag.lower() == 'writeln':
-                answ += (i.text or "") + nl
-            elif i.tag.lower() == 'space':
-                answ += (i.text or "") + sp
-            elif (i.tag.lower() == 'eval' or
-                  i.tag.lower() == 'exec'):
-                answ = answ.replace('\\x00', '\x00')
-                logging.debug("Write: %s", repr(answ))
-                if i.tag.lower() == 'exec' and do_write:
+        completed = True
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        for op in template.ops:
+            code = op[0]
+            if code == OP_TEXT or code == OP_STRING:
+                append(op[1])
+            elif code == OP_RH:
+                request_header = op[1]
+            elif code == OP_RD:
+                request_data = op[1]
+            elif code == OP_WRITELN:
+                append(op[1])
+                append(nl)
+            elif code == OP_SPACE:
+                append(op[1])
+                append(sp)
+            elif code == OP_EVAL:
+                answ = ''.join(parts).replace('\\x00', '\x00')
+                if debug:
+                    logging.debug("Write: %r", answ)
+                if op[1] and do_write:  # <exec>
                     self.write_to_device(answ.encode())
                     answ = ""
-                if i.text is None:
+                parts[:] = (answ,) if answ else ()
+                msg, snippet = op[2], op[3]
+                if msg is None:
                     continue
-                msg = i.text.strip()
-                if msg:
+                if not msg:
+                    logging.debug(
+                        "Missing command to execute: %s", template.resp)
+                elif snippet is None:
+                    logging.error("Cannot execute '%s': invalid code", msg)
+                else:
                     try:
-                        evalmsg = eval(msg)
-                        logging.debug(
-                            "Evaluated command: %s -> %s",
-                            msg, repr(evalmsg))
-                        if evalmsg != None:
-                            answ += str(evalmsg)
-                    except Exception:
-                        try:
-                            exec(msg, globals())
+                        evalmsg = snippet.run(
+                            self=self,
+                            request_header=request_header,
+                            request_data=request_data,
+                            time=self.time)
+                        if debug and snippet.is_expression:
+                            logging.debug(
+                                "Evaluated command: %s -> %r", msg, evalmsg)
+                        elif debug:
                             logging.debug("Executed command: %s", msg)
-                        except Exception as e:
-                            logging.error("Cannot execute '%s': %s", msg, e)
-                else:
-                    logging.debug(
-                        "Missing command to execute: %s", resp)
-
-            elif i.tag.lower() == 'flow':
-                answ += self.uds_answer(data=i.text or "",
-                                        request_header=request_header,
-                                        use_headers=use_headers,
-                                        cra_pattern=cra_pattern,
-                                        sp=sp,
-                                        nl=nl,
-                                        is_flow_control='30')
-
-            elif i.tag.lower() == 'answer':
-                answ += self.uds_answer(data=i.text or "",
-                                        request_header=request_header,
-                                        use_headers=use_headers,
-                                        cra_pattern=cra_pattern,
-                                        sp=sp,
-                                        nl=nl)
-            elif i.tag.lower() == 'pos_answer' or i.tag.lower() == 'neg_answer':
+                        if evalmsg != None:
+                            append(str(evalmsg))
+                    except Exception as e:
+                        logging.error("Cannot execute '%s': %s", msg, e)
+            elif code == OP_FLOW:
+                append(self.uds_answer(data=op[1],
+                                       request_header=request_header,
+                                       use_headers=use_headers,
+                                       cra_pattern=cra_pattern,
+                                       sp=sp,
+                                       nl=nl,
+                                       is_flow_control='30'))
+            elif code == OP_ANSWER:
+                append(self.uds_answer(data=op[1],
+                                       request_header=request_header,
+                                       use_headers=use_headers,
+                                       cra_pattern=cra_pattern,
+                                       sp=sp,
+                                       nl=nl))
+            elif code == OP_POS_ANSWER or code == OP_NEG_ANSWER:
+                tag = op[2]
                 if not request_data:
                     logging.error(
                         'Missing request with <%s> tag: %s.',
-                        i.tag.lower(), repr(resp))
+                        tag, repr(template.resp))
+                    completed = False
                     break
 
                 # Calculate uds_pos_answ for uds_pos_answer
@@ -1554,9 +2010,10 @@ class Elm:
                 except:
                     uds_pos_answ = None
 
-                if i.tag.lower() == 'pos_answer' and uds_pos_answ is None:
+                if code == OP_POS_ANSWER and uds_pos_answ is None:
                     logging.error(
-                        'Invalid <%s> tag: %s.', i.tag.lower(), repr(resp))
+                        'Invalid <%s> tag: %s.', tag, repr(template.resp))
+                    completed = False
                     break
                 try:
                     request_data = (''.join('{:02x}'.format(x)
@@ -1565,94 +2022,59 @@ class Elm:
                 except ValueError as e:
                     logging.error('Invalid request %s related to response %s '
                                   'including <%s> tag: %s',
-                                  repr(request_data), repr(resp),
-                                  i.tag.lower(), e)
+                                  repr(request_data), repr(template.resp),
+                                  tag, e)
                     return ""
-                if i.tag.lower() == 'pos_answer':
+                if code == OP_POS_ANSWER:
                     data = ("%02X" % (bytearray.fromhex(request_data[:2])[0]
                                       | 0x40) +
-                            uds_pos_answ + (i.text or ""))
+                            uds_pos_answ + op[1])
                 else:  # Generate a negative response UDS SID
-                    data = "7F" + sp + request_data[:2] + (i.text or "")
-                answ += self.uds_answer(data=data,
-                                        request_header=request_header,
-                                        use_headers=use_headers,
-                                        cra_pattern=cra_pattern,
-                                        sp=sp,
-                                        nl=nl)
-
-            elif i.tag.lower() == 'header':
+                    data = "7F" + sp + request_data[:2] + op[1]
+                append(self.uds_answer(data=data,
+                                       request_header=request_header,
+                                       use_headers=use_headers,
+                                       cra_pattern=cra_pattern,
+                                       sp=sp,
+                                       nl=nl))
+            elif code == OP_HEADER:
+                _, header, uc_header, size, data, unspaced_data, is_data = op
                 answers = True
-                incomplete_resp = True
-                try:
-                    size = next(s)
-                    data = next(s)
-                except StopIteration:
-                    logging.error(
-                        'Missing <size> or <data>/<subd> tags '
-                        'after <header> tag in %s.', repr(resp))
-                    break
-                # check that the tags are valid
-                if (size.tag.lower() != 'size' or
-                        (data.tag.lower() != 'data' and
-                         data.tag.lower() != 'subd')):
-                    logging.error(
-                        'In %s, <size> and <data>/<subd> tags '
-                        'must follow the <header> tag.', repr(resp))
-                    break
-
-                # check validity of the content fields
-                try:
-                    int_size = int(size.text, 16)
-                except ValueError as e:
-                    logging.error(
-                        'Improper size %s for response %s: %s.',
-                        repr(size.text), repr(resp), e)
-                    break
-                if not data.text:
-                    logging.error('Missing data for response %s.',
-                                  repr(resp))
-                    break
-                unspaced_data = (data.text or "").translate(
-                    (data.text or "").maketrans('', '', string.whitespace))
-                if int_size < 16 and len(unspaced_data) != int_size * 2:
-                    logging.error(
-                        'In response %s, mismatch between number of data '
-                        'digits %s and related length field %s.',
-                        repr(resp), repr(data.text), repr(size.text))
-                    break
-                incomplete_resp = False
-                if re.match(cra_pattern, i.text.upper()):
-                    # concatenate answ from header, size and data/subd
-                    answ += ((((i.text or "") + sp + (size.text or "") + sp)
-                              if use_headers else "") +
-                             ((data.text or "") if sp else unspaced_data) +
-                             sp + (nl if data.tag.lower() == 'data' else ""))
-                else:
+                if re.match(cra_pattern, uc_header):
+                    # answer from header, size and data/subd
+                    if use_headers:
+                        append(header)
+                        append(sp)
+                        append(size)
+                        append(sp)
+                    append(data if sp else unspaced_data)
+                    append(sp)
+                    if is_data:
+                        append(nl)
+                elif debug:
                     logging.debug(
                         'Skipping answer which does not match ATCRA: '
-                        'header=%s, cra_pattern=%s.',
-                        repr(i.text), repr(cra_pattern))
-            else:
+                        'header=%r, cra_pattern=%r.', header, cra_pattern)
+            elif code == OP_ABORT:
+                logging.error(op[1], *op[2])
+                answers = True
+                incomplete_resp = True
+                completed = False
+                break
+            else:  # OP_UNKNOWN
                 logging.error(
-                    'Unknown tag "%s" in response "%s"', i.tag, resp)
-            answ += i.tail.strip() if i is not None and i.tail else ""
-        if incomplete_resp or (answers and not answ):
-            answ = "NO DATA" + nl
-        if not answ:
-            logging.debug(
-                'Null response received after processing "%s".', resp)
+                    'Unknown tag "%s" in response "%s"', op[1], template.resp)
+        if completed and not incomplete_resp:
+            append(template.final_tail)
+        if incomplete_resp or (answers and not any(parts)):
+            parts = ["NO DATA", nl]
+        elif not any(parts):
             return None
-        if ('cmd_linefeeds' in self.counters and
-                self.counters['cmd_linefeeds'] > 2):
-            answ += ">"
+        if self.counters.no_prompt_nl:
+            parts.append(">")
         else:
-            answ += nl + ">"
-        answ = answ.replace('\\x00', '\x00')
-        if do_write:
-            logging.debug("Write: %s", repr(answ))
-            self.write_to_device(answ.encode())
-        return answ
+            parts.append(nl + ">")
+        return ''.join(parts).replace('\\x00', '\x00')
 
     def task_action(
             self, header, ecu, do_write, task_method, cmd, length, frame,
@@ -1770,6 +2192,10 @@ class Elm:
         """
 
         org_cmd = cmd
+        profiler = self.profiler
+        if profiler:
+            start = profiler.clock()
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         # Sanitize cmd (request has all unspaced uppercase chars)
         cmd = (cmd or '').translate(
             (cmd or '').maketrans('', '', string.whitespace)).upper()
@@ -1782,6 +2208,39 @@ class Elm:
 
         # *****************************************
 
+        # cmd_can is experimental (to be removed)
+        if ('cmd_can' in self.counters and
+                self.counters['cmd_can']
+                and is_hex_sp(cmd[:3])):
+            self.counters['cmd_set_header'] = cmd[:3]
+            header = cmd[:3]
+            self.counters['cmd_caf'] = False
+            self.counters['cmd_use_header'] = True
+            cmd = cmd[3:]
+
+        # Set header and ecu
+        ecu = None
+        header = self.counters.header
+        if header is not None:
+            if len(header) == 6:
+                ecu = header[2:]
+            else:
+                ecu = header
+
+        # Manage the UDS P2 delay timer
+        if debug:
+            logging.debug("Handling: %r, header %r, ECU %r", cmd, header, ecu)
+        if self.delay > 0:
+            self.time.sleep(self.delay)
+
+        if len(org_cmd) > 1 and cmd[1] == 'T' and org_cmd.upper()[1] != 'T':
+            # AT or ST shall be unspaced
+            logging.error("Improper AT or ST command %s.", repr(org_cmd))
+            return header, cmd, ""
+
+        if self.scenario not in self.ObdMessage:
+            logging.error("Unknown scenario %s", repr(self.scenario))
+            return header, cmd, ""
         # Handle custom PIDs for gear and gear position
         if cmd == "010C":  # Engine RPM
             rpm = self.car.rpm
@@ -1813,40 +2272,6 @@ class Elm:
             response = f"41 21 {obd_gear_hex}"
             return header, cmd, response
 
-        # cmd_can is experimental (to be removed)
-        if ('cmd_can' in self.counters and
-                self.counters['cmd_can']
-                and is_hex_sp(cmd[:3])):
-            self.counters['cmd_set_header'] = cmd[:3]
-            header = cmd[:3]
-            self.counters['cmd_caf'] = False
-            self.counters['cmd_use_header'] = True
-            cmd = cmd[3:]
-
-        # Set header and ecu
-        header = None
-        ecu = None
-        if "cmd_set_header" in self.counters:
-            header = self.counters['cmd_set_header']
-            if len(header) == 6:
-                ecu = header[2:]
-            else:
-                ecu = header
-
-        # Manage the UDS P2 delay timer
-        logging.debug("Handling: %s, header %s, ECU %s",
-                      repr(cmd), repr(header), repr(ecu))
-        if self.delay > 0:
-            time.sleep(self.delay)
-
-        if len(org_cmd) > 1 and cmd[1] == 'T' and org_cmd.upper()[1] != 'T':
-            # AT or ST shall be unspaced
-            logging.error("Improper AT or ST command %s.", repr(org_cmd))
-            return header, cmd, ""
-
-        if self.scenario not in self.ObdMessage:
-            logging.error("Unknown scenario %s", repr(self.scenario))
-            return header, cmd, ""
         # Handle PID 0105 (Engine Coolant Temperature)
         if cmd == "0105":
             # Get the current engine temperature from the database
@@ -1886,20 +2311,10 @@ class Elm:
             else:
                 cmd = r_cont
         else:  # create the ECU task and shared namespace for the ECU
-            plugin = None
-            for i in self.plugins:
-                i_pattern = (r'^' +
-                             i.upper()
-                             .replace('X', '[0-9A-F]')
-                             .replace('W', '[0-9A-F]+') +
-                             r'$')
-                if (i.startswith(ECU_TASK) and
-                        re.match(i_pattern, ECU_TASK.upper() + ecu)):
-                    plugin = i
-                    break
+            plugin = self.plugins.ecu_task(ecu)
             try:  # use the plugin if existing, else directly use EcuTasks()
                 if plugin:
-                    self.task_shared_ns[ecu] = self.plugins[plugin].Task(
+                    self.task_shared_ns[ecu] = plugin.Task(
                         emulator=self, pid=None, header=header, ecu=ecu,
                         request=cmd, attrib=None, do_write=do_write)
                 else:  # Create a default ECU task
@@ -1962,8 +2377,7 @@ class Elm:
                             ecu,
                             e, exc_info=True)
             self.request_timer[ecu] = time.time()
-        if ('cmd_caf' in self.counters and
-                not self.counters['cmd_caf'] and  # PCI byte in requests
+        if (self.counters.pci and  # PCI byte in requests
                 is_hex_sp(cmd)):  # not AT or ST command
             try:
                 int_size = int(size, 16)
@@ -1984,9 +2398,10 @@ class Elm:
                         return header, cmd, ""
                     cmd = payload[:int_size * 2]
                     length = int_size
-                    logging.debug(
-                        "Single-Frame. Length: %s, frame: %s, header: %s, "
-                        "cmd: %s", length, frame, header, cmd)
+                    if debug:
+                        logging.debug(
+                            "Single-Frame. Length: %s, frame: %s, header: %s, "
+                            "cmd: %s", length, frame, header, cmd)
                 else:
                     logging.error('Invalid ISO-TP Single frame with size '
                                   'greater than 7 bytes. %s',
@@ -1995,12 +2410,13 @@ class Elm:
             elif size[0] == '1':  # E.g., 10 = first frame of an ISO-TP Multiframe Request
                 try:
                     length = int(cmd[1:4], 16)  # read ISO-TP Multiframe length
-                    logging.debug(
-                        'ISO-TP Multiframe message with length 0x%s = (int) %s '
-                        '(message %s)', repr(cmd[1:4]), length, repr(cmd))
-                    logging.debug(
-                        "First-Frame. Length: %s, frame: %s, header: %s, "
-                        "cmd: %s", length, frame, header, cmd)
+                    if debug:
+                        logging.debug(
+                            'ISO-TP Multiframe message with length 0x%r = '
+                            '(int) %s (message %r)', cmd[1:4], length, cmd)
+                        logging.debug(
+                            "First-Frame. Length: %s, frame: %s, header: %s, "
+                            "cmd: %s", length, frame, header, cmd)
                 except ValueError as e:
                     logging.error('Improper size %s for request %s: %s',
                                   repr(cmd[2:4]), repr(org_cmd), e)
@@ -2013,9 +2429,10 @@ class Elm:
                     frame = -1  # Marker for ISO-TP Multiframe() to detect a recycle
                 if 32 < int_size < 48:  # from 21 to 2F
                     frame = int_size - 32  # compute the multiframe count
-                logging.debug(
-                    "Consecutive-Frame. Length: %s, frame: %s, header: %s, "
-                    "cmd: %s", length, frame, header, cmd)
+                if debug:
+                    logging.debug(
+                        "Consecutive-Frame. Length: %s, frame: %s, header: %s, "
+                        "cmd: %s", length, frame, header, cmd)
             elif size[0] == '3':  # E.g., from 30 on = flow control of a ISO-TP Multiframe Request
                 try:
                     self.shared.flow_control_fc_flag = int(size[1])
@@ -2044,7 +2461,7 @@ class Elm:
                                   240) * 100)
                     logging.debug(
                         'Sleeping for %s milliseconds', sleep)
-                    time.sleep(sleep / 1000)
+                    self.time.sleep(sleep / 1000)
                 elif self.shared.flow_control_fc_flag == 2:  # 2 = Overflow/abort
                     logging.error('Overflow-abort received in ISO-TP '
                                   'Flow-control-Frame. %s', repr(org_cmd))
@@ -2123,183 +2540,181 @@ class Elm:
             return header, cmd, ""
 
         # Process response for data stored in cmd
-        i_obd_msg = iter(self.sortedOBDMsg)
+        i_obd_msg = iter(self.get_dispatch_index().match(cmd))
         chained_command = 0
         while True:
             try:
-                key, val = next(i_obd_msg)
+                entry = next(i_obd_msg)
             except StopIteration:
                 break
-            uc_val = {k.upper(): v for k, v in val.items()}
-            if ('REQUEST' in uc_val and
-                    re.match(uc_val['REQUEST'], cmd)):
-                if ('HEADER' in uc_val and header and
-                        uc_val['HEADER'].upper() !=
-                        self.counters["cmd_set_header"]):
-                    continue
-                pid = key if key else 'UNKNOWN'
-                self.counters["cmd_last_pid"] = pid
-                if pid not in self.counters:
-                    self.counters[pid] = 0
-                self.counters[pid] += 1
-                # Handle PID 0105 (Engine Coolant Temperature)
-                if pid == "0105":
-                    # Get the current engine temperature from the database
-                    # Default to 70°C if not set
-                    temp = self.database.get("engine_temp", 70)
-
-                    # Convert temperature to OBD-II format (offset by 70°C)
-                    obd_temp = int(temp) - 70
-                    obd_temp_hex = f"{obd_temp:02X}"  # Convert to 2-digit hex
-
-                    # Format the OBD-II response (41 05 <temperature>)
-                    response = f"41 05 {obd_temp_hex}"
-                    return header, cmd, response
-
-                if 'ACTION' in uc_val and uc_val['ACTION'] == 'skip':
-                    logging.info("Received %s. PID %s. Action=%s", cmd, pid,
-                                 uc_val['ACTION'])
-                    continue
-                if 'DESCR' in uc_val:
+            key, uc_val = entry.pid, entry.uc_val
+            if ('HEADER' in uc_val and header and
+                    uc_val['HEADER'].upper() !=
+                    self.counters["cmd_set_header"]):
+                continue
+            pid = key if key else 'UNKNOWN'
+            self.counters["cmd_last_pid"] = pid
+            self.counters.pids.hit(entry.counter_slot)
+            self.pid_stats.hit(entry.counter_slot)
+            if profiler:
+                profiler.matched(pid, start)
+            # Handle PID 0105 (Engine Coolant Temperature)
+            if pid == "0105":
+                # Get the current engine temperature from the database
+                # Default to 70°C if not set
+                temp = self.database.get("engine_temp", 70)
+
+                # Convert temperature to OBD-II format (offset by 70°C)
+                obd_temp = int(temp) - 70
+                obd_temp_hex = f"{obd_temp:02X}"  # Convert to 2-digit hex
+
+                # Format the OBD-II response (41 05 <temperature>)
+                response = f"41 05 {obd_temp_hex}"
+                return header, cmd, response
+
+            if 'ACTION' in uc_val and uc_val['ACTION'] == 'skip':
+                logging.info("Received %s. PID %s. Action=%s", cmd, pid,
+                             uc_val['ACTION'])
+                continue
+            if 'DESCR' in uc_val:
+                if debug:
                     logging.debug("Description: %s, PID %s (%s)",
                                   uc_val['DESCR'], pid, cmd)
-                else:
-                    logging.warning(
-                        "Internal error - Missing description for %s, PID %s",
-                        cmd, pid)
-                if pid in self.answer:
-                    try:
-                        return header, cmd, self.answer[pid]
-                    except Exception as e:
-                        logging.error(
-                            "Error while processing '%s' for PID %s (%s)",
-                            self.answer, pid, e)
-                if 'TASK' in uc_val:
-                    if uc_val['TASK'] not in self.plugins:
-                        logging.error(
-                            'Unexisting plugin %s for pid %s',
-                            repr(uc_val['TASK']), repr(pid))
-                        return header, cmd, None
-                    if uc_val['TASK'].startswith('task_ecu_'):
-                        logging.error(
-                            'ECU Tasks are not expected to be run by '
-                            'standard requests. Plugin %s, pid %s',
-                            repr(uc_val['TASK']), repr(pid))
-                        return header, cmd, None
-                    if ecu not in self.tasks:
-                        self.tasks[ecu] = []
-                    if len(self.tasks[ecu]) > MAX_TASKS:
-                        logging.critical(
-                            'Too many active tasks for ECU %s. '
-                            'Latest one was %s.',
-                            ecu, self.tasks[ecu][-1].__module__)
-                        return header, cmd, ""
-                    try:
-                        self.tasks[ecu].append(
-                            self.plugins[uc_val['TASK']].Task(
-                                emulator=self, pid=pid, header=header, ecu=ecu,
-                                request=cmd, attrib=uc_val, do_write=do_write)
-                        )
-                    except Exception as e:
-                        logging.critical(
-                            'Cannot add task "%s", ECU="%s": %s',
-                            uc_val['TASK'], ecu, e, exc_info=True)
-                        return header, cmd, None
-                    logging.debug('Starting task "%s" for ECU "%s"',
-                                  self.tasks[ecu][-1].__module__, ecu)
-                    r_cmd, *_, r_cont = self.task_action(
-                        header, ecu, do_write,
-                        self.tasks[ecu][-1].start, cmd, length, frame,
-                        is_ecu=False)
-                    if r_cont is None:
-                        return header, cmd, r_cmd
-                    else:  # chain a subsequent command
-                        if cmd == r_cont:  # no transformation performed
-                            logging.debug(
-                                'Passthrough task executed: '
-                                'continue processing %s for ECU %s.',
-                                cmd, ecu)
-                        else:  # newly reprocess the changed request
-                            chained_command += 1
-                            if chained_command > MAX_TASKS:
-                                logging.critical(
-                                    'Too many subsequent chained commands '
-                                    'for ECU %s. Latest task was %s.',
-                                    ecu, uc_val['TASK'])
-                                return header, cmd, ""
-                            cmd = r_cont
-                            i_obd_msg = iter(self.sortedOBDMsg)
-                            continue  # restart the loop from the beginning
-                if 'EXEC' in uc_val:
+            else:
+                logging.warning(
+                    "Internal error - Missing description for %s, PID %s",
+                    cmd, pid)
+            if pid in self.answer:
+                try:
+                    return header, cmd, self.answer[pid]
+                except Exception as e:
+                    logging.error(
+                        "Error while processing '%s' for PID %s (%s)",
+                        self.answer, pid, e)
+            if 'TASK' in uc_val:
+                if uc_val['TASK'] not in self.plugins:
+                    logging.error(
+                        'Unexisting plugin %s for pid %s',
+                        repr(uc_val['TASK']), repr(pid))
+                    return header, cmd, None
+                if uc_val['TASK'].startswith('task_ecu_'):
+                    logging.error(
+                        'ECU Tasks are not expected to be run by '
+                        'standard requests. Plugin %s, pid %s',
+                        repr(uc_val['TASK']), repr(pid))
+                    return header, cmd, None
+                if ecu not in self.tasks:
+                    self.tasks[ecu] = []
+                if len(self.tasks[ecu]) > MAX_TASKS:
+                    logging.critical(
+                        'Too many active tasks for ECU %s. '
+                        'Latest one was %s.',
+                        ecu, self.tasks[ecu][-1].__module__)
+                    return header, cmd, ""
+                try:
+                    self.tasks[ecu].append(
+                        self.plugins[uc_val['TASK']].Task(
+                            emulator=self, pid=pid, header=header, ecu=ecu,
+                            request=cmd, attrib=uc_val, do_write=do_write)
+                    )
+                except Exception as e:
+                    logging.critical(
+                        'Cannot add task "%s", ECU="%s": %s',
+                        uc_val['TASK'], ecu, e, exc_info=True)
+                    return header, cmd, None
+                logging.debug('Starting task "%s" for ECU "%s"',
+                              self.tasks[ecu][-1].__module__, ecu)
+                r_cmd, *_, r_cont = self.task_action(
+                    header, ecu, do_write,
+                    self.tasks[ecu][-1].start, cmd, length, frame,
+                    is_ecu=False)
+                if r_cont is None:
+                    return header, cmd, r_cmd
+                else:  # chain a subsequent command
+                    if cmd == r_cont:  # no transformation performed
+                        logging.debug(
+                            'Passthrough task executed: '
+                            'continue processing %s for ECU %s.',
+                            cmd, ecu)
+                    else:  # newly reprocess the changed request
+                        chained_command += 1
+                        if chained_command > MAX_TASKS:
+                            logging.critical(
+                                'Too many subsequent chained commands '
+                                'for ECU %s. Latest task was %s.',
+                                ecu, uc_val['TASK'])
+                            return header, cmd, ""
+                        cmd = r_cont
+                        i_obd_msg = iter(
+                            self.get_dispatch_index().match(cmd))
+                        continue  # restart the loop from the beginning
+            if 'EXEC' in uc_val:
+                try:
+                    if entry.exec_snippet is None:
+                        raise SyntaxError('invalid code')
+                    entry.exec_snippet.run(
+                        self=self, cmd=cmd, pid=pid, header=header, ecu=ecu,
+                        uc_val=uc_val, time=self.time)
+                except Exception as e:
+                    logging.error(
+                        "Cannot execute '%s' for PID %s (%s)",
+                        uc_val['EXEC'], pid, e, exc_info=True)
+            if entry.log_snippet:
+                try:
+                    entry.log_snippet.run(
+                        self=self, cmd=cmd, pid=pid, header=header, ecu=ecu,
+                        uc_val=uc_val, time=self.time)
+                except Exception as e:
+                    logging.error(
+                        "Error while logging '%s' for PID %s (%s)",
+                        entry.log_snippet, pid, e, exc_info=True)
+            if any(x in uc_val for x in
+                   ['RESPONSE', 'RESPONSEHEADER', 'RESPONSEFOOTER']):
+                r_header = ''
+                if 'RESPONSEHEADER' in uc_val:
                     try:
-                        exec(uc_val['EXEC'])
+                        r_header = uc_val['RESPONSEHEADER'](
+                            self, cmd, pid, uc_val)
                     except Exception as e:
                         logging.error(
-                            "Cannot execute '%s' for PID %s (%s)",
-                            uc_val['EXEC'], pid, e, exc_info=True)
-                log_string = ""
-                if 'INFO' in uc_val:
-                    log_string = "logging.info(%s)" % uc_val['INFO']
-                if 'WARNING' in uc_val:
-                    log_string = "logging.warning(%s)" % uc_val['WARNING']
-                if 'LOG' in uc_val:
-                    log_string = "logging.debug(%s)" % uc_val['LOG']
-                if log_string:
+                            "Error while running 'ResponseHeader' %s '"
+                            "for PID %s (%s)",
+                            uc_val['RESPONSEHEADER'], pid, e, exc_info=True)
+                r_footer = ''
+                if 'RESPONSEFOOTER' in uc_val:
                     try:
-                        exec(log_string)
+                        r_footer = uc_val['RESPONSEFOOTER'](
+                            self, cmd, pid, uc_val)
                     except Exception as e:
                         logging.error(
-                            "Error while logging '%s' for PID %s (%s)",
-                            log_string, pid, e, exc_info=True)
-                if any(x in uc_val for x in
-                       ['RESPONSE', 'RESPONSEHEADER', 'RESPONSEFOOTER']):
-                    r_header = ''
-                    if 'RESPONSEHEADER' in uc_val:
-                        try:
-                            r_header = uc_val['RESPONSEHEADER'](
-                                self, cmd, pid, uc_val)
-                        except Exception as e:
-                            logging.error(
-                                "Error while running 'ResponseHeader' %s '"
-                                "for PID %s (%s)",
-                                uc_val['RESPONSEHEADER'], pid, e, exc_info=True)
-                    r_footer = ''
-                    if 'RESPONSEFOOTER' in uc_val:
-                        try:
-                            r_footer = uc_val['RESPONSEFOOTER'](
-                                self, cmd, pid, uc_val)
-                        except Exception as e:
-                            logging.error(
-                                "Error while running 'ResponseFooter' %s '"
-                                "for PID %s (%s)",
-                                uc_val['RESPONSEHEADER'], pid, e, exc_info=True)
-                    r_response = ''
-                    if 'RESPONSE' in uc_val:
-                        r_response = uc_val['RESPONSE']
-                    if not any([r_response, r_header, r_footer]):
-                        return header, cmd, None
-                    if isinstance(r_response, (list, tuple)):
-                        r_response = self.choice(r_response)
-                    return header, cmd, r_header + r_response + r_footer
-                else:
-                    logging.error(
-                        "Internal error - Missing response for %s, PID %s",
-                        cmd, pid)
+                            "Error while running 'ResponseFooter' %s '"
+                            "for PID %s (%s)",
+                            uc_val['RESPONSEHEADER'], pid, e, exc_info=True)
+                r_response = ''
+                if 'RESPONSE' in uc_val:
+                    r_response = uc_val['RESPONSE']
+                if not any([r_response, r_header, r_footer]):
                     return header, cmd, None
+                if isinstance(r_response, (list, tuple)):
+                    r_response = self.choice(r_response)
+                return header, cmd, r_header + r_response + r_footer
+            else:
+                logging.error(
+                    "Internal error - Missing response for %s, PID %s",
+                    cmd, pid)
+                return header, cmd, None
         # Here cmd is unknown
-        if "unknown_" + repr(cmd) not in self.counters:
-            self.counters["unknown_" + repr(cmd)] = 0
-        self.counters["unknown_" + repr(cmd)] += 1
+        unknown_count = self.unknown_commands.add(cmd)
         if cmd == '':
             logging.info("No ELM command")
             return header, cmd, ""
         fw_data = self.send_receive_forward((cmd + '\r').encode())
         if fw_data is not False:
-            self.counters["unknown_" + repr(cmd) + "_R"] = repr(fw_data)
+            self.unknown_commands.set_answer(cmd, repr(fw_data))
         if (fw_data is not False and
                 re.match(r"^NO DATA *\r", fw_data or "") is None and
                 re.match(r"^\? *\r", fw_data or "") is None and
-                self.counters["unknown_" + repr(cmd)] == 1):
+                unknown_count == 1):
             logging.warning(
                 'Missing data in dictionary: %s. Answer:\n%s',
                 repr(cmd), repr(fw_data))
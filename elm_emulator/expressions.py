@@ -0,0 +1,104 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import builtins
+import logging
+import re
+import string
+import time
+
+# Builtins available to the Python snippets of the scenarios
+SAFE_BUILTINS = {
+    name: getattr(builtins, name) for name in (
+        'abs', 'all', 'any', 'bool', 'bytearray', 'bytes', 'chr', 'dict',
+        'divmod', 'enumerate', 'Exception', 'float', 'format', 'hex', 'int',
+        'isinstance', 'len', 'list', 'max', 'min', 'oct', 'ord', 'pow',
+        'range', 'repr', 'reversed', 'round', 'set', 'sorted', 'str', 'sum',
+        'tuple', 'ValueError', 'zip')
+}
+
+# Names available to the Python snippets of the scenarios, in addition to
+# the ones passed when running them (self, cmd, pid, ...)
+SNIPPET_GLOBALS = {
+    '__builtins__': SAFE_BUILTINS,
+    'logging': logging,
+    're': re,
+    'string': string,
+    'time': time,
+}
+
+
+class Snippet:
+    """
+    Python code of a scenario ('Exec', 'Log', 'Info', 'Warning' attributes
+    and <eval>/<exec> tags), compiled once and run with a restricted
+    namespace (no imports, no file access through builtins).
+    This limits what the code can reach by name; it is not a security
+    boundary, as the snippets get a reference to the emulator.
+    """
+    __slots__ = ('source', 'code', 'is_expression')
+
+    def __init__(self, source, mode='exec', filename='<snippet>'):
+        """
+        :param source: Python source code
+        :param mode: 'exec' for statements, 'eval' for an expression, or
+                'auto' to compile an expression if possible, otherwise
+                statements (like <eval> and <exec> tags).
+        :param filename: name used in tracebacks
+        :raise SyntaxError: invalid source code
+        """
+        self.source = source
+        self.is_expression = mode != 'exec'
+        if mode == 'auto':
+            try:
+                self.code = compile(source, filename, 'eval')
+            except SyntaxError:
+                self.is_expression = False
+        if mode != 'auto' or not self.is_expression:
+            self.code = compile(
+                source, filename, 'eval' if self.is_expression else 'exec')
+
+    @classmethod
+    def restore(cls, source, code, is_expression):
+        """
+        Rebuild a snippet from its compiled code (e.g., read from the
+        scenario cache), without compiling the source.
+        """
+        snippet = cls.__new__(cls)
+        snippet.source = source
+        snippet.code = code
+        snippet.is_expression = is_expression
+        return snippet
+
+    def run(self, /, **names):
+        """
+        Run the snippet.
+        :param names: names made available to the code (e.g., self, cmd)
+        :return: the value of the expression, or None for statements
+        """
+        namespace = dict(SNIPPET_GLOBALS)
+        namespace.update(names)
+        if self.is_expression:
+            return eval(self.code, namespace)
+        exec(self.code, namespace)
+        return None
+
+    def __repr__(self):
+        return repr(self.source)
+
+
+def compile_snippet(source, mode='exec', filename='<snippet>'):
+    """
+    Compile a snippet, logging syntax errors.
+    :return: Snippet, or None in case of syntax error
+    """
+    try:
+        return Snippet(source, mode, filename)
+    except (SyntaxError, ValueError, TypeError) as e:
+        logging.error("Invalid Python code in %s: %s (%s)",
+                      filename, repr(source), e)
+        return None
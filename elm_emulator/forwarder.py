@@ -0,0 +1,456 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import collections
+import logging
+import re
+import socket
+import string
+import threading
+import time
+from collections import OrderedDict
+
+import serial
+
+FORWARD_PROMPT = b'>'  # end of an answer of the adapter
+FORWARD_CONNECT_TIMEOUT = 5  # seconds
+FORWARD_CACHE_SIZE = 128  # cached answers
+FORWARD_CACHE_TTL = 60  # seconds
+# Requests whose answer does not change (adapter information, vehicle
+# information) and can be served from the cache
+FORWARD_CACHEABLE = re.compile(
+    r'^(AT(I|@1|@2|DP|DPN)|ST(I|DI)|09[0-9A-F]{2})$')
+# Requests which configure the adapter and invalidate the cache
+FORWARD_SETTING = re.compile(r'^(AT|ST)')
+# Max queued background requests (ref. Forwarder.submit()): the oldest
+# non-setting ones are dropped first
+FORWARD_MAX_BACKGROUND = 16
+FORWARD_QUEUE_SIZE = 256
+
+
+class ForwardRequest:
+    """
+    Request queued to the Forwarder; the answer is set by the I/O thread.
+    """
+
+    def __init__(self, data, cmd, context=None, background=False):
+        self.data = data  # bytes sent to the adapter
+        self.cmd = cmd  # unspaced uppercase request
+        self.context = context  # data of the caller (e.g., the header)
+        self.background = background  # nobody waits for the answer
+        self.setting = bool(FORWARD_SETTING.match(cmd))  # AT/ST command
+        self.answer = None  # False: no connection, None: no data, or str
+        self.cached = False  # answer served by the cache
+        self.generation = None  # cache generation at submission
+        self.done = threading.Event()
+
+    def set_answer(self, answer):
+        self.answer = answer
+        self.done.set()
+
+    def wait(self, timeout=None):
+        """
+        Wait for the answer of the adapter.
+        :param timeout: max seconds to wait (None = no limit)
+        :return: False: no connection; None: no data; otherwise the decoded
+                answer
+        """
+        if not self.done.wait(timeout):
+            logging.debug("Timeout waiting for forward answer: %s",
+                          repr(self.data))
+            return None
+        return self.answer
+
+
+class Forwarder:
+    """
+    Forward the requests to a real adapter, connected through a serial port
+    or a TCP socket, from a dedicated I/O thread: callers queue requests
+    through submit() without waiting, and the answer of each request is
+    read until the ">" prompt of the adapter, or until the timeout.
+    Answers of static requests (FORWARD_CACHEABLE) are cached; requests
+    configuring the adapter invalidate the cache.
+    Requests which are waited for go ahead of the queued background ones,
+    except the settings (AT/ST commands) queued before them; the background
+    requests are bounded (FORWARD_MAX_BACKGROUND, FORWARD_QUEUE_SIZE).
+    """
+
+    def __init__(self,
+                 serial_port=None,
+                 serial_baudrate=None,
+                 net_host=None,
+                 net_port=None,
+                 timeout=0.2,
+                 cache_size=FORWARD_CACHE_SIZE,
+                 cache_ttl=FORWARD_CACHE_TTL,
+                 on_answer=None,
+                 on_error=None):
+        """
+        :param serial_port: serial port of the adapter (priority over net)
+        :param serial_baudrate: baud rate of the serial port
+        :param net_host: host of the adapter
+        :param net_port: TCP port of the adapter
+        :param timeout: max seconds to wait for the prompt
+        :param cache_size: max number of cached answers (0 = no cache)
+        :param cache_ttl: seconds of validity of a cached answer
+        :param on_answer: function called by the I/O thread with each
+                answered ForwardRequest
+        :param on_error: function called by the I/O thread when the
+                connection cannot be established
+        """
+        self.serial_port = serial_port
+        self.serial_baudrate = serial_baudrate
+        self.net_host = net_host
+        self.net_port = net_port
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.on_answer = on_answer
+        self.on_error = on_error
+        self.serial_fd = None
+        self.sock_inet = None
+        self.failed = False  # the connection cannot be established
+        self.cache = OrderedDict()  # cmd -> (expiration time, answer)
+        self.cache_generation = 0
+        self.cache_hits = 0
+        self.lock = threading.Lock()
+        self.ready = threading.Condition(self.lock)
+        self.queue = collections.deque()  # ForwardRequest; None = stop
+        self.dropped = 0  # background requests dropped from the queue
+        self.thread = None
+
+    @staticmethod
+    def normalize_request(data):
+        """
+        :param data: request (bytes or string)
+        :return: unspaced uppercase request
+        """
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', 'ignore')
+        return data.translate(
+            data.maketrans('', '', string.whitespace)).upper()
+
+    def start(self):
+        """
+        Start the I/O thread, if not running.
+        """
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.worker, name='forwarder', daemon=True)
+                self.thread.start()
+        return self
+
+    def close(self):
+        """
+        Stop the I/O thread after the queued requests and close the
+        connection to the adapter.
+        """
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+        if thread is None:
+            return
+        with self.ready:
+            self.queue.append(None)
+            self.ready.notify()
+        if thread is not threading.current_thread():
+            thread.join(self.timeout * 2 + 1)
+
+    def submit(self, data, context=None, background=False):
+        """
+        Queue a request without waiting for the answer.
+        :param data: bytes to send to the adapter
+        :param context: data stored in the request (ref. on_answer)
+        :param background: True if the answer is not waited for (the
+                request can be dropped if too many are queued); otherwise
+                the request goes ahead of the background ones
+        :return: ForwardRequest
+        """
+        request = ForwardRequest(
+            data, self.normalize_request(data), context, background)
+        with self.lock:
+            if self.failed:
+                request.set_answer(False)
+                return request
+            if FORWARD_CACHEABLE.match(request.cmd):
+                cached = self.cache.get(request.cmd)
+                if cached and cached[0] > time.monotonic():
+                    self.cache.move_to_end(request.cmd)
+                    self.cache_hits += 1
+                    request.cached = True
+                    request.set_answer(cached[1])
+                    logging.debug("Forward answer of %s from cache: %s",
+                                  repr(request.cmd), repr(cached[1]))
+                    return request
+            elif FORWARD_SETTING.match(request.cmd):
+                self.cache.clear()
+                self.cache_generation += 1
+            request.generation = self.cache_generation
+        self.start()
+        with self.ready:
+            if background:
+                if request.setting:
+                    last = next((r for r in reversed(self.queue)
+                                 if r is not None and r.setting), None)
+                    if last is not None and last.cmd == request.cmd:
+                        return last  # the adapter gets the same setting
+                self.queue.append(request)
+                self.trim()
+            else:
+                self.enqueue_ahead(request)
+            self.ready.notify()
+        return request
+
+    def enqueue_ahead(self, request):
+        """
+        Internally used with the lock held: queue a request which is waited
+        for after the queued settings, ahead of the other background
+        requests.
+        """
+        queue = self.queue
+        if queue and queue[-1] is None:  # closing
+            queue.insert(len(queue) - 1, request)
+            return
+        settings = [r for r in queue if r.setting]
+        others = [r for r in queue if not r.setting]
+        queue.clear()
+        queue.extend(settings)
+        queue.append(request)
+        queue.extend(others)
+
+    def trim(self):
+        """
+        Internally used with the lock held: drop the oldest background
+        requests exceeding FORWARD_MAX_BACKGROUND (non-setting ones) or
+        FORWARD_QUEUE_SIZE (any).
+        """
+        queue = self.queue
+        pending = [r for r in queue
+                   if r is not None and r.background and not r.setting]
+        drop = pending[:max(0, len(pending) - FORWARD_MAX_BACKGROUND)]
+        if len(queue) - len(drop) > FORWARD_QUEUE_SIZE:
+            others = [r for r in queue if r is not None and r.background and
+                      r not in drop]
+            drop += others[:len(queue) - len(drop) - FORWARD_QUEUE_SIZE]
+            logging.warning("Forward queue full: dropping %s requests.",
+                            len(drop))
+        for request in drop:
+            queue.remove(request)
+            request.set_answer(None)
+        self.dropped += len(drop)
+
+    def wait_answer(self, request, timeout=None):
+        """
+        Wait for the answer of a queued request, moving it ahead of the
+        background requests.
+        :param request: ForwardRequest returned by submit()
+        :param timeout: max seconds to wait (None = no limit)
+        :return: ref. ForwardRequest.wait()
+        """
+        with self.ready:
+            if request.background and request in self.queue:
+                self.queue.remove(request)
+                self.enqueue_ahead(request)
+            request.background = False
+        return request.wait(timeout)
+
+    def send_receive(self, data, context=None, timeout=None):
+        """
+        Queue a request and wait for its answer.
+        :param data: bytes to send to the adapter
+        :param context: data stored in the request (ref. on_answer)
+        :param timeout: max seconds to wait (None = no limit)
+        :return: False: no connection; None: no data; otherwise the decoded
+                answer
+        """
+        return self.submit(data, context).wait(timeout)
+
+    def store(self, request):
+        """
+        Cache the answer of a static request, unless the adapter was
+        reconfigured after the submission of the request.
+        """
+        if (not self.cache_size or not request.answer or
+                not FORWARD_CACHEABLE.match(request.cmd)):
+            return
+        with self.lock:
+            if request.generation != self.cache_generation:
+                return
+            self.cache[request.cmd] = (
+                time.monotonic() + self.cache_ttl, request.answer)
+            self.cache.move_to_end(request.cmd)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def worker(self):
+        while True:
+            with self.ready:
+                while not self.queue:
+                    self.ready.wait()
+                request = self.queue.popleft()
+            if request is None:
+                break
+            try:
+                answer = self.forward(request.data)
+            except Exception as e:
+                logging.error('Forward error: %s', e)
+                answer = None
+            request.set_answer(answer)
+            if answer is False:
+                continue
+            self.store(request)
+            if self.on_answer:
+                try:
+                    self.on_answer(request)
+                except Exception as e:
+                    logging.error('Error processing forward answer: %s', e)
+        self.disconnect()
+
+    def forward(self, data):
+        """
+        Internally used by the I/O thread: send data to the adapter and
+        read the answer until the prompt or the timeout.
+        :return: False: no connection; None: no data; otherwise the decoded
+                answer
+        """
+        if not self.connect():
+            return False
+        self.discard_input()
+        try:
+            self.write(data)
+        except OSError as e:
+            logging.error(
+                "The link of the OBDII interface dropped: %s", e)
+            self.disconnect()
+            return False
+        logging.info("Write forward data: %s", repr(data))
+        proxy_data = self.read_answer()
+        logging.info("Read forward data: %s", repr(proxy_data))
+        if not proxy_data:
+            return None
+        return proxy_data.decode('utf-8', 'ignore')
+
+    def connect(self):
+        """
+        Open the serial port or the socket connection to the adapter.
+        :return: True when connected, otherwise False
+        """
+        if self.serial_fd or self.sock_inet:
+            return True
+        if self.failed:
+            return False
+        if self.serial_port:
+            try:
+                self.serial_fd = serial.Serial(
+                    port=self.serial_port,
+                    baudrate=int(self.serial_baudrate),
+                    timeout=self.timeout)
+                return True
+            except Exception as e:
+                logging.error('Cannot open forward port: %s', e)
+                return False
+        if self.net_host is None or self.net_port is None:
+            return False
+        s = None
+        for res in socket.getaddrinfo(
+                self.net_host, self.net_port,
+                socket.AF_UNSPEC, socket.SOCK_STREAM):
+            af, socktype, proto, canonname, sa = res
+            try:
+                s = socket.socket(af, socktype, proto)
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                s = None
+                continue
+            try:
+                s.settimeout(FORWARD_CONNECT_TIMEOUT)
+                s.connect(sa)
+            except OSError:
+                s.close()
+                s = None
+                continue
+            break
+        if s is None:
+            logging.critical(
+                "Cannot connect to host %s with port %s",
+                self.net_host, self.net_port)
+            with self.lock:
+                self.failed = True
+            if self.on_error:
+                self.on_error()
+            return False
+        self.sock_inet = s
+        return True
+
+    def disconnect(self):
+        try:
+            if self.serial_fd:
+                self.serial_fd.close()
+            if self.sock_inet:
+                self.sock_inet.close()
+        except Exception as e:
+            logging.debug("Cannot close forward connection: %s", e)
+        self.serial_fd = None
+        self.sock_inet = None
+
+    def write(self, data):
+        if self.serial_fd:
+            self.serial_fd.write(data)
+        else:
+            self.sock_inet.sendall(data)
+
+    def discard_input(self):
+        """
+        Drop the late answer of a previous request which timed out.
+        """
+        if self.serial_fd:
+            self.serial_fd.reset_input_buffer()
+            return
+        self.sock_inet.setblocking(False)
+        try:
+            while self.sock_inet.recv(1024):
+                pass
+        except OSError:
+            pass
+        finally:
+            self.sock_inet.settimeout(self.timeout)
+
+    def read_answer(self):
+        """
+        Read the answer of the adapter until the prompt or the timeout.
+        :return: bytes read
+        """
+        data = bytearray()
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logging.debug("Timeout while reading forward data: %s",
+                              repr(bytes(data)))
+                break
+            try:
+                if self.serial_fd:
+                    self.serial_fd.timeout = remaining
+                    chunk = self.serial_fd.read(
+                        self.serial_fd.in_waiting or 1)
+                else:
+                    self.sock_inet.settimeout(remaining)
+                    chunk = self.sock_inet.recv(1024)
+                    if not chunk:
+                        logging.error(
+                            "The network link of the OBDII interface "
+                            "dropped.")
+                        self.disconnect()
+                        break
+            except socket.timeout:
+                continue
+            data += chunk
+            if FORWARD_PROMPT in chunk:
+                break
+        return bytes(data)
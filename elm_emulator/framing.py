@@ -0,0 +1,82 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+
+class LineFramer:
+    """
+    Buffered framing layer splitting the raw input stream into command lines.
+
+    Data read from the device in chunks is appended with feed(); pop() then
+    returns one command line at a time, together with the raw bytes consumed
+    from the buffer (so that the caller can echo them).
+    With newline=False, '\\r' terminates a command and '\\n' is ignored; with
+    newline=True, '\\n' terminates a command and '\\r' is ignored.
+    """
+
+    def __init__(self, newline=False):
+        self.newline = newline
+        self.buffer = bytearray()  # received data not yet consumed
+        self.partial = bytearray()  # incomplete line (without ignored chars)
+
+    @property
+    def terminator(self):
+        return b'\n' if self.newline else b'\r'
+
+    @property
+    def ignored(self):
+        return b'\r' if self.newline else b'\n'
+
+    def feed(self, data, expired=False):
+        """
+        Append data read from the device.
+        :param data: bytes read from the device
+        :param expired: True if the UDS P4 timer (req_timeout) expired while
+                waiting for data; in this case the incomplete line is
+                discarded before appending the new data.
+        :return: True if an incomplete line was discarded
+        """
+        discarded = False
+        if expired and self.partial:
+            self.partial.clear()
+            discarded = True
+        self.buffer += data
+        return discarded
+
+    def pop(self):
+        """
+        Consume the buffer up to the next terminator.
+        :return: tuple (line, raw): line is the decoded command string, or
+                None if the buffered data does not include a terminator;
+                raw are the consumed bytes (including the terminator).
+        """
+        if not self.buffer:
+            return None, b''
+        i = self.buffer.find(self.terminator)
+        if i < 0:
+            raw = bytes(self.buffer)
+            self.buffer.clear()
+            self.partial += raw.replace(self.ignored, b'')
+            return None, raw
+        raw = bytes(self.buffer[:i + 1])
+        del self.buffer[:i + 1]
+        self.partial += raw[:-1].replace(self.ignored, b'')
+        line = self.partial.decode("utf-8", "ignore")
+        self.partial.clear()
+        return line, raw
+
+    def pending(self):
+        """
+        :return: True if the buffer includes at least a complete line
+        """
+        return self.terminator in self.buffer
+
+    def clear(self):
+        """
+        Discard all buffered data (e.g., when the client disconnects).
+        """
+        self.buffer.clear()
+        self.partial.clear()
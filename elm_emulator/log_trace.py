@@ -0,0 +1,246 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+"""
+Logging which does not format the messages in the I/O thread:
+
+- QueuedLogging moves the handlers of a logger to a background thread
+  (QueueListener), feeding them through a LazyQueueHandler;
+- TraceHandler writes the log records to a structured binary trace
+  (message template and arguments), decoded by read_trace() or by
+
+    python -m elm_emulator.log_trace FILE
+"""
+
+import logging
+import logging.handlers
+import marshal
+import queue
+import struct
+import sys
+import threading
+import time
+
+from .session_log import RECORD_HEADER, read_records
+
+# Record types of the trace, after the ones of the session log
+REC_TRACE_FORMAT = 4  # payload: format id, message template (UTF-8)
+REC_TRACE = 5  # payload: level, format id, marshal of the arguments
+REC_TRACE_TEXT = 6  # payload: level, formatted message (UTF-8)
+TRACE_FORMAT = struct.Struct('<I')
+TRACE_RECORD = struct.Struct('<BI')
+TRACE_TEXT = struct.Struct('<B')
+# Arguments which can be formatted later in another thread
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def is_immutable(args):
+    """
+    :param args: arguments of a log record
+    :return: True if the message can be formatted later with the same
+            result
+    """
+    if not args:
+        return True
+    if type(args) is not tuple:  # mapping
+        return False
+    for arg in args:
+        if type(arg) not in IMMUTABLE_TYPES:
+            return False
+    return True
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler which queues the records without formatting them, so
+    that the message is formatted by the handlers of the QueueListener
+    thread; records including exceptions or mutable arguments are
+    formatted before being queued.
+    """
+
+    def prepare(self, record):
+        if record.exc_info or not is_immutable(record.args):
+            return super().prepare(record)
+        return record
+
+
+class QueuedLogging:
+    """
+    Move the handlers of a logger to a background thread.
+    """
+
+    def __init__(self, logger=None):
+        """
+        :param logger: logger (default: root logger)
+        """
+        self.logger = logger or logging.getLogger()
+        self.handlers = []
+        self.handler = None
+        self.listener = None
+
+    def start(self):
+        """
+        :return: self
+        """
+        if self.listener:
+            return self
+        self.handlers = [h for h in self.logger.handlers
+                         if not isinstance(h, TraceHandler)]
+        log_queue = queue.SimpleQueue()
+        self.listener = logging.handlers.QueueListener(
+            log_queue, *self.handlers, respect_handler_level=True)
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+        self.handler = LazyQueueHandler(log_queue)
+        self.logger.addHandler(self.handler)
+        self.listener.start()
+        return self
+
+    def stop(self):
+        """
+        Process the queued records and restore the handlers.
+        """
+        if not self.listener:
+            return
+        self.logger.removeHandler(self.handler)
+        self.listener.stop()
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
+        self.listener = None
+        self.handler = None
+
+
+class TraceHandler(logging.Handler):
+    """
+    Handler writing the log records to an append-only binary trace with
+    the layout of the session log (ref. SessionRecorder): each message
+    template is written once, then each record only includes the level,
+    the id of its template and the marshalled arguments. Records are
+    queued by the caller and written by a background thread, which is the
+    only one encoding them.
+    """
+
+    def __init__(self, path, level=logging.NOTSET):
+        """
+        :param path: trace file name (data are appended)
+        :param level: level of the handler
+        """
+        super().__init__(level)
+        self.path = path
+        self.file = open(path, 'ab')
+        self.queue = queue.SimpleQueue()
+        self.formats = {}  # message template -> format id
+        self.records = 0
+        self.thread = threading.Thread(
+            target=self.writer, name='log-trace', daemon=True)
+        self.thread.start()
+
+    def emit(self, record):
+        try:
+            if (record.exc_info or type(record.msg) is not str or
+                    not is_immutable(record.args)):
+                text = record.getMessage()
+                if record.exc_info:
+                    text += '\n' + logging.Formatter().formatException(
+                        record.exc_info)
+                self.queue.put((record.created, record.levelno, None, text))
+            else:
+                self.queue.put((record.created, record.levelno, record.msg,
+                                record.args or ()))
+        except Exception:
+            self.handleError(record)
+
+    def encode(self, created, levelno, msg, args):
+        """
+        Internally used by the writer thread.
+        :return: bytes of the records
+        """
+        level = min(levelno, 255)
+        if msg is None:
+            payload = TRACE_TEXT.pack(level) + args.encode('utf-8', 'replace')
+            return RECORD_HEADER.pack(
+                len(payload), REC_TRACE_TEXT, created, 0) + payload
+        data = b''
+        format_id = self.formats.get(msg)
+        if format_id is None:
+            format_id = self.formats[msg] = len(self.formats)
+            payload = (TRACE_FORMAT.pack(format_id) +
+                       msg.encode('utf-8', 'replace'))
+            data = RECORD_HEADER.pack(
+                len(payload), REC_TRACE_FORMAT, created, 0) + payload
+        payload = TRACE_RECORD.pack(level, format_id) + marshal.dumps(args)
+        return data + RECORD_HEADER.pack(
+            len(payload), REC_TRACE, created, 0) + payload
+
+    def writer(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            try:
+                self.file.write(self.encode(*item))
+                self.records += 1
+                if self.queue.empty():
+                    self.file.flush()
+            except Exception as e:
+                sys.stderr.write(
+                    "Cannot write log trace %s: %s\n" % (self.path, e))
+        self.file.close()
+
+    def close(self):
+        """
+        Write the queued records and close the trace.
+        """
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        super().close()
+
+
+def read_trace(path):
+    """
+    Read a binary trace written by TraceHandler.
+    :param path: trace file name
+    :return: iterator of (timestamp, level, message)
+    """
+    formats = {}
+    for rec_type, timestamp, _, payload in read_records(path):
+        if rec_type == REC_TRACE_FORMAT:
+            format_id, = TRACE_FORMAT.unpack_from(payload)
+            formats[format_id] = payload[TRACE_FORMAT.size:].decode()
+        elif rec_type == REC_TRACE_TEXT:
+            level, = TRACE_TEXT.unpack_from(payload)
+            yield timestamp, level, payload[TRACE_TEXT.size:].decode()
+        elif rec_type == REC_TRACE:
+            level, format_id = TRACE_RECORD.unpack_from(payload)
+            msg = formats.get(format_id, '<unknown format %s>' % format_id)
+            args = marshal.loads(payload[TRACE_RECORD.size:])
+            try:
+                message = msg % args if args else msg
+            except (TypeError, ValueError):
+                message = '%s %r' % (msg, args)
+            yield timestamp, level, message
+
+
+def main(argv=None):
+    """
+    Print a binary trace as text.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        sys.stderr.write('Usage: python -m elm_emulator.log_trace FILE\n')
+        return 2
+    for timestamp, level, message in read_trace(argv[0]):
+        print('%s.%03d %s %s' % (
+            time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp)),
+            int(timestamp * 1000) % 1000, logging.getLevelName(level),
+            message))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import importlib
+import inspect
+import logging
+import pkgutil
+import re
+from collections.abc import Mapping
+
+TASK_PREFIX = 'task_'
+ECU_TASK = 'task_ecu_'
+
+
+def ecu_task_regex(name):
+    """
+    Compile the wildcard name of an ECU task plugin: 'X' matches an
+    hexadecimal digit and 'W' one or more hexadecimal digits (e.g.,
+    task_ecu_XXF1 is used for all ECUs whose address ends with F1).
+    :param name: plugin name
+    :return: compiled regular expression matching ECU_TASK + ecu (uppercase)
+    """
+    return re.compile(r'^' +
+                      name.upper()
+                      .replace('X', '[0-9A-F]')
+                      .replace('W', '[0-9A-F]+') +
+                      r'$')
+
+
+class PluginRegistry(Mapping):
+    """
+    Task plugins of a package (modules named task_*), indexed by name
+    without importing them: a module is imported when its task is first
+    used, and dropped if it does not define a Task class.
+    ECU task plugins (task_ecu_*) are precompiled into a table of wildcard
+    expressions, whose lookups are cached per ECU.
+    """
+
+    def __init__(self, package=None, names=None):
+        """
+        :param package: package of the plugins (e.g., "elm_emulator.plugins")
+        :param names: plugin names (default: discovered in the package)
+        """
+        self.package = package
+        if names is None:
+            names = self.discover(package) if package else []
+        self.names = [n for n in names if n.startswith(TASK_PREFIX)]
+        self.modules = {}  # name -> imported module
+        self.invalid = set()  # names of the plugins which cannot be used
+        self.ecu_table = [(ecu_task_regex(n), n) for n in self.names
+                          if n.startswith(ECU_TASK)]
+        self.ecu_cache = {}  # ecu -> plugin name or None
+        self.reported = set()  # missing tasks already logged
+
+    @staticmethod
+    def discover(package):
+        """
+        :param package: package of the plugins
+        :return: list of the names of its modules
+        """
+        try:
+            path = importlib.import_module(package).__path__
+        except ImportError as e:
+            logging.critical("Cannot load plugin package %s: %s", package, e)
+            return []
+        return [name for finder, name, ispkg in pkgutil.iter_modules(path)]
+
+    def __getitem__(self, name):
+        try:
+            return self.modules[name]
+        except KeyError:
+            pass
+        if name not in self.names or name in self.invalid:
+            raise KeyError(name)
+        try:
+            module = importlib.import_module(self.package + "." + name)
+        except Exception as e:
+            logging.critical("Cannot import plugin %s: %s", name, e,
+                             exc_info=True)
+            module = None
+        if module is None or not (hasattr(module, "Task") and
+                                  inspect.isclass(module.Task)):
+            if module is not None:
+                logging.critical(
+                    "Task class not available in plugin %s", name)
+            self.invalid.add(name)
+            self.ecu_cache.clear()
+            raise KeyError(name)
+        self.modules[name] = module
+        return module
+
+    def __contains__(self, name):
+        return name in self.names and name not in self.invalid
+
+    def __iter__(self):
+        return (n for n in self.names if n not in self.invalid)
+
+    def __len__(self):
+        return len(self.names) - len(self.invalid)
+
+    def ecu_task(self, ecu):
+        """
+        Return the module of the ECU task plugin of an ECU, importing it.
+        :param ecu: ECU address (e.g., '11F1')
+        :return: plugin module, or None if no valid plugin matches the ECU
+        """
+        while True:
+            name = self.ecu_task_name(ecu)
+            if name is None:
+                return None
+            try:
+                return self[name]
+            except KeyError:  # invalid plugin, excluded from the lookups
+                continue
+
+    def ecu_task_name(self, ecu):
+        """
+        Return the ECU task plugin whose wildcard name matches an ECU.
+        :param ecu: ECU address (e.g., '11F1')
+        :return: plugin name, or None
+        """
+        try:
+            return self.ecu_cache[ecu]
+        except KeyError:
+            pass
+        target = ECU_TASK.upper() + ecu
+        plugin = None
+        for regex, name in self.ecu_table:
+            if name not in self.invalid and regex.match(target):
+                plugin = name
+                break
+        self.ecu_cache[ecu] = plugin
+        return plugin
+
+    def missing_tasks(self, sorted_obd_msg):
+        """
+        Log the 'Task' attributes of sortedOBDMsg which do not refer to an
+        available plugin (each one only the first time).
+        :param sorted_obd_msg: sortedOBDMsg list of (PID, dictionary)
+        :return: list of (PID, task name) not available
+        """
+        missing = []
+        for pid, val in sorted_obd_msg:
+            for k, task in val.items():
+                if k.upper() == 'TASK' and task not in self:
+                    missing.append((pid, task))
+        for pid, task in missing:
+            if (pid, task) not in self.reported:
+                self.reported.add((pid, task))
+                logging.error('Unexisting plugin %s for pid %s',
+                              repr(task), repr(pid))
+        return missing
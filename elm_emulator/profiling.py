@@ -0,0 +1,287 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import functools
+import logging
+import threading
+import time
+from array import array
+
+# Stages of the processing of a request; the timings are inclusive of the
+# nested stages (e.g., 'render' includes 'uds', 'dispatch' includes the
+# ECU 'task' run before the PID is matched)
+STAGE_READ = 'read'  # framing of the request (not waiting for data)
+STAGE_DISPATCH = 'dispatch'  # from the request to the matched PID
+STAGE_TASK = 'task'  # task method
+STAGE_RENDER = 'render'  # computation of a response
+STAGE_UDS = 'uds'  # UDS/ISO-TP encoding of an answer
+STAGE_WRITE = 'write'  # write to the device
+STAGE_REQUEST = 'request'  # whole processing of a request
+STAGES = (STAGE_READ, STAGE_DISPATCH, STAGE_TASK, STAGE_RENDER, STAGE_UDS,
+          STAGE_WRITE, STAGE_REQUEST)
+NO_PID = '-'  # requests which do not match a PID
+
+# Histogram buckets: each power of two is split into 2 ** (BITS - 1)
+# buckets, so the recorded values have a relative error < 2 ** (1 - BITS)
+HISTOGRAM_SUB_BUCKET_BITS = 7
+HISTOGRAM_MAX_NS = 60 * 10 ** 9  # greater values are recorded as the max
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def bucket_index(value):
+    """
+    :param value: non-negative integer
+    :return: index of the histogram bucket of the value
+    """
+    if value < 1 << HISTOGRAM_SUB_BUCKET_BITS:
+        return value
+    shift = value.bit_length() - HISTOGRAM_SUB_BUCKET_BITS
+    return (shift << (HISTOGRAM_SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+
+def bucket_limit(index):
+    """
+    :param index: index of a histogram bucket
+    :return: highest value recorded in the bucket
+    """
+    if index < 1 << HISTOGRAM_SUB_BUCKET_BITS:
+        return index
+    shift = (index >> (HISTOGRAM_SUB_BUCKET_BITS - 1)) - 1
+    sub_bucket = index - (shift << (HISTOGRAM_SUB_BUCKET_BITS - 1))
+    return ((sub_bucket + 1) << shift) - 1
+
+
+HISTOGRAM_BUCKETS = bucket_index(HISTOGRAM_MAX_NS) + 1
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies in nanoseconds, with a fixed number of
+    log-linear buckets (ref. HISTOGRAM_SUB_BUCKET_BITS): recording is O(1)
+    and the memory does not depend on the number of samples.
+    """
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = array('q', bytes(8 * HISTOGRAM_BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value):
+        """
+        :param value: latency in nanoseconds
+        """
+        if value < 0:
+            value = 0
+        elif value > HISTOGRAM_MAX_NS:
+            value = HISTOGRAM_MAX_NS
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def percentile(self, pct):
+        """
+        :param pct: percentile (0-100)
+        :return: latency in nanoseconds (upper limit of the bucket), or None
+                if no values are recorded
+        """
+        counts = self.counts[:]  # copy: values can be recorded meanwhile
+        count = sum(counts)
+        if not count:
+            return None
+        rank = max(1, round(count * pct / 100))
+        seen = 0
+        for index, n in enumerate(counts):
+            seen += n
+            if seen >= rank:
+                return min(bucket_limit(index), self.max)
+        return self.max
+
+    def fraction_below(self, value):
+        """
+        :param value: latency in nanoseconds (e.g., an SLA threshold)
+        :return: fraction (0-1) of the recorded latencies not greater than
+                value (within the bucket precision), or None if no values
+        """
+        counts = self.counts[:]
+        count = sum(counts)
+        if not count:
+            return None
+        return sum(counts[:bucket_index(min(value, HISTOGRAM_MAX_NS)) + 1]
+                   ) / count
+
+    def summary(self):
+        """
+        :return: dictionary with count, min, mean, max and PERCENTILES of the
+                latencies, in microseconds
+        """
+        if not self.count:
+            return {'count': 0}
+        result = {
+            'count': self.count,
+            'min_us': self.min / 1000,
+            'mean_us': round(self.total / self.count / 1000, 3),
+            'max_us': self.max / 1000,
+        }
+        for pct in PERCENTILES:
+            result['p%s_us' % pct] = self.percentile(pct) / 1000
+        return result
+
+
+class StageProfiler:
+    """
+    Per-stage latency histograms of the request processing (ref. STAGES),
+    and per-PID histograms of the whole processing of the requests.
+    Elm records the stages when self.profiler is set: the stages of the
+    main loop are timed inline, while the methods in PROFILED_METHODS of
+    Elm are wrapped by timed() only while profiling.
+    """
+
+    def __init__(self, clock=time.perf_counter_ns):
+        """
+        :param clock: monotonic clock function returning nanoseconds
+        """
+        self.clock = clock
+        self.pid = None  # PID of the request being processed
+        self.overridden = {}  # methods of the profiled object before timed()
+        self.stages = {}  # stage -> LatencyHistogram
+        self.pids = {}  # PID -> LatencyHistogram of STAGE_REQUEST
+        self.started = time.monotonic()
+        self.dump_thread = None
+        self.stop_event = threading.Event()
+
+    def reset(self):
+        self.stages = {}
+        self.pids = {}
+        self.started = time.monotonic()
+
+    def record(self, stage, elapsed):
+        """
+        :param stage: stage name
+        :param elapsed: nanoseconds
+        """
+        try:
+            self.stages[stage].record(elapsed)
+        except KeyError:
+            self.stages[stage] = histogram = LatencyHistogram()
+            histogram.record(elapsed)
+
+    def timed(self, stage, method):
+        """
+        :param stage: stage name
+        :param method: function to be timed
+        :return: wrapper of the function recording its duration
+        """
+        clock = self.clock
+        record = self.record
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(stage, clock() - start)
+        return wrapper
+
+    def begin(self):
+        """
+        Start the processing of a request.
+        :return: start time
+        """
+        self.pid = None
+        return self.clock()
+
+    def matched(self, pid, start):
+        """
+        Record the dispatch of a request to a PID.
+        :param pid: matched PID
+        :param start: start time of the dispatch
+        """
+        self.pid = pid
+        self.record(STAGE_DISPATCH, self.clock() - start)
+
+    def end(self, start):
+        """
+        Record the whole processing of a request.
+        :param start: value returned by begin()
+        """
+        elapsed = self.clock() - start
+        self.record(STAGE_REQUEST, elapsed)
+        pid = self.pid or NO_PID
+        try:
+            self.pids[pid].record(elapsed)
+        except KeyError:
+            self.pids[pid] = histogram = LatencyHistogram()
+            histogram.record(elapsed)
+
+    def stats(self, stage=None, pid=None):
+        """
+        :param stage: stage name (None = all stages)
+        :param pid: PID (None = all PIDs)
+        :return: dictionary with 'elapsed' (seconds of the profiling),
+                'stages' ({stage: summary}) and 'pids' ({PID: summary of
+                the whole processing of the requests}), ref.
+                LatencyHistogram.summary()
+        """
+        stages = dict(self.stages)
+        pids = dict(self.pids)
+        return {
+            'elapsed': time.monotonic() - self.started,
+            'stages': {s: h.summary() for s, h in stages.items()
+                       if stage is None or s == stage},
+            'pids': {p: h.summary() for p, h in pids.items()
+                     if pid is None or p == pid},
+        }
+
+    def report(self):
+        """
+        :return: list of text lines with the percentiles of each stage
+        """
+        stats = self.stats()
+        lines = []
+        for name, stages in (('', stats['stages']), ('PID ', stats['pids'])):
+            for key in sorted(stages, key=lambda k: (
+                    STAGES.index(k) if k in STAGES else len(STAGES), k)):
+                s = stages[key]
+                lines.append(
+                    '%s%s N=%s P50=%s P99=%s MAX=%s US' % (
+                        name, key, s['count'], s.get('p50_us'),
+                        s.get('p99_us'), s.get('max_us')))
+        return lines
+
+    def start_dump(self, interval):
+        """
+        Periodically log the report from a daemon thread.
+        :param interval: seconds between two dumps
+        """
+        if self.dump_thread or not interval:
+            return
+        self.stop_event.clear()
+        self.dump_thread = threading.Thread(
+            target=self.dump, args=(interval,), name='profiler', daemon=True)
+        self.dump_thread.start()
+
+    def stop_dump(self):
+        thread = self.dump_thread
+        self.dump_thread = None
+        if thread:
+            self.stop_event.set()
+            if thread is not threading.current_thread():
+                thread.join(1)
+
+    def dump(self, interval):
+        while not self.stop_event.wait(interval):
+            logging.info("Latency profile after %.0f seconds:\n%s",
+                         time.monotonic() - self.started,
+                         '\n'.join(self.report()))
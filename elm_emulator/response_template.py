@@ -0,0 +1,198 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import string
+from xml.etree.ElementTree import fromstring, ParseError
+
+from .expressions import compile_snippet
+
+MAX_CACHED_TEMPLATES = 4096
+
+# Operations of a compiled response
+OP_TEXT = 0  # append text
+OP_RH = 1  # set the request header
+OP_RD = 2  # set the request data
+OP_STRING = 3  # append text (<string>)
+OP_WRITELN = 4  # append text and newline (<writeln>)
+OP_SPACE = 5  # append text and space (<space>)
+OP_EVAL = 6  # write pending data (<exec> only) and run a Snippet
+OP_FLOW = 7  # UDS flow control frame (<flow>)
+OP_ANSWER = 8  # UDS answer (<answer>)
+OP_POS_ANSWER = 9  # UDS positive answer (<pos_answer>)
+OP_NEG_ANSWER = 10  # UDS negative answer (<neg_answer>)
+OP_HEADER = 11  # header, size and data/subd sequence
+OP_ABORT = 12  # invalid <header> sequence: the response becomes "NO DATA"
+OP_UNKNOWN = 13  # unknown tag
+
+# Operations using the request header, the request data or the settings
+# used by Elm.uds_answer()
+REQUEST_OPS = {OP_FLOW, OP_ANSWER, OP_POS_ANSWER, OP_NEG_ANSWER}
+
+_templates = {}
+
+
+class ResponseTemplate:
+    """
+    XML response string parsed once into a list of typed operations, which
+    Elm.handle_response() renders with the settings of the session (spaces,
+    newlines, headers and CRA filter).
+    Each operation is a tuple whose first element is one of the OP_ codes.
+    """
+    __slots__ = ('resp', 'ops', 'final_tail', 'error', 'static',
+                 'uses_request')
+
+    def __init__(self, resp):
+        self.resp = resp  # escaped response string
+        self.ops = []
+        self.final_tail = ""  # re-appended when all the tags are processed
+        self.error = None  # XML parsing error
+        try:
+            root = fromstring('<xml>' + resp + '</xml>')
+        except ParseError as e:
+            self.error = e
+            root = None
+        if root is not None:
+            self.compile(root)
+        op_codes = {op[0] for op in self.ops}
+        # a static response does not run Python code
+        self.static = self.error is None and OP_EVAL not in op_codes
+        # the output of a static response also depends on the request
+        self.uses_request = bool(op_codes & REQUEST_OPS)
+
+    @classmethod
+    def restore(cls, resp, ops, final_tail, static, uses_request):
+        """
+        Rebuild a template from its compiled operations (e.g., read from
+        the scenario cache), without parsing the response.
+        """
+        template = cls.__new__(cls)
+        template.resp = resp
+        template.ops = ops
+        template.final_tail = final_tail
+        template.error = None
+        template.static = static
+        template.uses_request = uses_request
+        return template
+
+    def compile(self, root):
+        ops = self.ops
+        if root.text and root.text.strip():
+            ops.append((OP_TEXT, root.text.strip()))
+        elements = iter(root)
+        i = None
+        for i in elements:
+            tag = i.tag.lower()
+            if tag == 'rh':
+                ops.append((OP_RH, i.text or ""))
+            elif tag == 'rd':
+                ops.append((OP_RD, i.text or ""))
+            elif tag == 'string':
+                ops.append((OP_STRING, i.text or ""))
+            elif tag == 'writeln':
+                ops.append((OP_WRITELN, i.text or ""))
+            elif tag == 'space':
+                ops.append((OP_SPACE, i.text or ""))
+            elif tag == 'eval' or tag == 'exec':
+                msg = i.text.strip() if i.text is not None else None
+                ops.append((OP_EVAL, tag == 'exec', msg,
+                            compile_snippet(msg, 'auto', '<%s>' % tag)
+                            if msg else None))
+                if i.text is None:
+                    continue  # the tail is not processed
+            elif tag == 'flow':
+                ops.append((OP_FLOW, i.text or ""))
+            elif tag == 'answer':
+                ops.append((OP_ANSWER, i.text or ""))
+            elif tag == 'pos_answer':
+                ops.append((OP_POS_ANSWER, i.text or "", tag))
+            elif tag == 'neg_answer':
+                ops.append((OP_NEG_ANSWER, i.text or "", tag))
+            elif tag == 'header':
+                op = self.compile_header(i, elements)
+                ops.append(op)
+                if op[0] == OP_ABORT:
+                    return  # the remaining tags are not processed
+            else:
+                ops.append((OP_UNKNOWN, i.tag))
+            if i.tail and i.tail.strip():
+                ops.append((OP_TEXT, i.tail.strip()))
+        self.final_tail = i.tail.strip() if i is not None and i.tail else ""
+
+    def compile_header(self, header, elements):
+        """
+        Compile a <header> tag, which must be followed by <size> and
+        <data> (or <subd>) tags.
+        :return: OP_HEADER or OP_ABORT operation
+        """
+        resp = self.resp
+        try:
+            size = next(elements)
+            data = next(elements)
+        except StopIteration:
+            return (OP_ABORT,
+                    'Missing <size> or <data>/<subd> tags '
+                    'after <header> tag in %s.', (repr(resp),))
+        # check that the tags are valid
+        if (size.tag.lower() != 'size' or
+                (data.tag.lower() != 'data' and
+                 data.tag.lower() != 'subd')):
+            return (OP_ABORT,
+                    'In %s, <size> and <data>/<subd> tags '
+                    'must follow the <header> tag.', (repr(resp),))
+
+        # check validity of the content fields
+        try:
+            int_size = int(size.text, 16)
+        except (TypeError, ValueError) as e:
+            return (OP_ABORT,
+                    'Improper size %s for response %s: %s.',
+                    (repr(size.text), repr(resp), str(e)))
+        if not data.text:
+            return (OP_ABORT,
+                    'Missing data for response %s.', (repr(resp),))
+        unspaced_data = data.text.translate(
+            data.text.maketrans('', '', string.whitespace))
+        if int_size < 16 and len(unspaced_data) != int_size * 2:
+            return (OP_ABORT,
+                    'In response %s, mismatch between number of data '
+                    'digits %s and related length field %s.',
+                    (repr(resp), repr(data.text), repr(size.text)))
+        return (OP_HEADER,
+                header.text or "",
+                (header.text or "").upper(),
+                size.text or "",
+                data.text,
+                unspaced_data,
+                data.tag.lower() == 'data')
+
+
+def add_template(resp, template):
+    """
+    Store an already compiled template (ref. compile_response()).
+    :param resp: XML response string
+    :param template: ResponseTemplate
+    """
+    if len(_templates) >= MAX_CACHED_TEMPLATES:
+        _templates.clear()
+    _templates[resp] = template
+
+
+def compile_response(resp):
+    """
+    Return the compiled template of an XML response string, parsing it
+    only the first time it is used.
+    :param resp: XML response string (e.g., PA('00 00'))
+    :return: ResponseTemplate
+    """
+    try:
+        return _templates[resp]
+    except KeyError:
+        pass
+    template = ResponseTemplate(
+        resp.replace('\x00', '\\x00').replace('\x0d', '&#13;'))
+    add_template(resp, template)
+    return template
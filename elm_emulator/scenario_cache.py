@@ -0,0 +1,236 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import logging
+import marshal
+import mmap
+import os
+import tempfile
+
+from .dispatch import DispatchIndex, log_call, request_pattern, responses
+from .expressions import Snippet
+from .response_template import (
+    ResponseTemplate, OP_EVAL, add_template, compile_response)
+
+SCENARIO_CACHE_VERSION = 1  # to be increased when the cached data change
+SCENARIO_CACHE_EXT = '.elmc'
+SCENARIO_CACHE_MAX_FILES = 32  # older cache files are removed
+PACKAGE_NAME = 'ELM327-emulator'
+# Modules producing the cached data: their changes invalidate the cache
+# also when the package is not installed (i.e., no package version)
+CACHE_MODULES = ('scenario_cache', 'dispatch', 'response_template',
+                 'expressions')
+# Directory of the cache files, like __pycache__ for the Python modules
+SCENARIO_CACHE_DIR = os.environ.get('ELM_SCENARIO_CACHE_DIR') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'scenarios', '__pycache__')
+
+
+@functools.lru_cache(maxsize=None)
+def emulator_version():
+    """
+    Hash of the Python bytecode version, of the cache version, of the
+    version of the installed package and of the size and modification time
+    of CACHE_MODULES; it prefixes the names of the cache files.
+    :return: hexadecimal string
+    """
+    digest = hashlib.blake2b(digest_size=4)
+    digest.update(importlib.util.MAGIC_NUMBER)
+    digest.update(SCENARIO_CACHE_VERSION.to_bytes(4, 'little'))
+    try:
+        digest.update(importlib.metadata.version(PACKAGE_NAME).encode())
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for module in CACHE_MODULES:
+        try:
+            st = os.stat(os.path.join(directory, module + '.py'))
+        except OSError:
+            continue
+        digest.update(b'%d %d' % (st.st_size, st.st_mtime_ns))
+    return digest.hexdigest()
+
+
+def scenario_key(sorted_obd_msg):
+    """
+    Hash of the attributes of sortedOBDMsg compiled by DispatchIndex,
+    prefixed by the emulator version.
+    :param sorted_obd_msg: sortedOBDMsg list of (PID, dictionary)
+    :return: string
+    :raise ValueError: the attributes include values which cannot be
+            serialized
+    """
+    source = []
+    for pid, val in sorted_obd_msg:
+        uc_val = {k.upper(): v for k, v in val.items()}
+        source.append((pid, request_pattern(val), uc_val.get('EXEC'),
+                       log_call(uc_val), tuple(responses(uc_val))))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(marshal.dumps(tuple(source)))
+    return emulator_version() + '-' + digest.hexdigest()
+
+
+def dump_snippet(snippet):
+    if snippet is None:
+        return None
+    return snippet.source, snippet.code, snippet.is_expression
+
+
+def load_snippet(data):
+    if data is None:
+        return None
+    return Snippet.restore(*data)
+
+
+def dump_template(template):
+    ops = tuple(
+        op[:3] + (dump_snippet(op[3]),) if op[0] == OP_EVAL else op
+        for op in template.ops)
+    return (template.resp, ops, template.final_tail, template.static,
+            template.uses_request)
+
+
+def load_template(data):
+    resp, ops, final_tail, static, uses_request = data
+    ops = [op[:3] + (load_snippet(op[3]),) if op[0] == OP_EVAL else op
+           for op in ops]
+    return ResponseTemplate.restore(resp, ops, final_tail, static,
+                                    uses_request)
+
+
+def invalid_snippets(entry, templates):
+    """
+    :param entry: DispatchEntry
+    :param templates: ResponseTemplate list of the entry
+    :return: True if some Python code of the entry did not compile (the
+            syntax errors are only logged when compiling)
+    """
+    if 'EXEC' in entry.uc_val and entry.exec_snippet is None:
+        return True
+    if log_call(entry.uc_val) and entry.log_snippet is None:
+        return True
+    return any(op[0] == OP_EVAL and op[2] and op[3] is None
+               for template in templates for op in template.ops)
+
+
+def dump_index(index):
+    """
+    :param index: DispatchIndex
+    :return: marshal-compatible data of the index and of its templates, or
+            None if the scenario includes invalid Python code
+    """
+    compiled = [None] * len(index.source)
+    templates = []
+    for entry in index.entries:
+        compiled[entry.slot] = (entry.prefix,
+                                dump_snippet(entry.exec_snippet),
+                                dump_snippet(entry.log_snippet))
+        entry_templates = [(resp, compile_response(resp))
+                           for resp in responses(entry.uc_val)]
+        if invalid_snippets(entry, [t for _, t in entry_templates]):
+            return None
+        templates.extend((resp, dump_template(template))
+                         for resp, template in entry_templates
+                         if template.error is None)
+    return SCENARIO_CACHE_VERSION, compiled, templates
+
+
+def read_cache(sorted_obd_msg, path):
+    """
+    Read a cache file with a single memory-mapped read.
+    :return: DispatchIndex, or None if the file is missing or invalid
+    """
+    try:
+        with open(path, 'rb') as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            version, compiled, templates = marshal.loads(mm)
+        if (version != SCENARIO_CACHE_VERSION or
+                len(compiled) != len(sorted_obd_msg)):
+            raise ValueError('version or size mismatch')
+        for resp, data in templates:
+            add_template(resp, load_template(data))
+        return DispatchIndex(sorted_obd_msg, [
+            None if c is None else
+            (c[0], load_snippet(c[1]), load_snippet(c[2]))
+            for c in compiled])
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.debug("Invalid scenario cache %s: %s", path, e)
+        return None
+
+
+def write_cache(index, path):
+    """
+    Write a cache file (atomically replaced) and remove the stale ones.
+    Scenarios including invalid Python code are not cached, so that the
+    syntax errors are logged at each load.
+    """
+    dump = dump_index(index)
+    if dump is None:
+        logging.debug("Scenario with invalid Python code not cached")
+        return
+    try:
+        data = marshal.dumps(dump)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+                dir=directory, suffix='.tmp', delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+    except (OSError, ValueError) as e:
+        logging.warning("Cannot write scenario cache %s: %s", path, e)
+        return
+    prune_cache(directory)
+
+
+def prune_cache(directory):
+    """
+    Remove the cache files of other emulator versions and the oldest ones
+    exceeding SCENARIO_CACHE_MAX_FILES.
+    :param directory: directory of the cache files
+    """
+    prefix = emulator_version() + '-'
+    current = []
+    try:
+        with os.scandir(directory) as it:
+            for item in it:
+                if not item.name.endswith(SCENARIO_CACHE_EXT):
+                    continue
+                if item.name.startswith(prefix):
+                    current.append((item.stat().st_mtime, item.path))
+                else:
+                    os.remove(item.path)
+        current.sort()
+        for _, path in current[:-SCENARIO_CACHE_MAX_FILES]:
+            os.remove(path)
+    except OSError as e:
+        logging.debug("Cannot prune scenario cache %s: %s", directory, e)
+
+
+def load_dispatch_index(sorted_obd_msg, directory=SCENARIO_CACHE_DIR):
+    """
+    Return the DispatchIndex of sortedOBDMsg, read from the cache file
+    keyed by scenario_key() if available, otherwise built and cached.
+    :param sorted_obd_msg: sortedOBDMsg list of (PID, dictionary)
+    :param directory: directory of the cache files
+    :return: DispatchIndex
+    """
+    try:
+        key = scenario_key(sorted_obd_msg)
+    except (ValueError, TypeError) as e:
+        logging.debug("Scenario not cacheable: %s", e)
+        return DispatchIndex(sorted_obd_msg)
+    path = os.path.join(directory, key + SCENARIO_CACHE_EXT)
+    index = read_cache(sorted_obd_msg, path)
+    if index is None:
+        index = DispatchIndex(sorted_obd_msg)
+        write_cache(index, path)
+    return index
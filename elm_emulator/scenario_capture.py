@@ -0,0 +1,123 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import re
+import string
+from xml.sax.saxutils import escape
+
+from .obd_message import ST
+from .scenario_file import save_scenario
+
+MAX_CAPTURED_RESPONSES = 256  # distinct answers stored for each request
+# Lines of the answers of the real adapter which are not stored
+IGNORED_LINES = {'', '>', 'SEARCHING...'}
+# Answers which mean that the request is not supported by the adapter
+UNKNOWN_ANSWERS = (['?'],)
+# 'Priority' of the captured PIDs: higher than the ones of the built-in
+# scenarios (1 = highest, 10 = default), so that the answers of the real car
+# win over the 'default' PIDs matching the same requests
+CAPTURED_PRIORITY = 1
+
+
+class ScenarioCapture:
+    """
+    Collect the request/response pairs forwarded to a real ELM327 adapter
+    (ref. Elm.forward_answered()) and compile them into a scenario:
+    each distinct OBD request becomes a PID whose 'Response' includes the
+    distinct answers in order of appearance (a list, if the value changed).
+    The captured PIDs have CAPTURED_PRIORITY, but the requests 0105, 010C,
+    010D, 0120, 0121, 012F and 015E are still answered by the handlers of
+    Elm.handle_request() with the state of the simulated car, before any
+    scenario is checked.
+    """
+
+    def __init__(self):
+        self.requests = {}  # (header, cmd) -> list of distinct answers
+        self.count = 0  # number of captured pairs
+
+    @staticmethod
+    def normalize_request(data):
+        """
+        :param data: request sent to the adapter (bytes or string)
+        :return: unspaced uppercase request
+        """
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', 'ignore')
+        return data.translate(
+            data.maketrans('', '', string.whitespace)).upper()
+
+    @staticmethod
+    def parse_answer(cmd, data):
+        """
+        Split an answer of the adapter into lines, removing the echo of
+        the request, the prompt and the empty lines.
+        :param cmd: unspaced uppercase request
+        :param data: answer read from the adapter (bytes or string)
+        :return: list of lines
+        """
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', 'ignore')
+        lines = [line.strip().rstrip('>').strip()
+                 for line in re.split(r'[\r\n]', data)]
+        lines = [line for line in lines if line not in IGNORED_LINES]
+        if lines and lines[0].replace(' ', '').upper() == cmd:
+            del lines[0]  # echo (ATE1)
+        return lines
+
+    def add(self, request, answer, header=None):
+        """
+        Store a forwarded request and its answer; AT and ST commands are
+        ignored, as they configure the adapter.
+        :param request: request sent to the adapter
+        :param answer: answer read from the adapter
+        :param header: header set for the request (ATSH), if any
+        :return: True if stored
+        """
+        cmd = self.normalize_request(request)
+        if not cmd or not all(c in string.hexdigits for c in cmd):
+            return False
+        lines = self.parse_answer(cmd, answer or '')
+        if not lines or lines in UNKNOWN_ANSWERS:
+            return False
+        answers = self.requests.setdefault((header, cmd), [])
+        if lines not in answers and len(answers) < MAX_CAPTURED_RESPONSES:
+            answers.append(lines)
+        self.count += 1
+        return True
+
+    def to_scenario(self):
+        """
+        Compile the captured pairs into a dictionary of PIDs.
+        :return: dictionary in the same format of the ObdMessage scenarios
+        """
+        pids = {}
+        for (header, cmd), answers in self.requests.items():
+            responses = [''.join(ST(escape(line)) for line in lines)
+                         for lines in answers]
+            pid = 'CAPTURED_' + cmd if header is None else (
+                    'CAPTURED_%s_%s' % (header, cmd))
+            pids[pid] = {
+                'Request': '^' + cmd + '$',
+                'Descr': 'Captured request %s' % cmd,
+                'Response': responses[0] if len(responses) == 1
+                else responses,
+                'Priority': CAPTURED_PRIORITY
+            }
+            if header is not None:
+                pids[pid]['Header'] = header
+        return pids
+
+    def save(self, path, name):
+        """
+        Write the captured scenario to a data file (ref. load_scenario()).
+        :param path: file name
+        :param name: scenario name
+        :return: number of PIDs written
+        """
+        pids = self.to_scenario()
+        save_scenario(path, name, pids)
+        return len(pids)
@@ -0,0 +1,127 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import json
+import logging
+import os
+from collections.abc import MutableMapping
+
+SCENARIO_FILE_VERSION = 1
+SCENARIO_FILE_EXT = '.json'
+
+
+def save_scenario(path, name, pids):
+    """
+    Write a scenario to a JSON data file.
+    :param path: file name
+    :param name: scenario name
+    :param pids: dictionary of PIDs (same format of the ObdMessage
+            scenarios, with JSON-compatible values)
+    :return: (none)
+    """
+    with open(path, 'w') as f:
+        json.dump({
+            'version': SCENARIO_FILE_VERSION,
+            'scenario': name,
+            'pids': pids,
+        }, f, indent=4)
+
+
+def load_scenario(path):
+    """
+    Read a scenario from a JSON data file written by save_scenario().
+    :param path: file name
+    :return: tuple (scenario name, dictionary of PIDs)
+    :raise ValueError: invalid file content
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get(
+            'version') != SCENARIO_FILE_VERSION:
+        raise ValueError('Unsupported scenario file %s' % repr(path))
+    name = data.get('scenario')
+    pids = data.get('pids')
+    if not isinstance(name, str) or not isinstance(pids, dict):
+        raise ValueError('Invalid scenario file %s' % repr(path))
+    for pid, val in pids.items():
+        if not isinstance(val, dict) or not any(
+                k.upper() == 'REQUEST' for k in val):
+            raise ValueError('Invalid PID %s in scenario file %s' %
+                             (repr(pid), repr(path)))
+    return name, pids
+
+
+class ScenarioCatalog(MutableMapping):
+    """
+    Dictionary of scenarios (the format of ObdMessage) including the
+    built-in scenarios and the data files of a directory: a data file
+    "<name>.json" is read only when the scenario <name> is accessed
+    (e.g., selected by Elm.set_sorted_obd_msg()).
+    """
+
+    def __init__(self, scenarios=None, directory=None, resolver=None):
+        """
+        :param scenarios: dictionary of built-in scenarios
+        :param directory: directory of the data files (ref. save_scenario())
+        :param resolver: function applied to the PIDs of each loaded data
+                file (e.g., resolve_providers())
+        """
+        self.scenarios = dict(scenarios or {})  # built-in or loaded
+        self.resolver = resolver
+        self.files = {}  # scenario name -> data file not loaded yet
+        if directory and os.path.isdir(directory):
+            for file in sorted(os.listdir(directory)):
+                name, ext = os.path.splitext(file)
+                if ext == SCENARIO_FILE_EXT and name not in self.scenarios:
+                    self.files[name] = os.path.join(directory, file)
+
+    def __getitem__(self, name):
+        if name not in self.scenarios and name in self.files:
+            path = self.files.pop(name)
+            try:
+                pids = load_scenario(path)[1]
+                if self.resolver:
+                    pids = self.resolver(pids)
+            except (OSError, ValueError) as e:
+                logging.error("Cannot load scenario file %s: %s", path, e)
+                raise KeyError(name) from e
+            logging.debug("Loaded scenario %s from %s", repr(name), path)
+            self.scenarios[name] = pids
+        return self.scenarios[name]
+
+    def __setitem__(self, name, pids):
+        self.files.pop(name, None)
+        self.scenarios[name] = pids
+
+    def __delitem__(self, name):
+        if name in self.files:
+            del self.files[name]
+        else:
+            del self.scenarios[name]
+
+    def __contains__(self, name):
+        return name in self.scenarios or name in self.files
+
+    def __iter__(self):
+        # snapshots: accessing a scenario moves it from files to scenarios
+        yield from list(self.scenarios)
+        yield from list(self.files)
+
+    def __len__(self):
+        return len(self.scenarios) + len(self.files)
+
+    def is_loaded(self, name):
+        return name in self.scenarios
+
+    def copy(self):
+        """
+        :return: ScenarioCatalog sharing the loaded scenarios, without
+                loading the data files
+        """
+        catalog = ScenarioCatalog(self.scenarios, resolver=self.resolver)
+        catalog.files = dict(self.files)
+        return catalog
@@ -0,0 +1,20 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import os
+
+from .. import obd_message
+from ..scenario_file import ScenarioCatalog
+from ..value_providers import resolve_providers
+
+SCENARIO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Built-in scenarios of obd_message.py and data files of this directory,
+# loaded when selected
+ObdMessage = ScenarioCatalog(
+    obd_message.ObdMessage, directory=SCENARIO_DIR,
+    resolver=resolve_providers)
@@ -0,0 +1,208 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import itertools
+import logging
+from collections.abc import MutableMapping
+
+from .framing import LineFramer
+from .stats import PID_SLOTS, PidCounters
+
+# Elm attributes which hold the state of a client session
+SESSION_ATTRIBUTES = (
+    'counters',  # ELM settings and counters (SessionCounters)
+    'tasks',  # task stacks of each ECU
+    'task_shared_ns',  # ECU tasks and their shared namespaces
+    'request_timer',  # UDS P3 timer of each ECU
+    'shared',  # shared namespace of the current ECU
+    'framer',  # input line framing buffer
+)
+
+# Keys of the counters holding the ELM settings used to process each
+# request and response; SessionCounters stores them in typed fields
+SETTING_KEYS = (
+    'cmd_echo',  # ATE
+    'cmd_spaces',  # ATS
+    'cmd_linefeeds',  # ATL
+    'cmd_use_header',  # ATH
+    'cmd_caf',  # ATCAF
+    'cmd_cra',  # ATCRA
+    'cmd_set_header',  # ATSH
+)
+# Newline of each cmd_linefeeds value (values > 2 also omit the newline
+# before the prompt)
+NL_TYPES = {
+    0: "\r",
+    1: "\r\n",
+    2: "\n",
+    3: "\r",
+    4: "\r\n",
+    5: "\n"
+}
+
+_UNSET = object()  # setting not present in the counters
+
+_session_ids = itertools.count(1)
+
+
+class SessionCounters(MutableMapping):
+    """
+    Counters and ELM settings of a session (Elm.counters).
+    It behaves like the original dictionary, so that the 'Exec' strings of
+    the scenarios can still read and write self.counters[...]; the keys of
+    SETTING_KEYS are stored in fields, and the values derived from them
+    (echo, sp, nl, ...) are recomputed only when one of them changes, so
+    that the I/O loop does not look them up for each byte or response.
+    The request counters of the PIDs (self.counters[pid]) are stored in
+    an array indexed by their counter slot.
+    """
+    __slots__ = SETTING_KEYS + (
+        'values',  # counters which are not settings nor PID counters
+        'pids',  # request counters of the PIDs (PidCounters)
+        'echo',  # echo enabled (ATE1)
+        'use_headers',  # value of cmd_use_header, or False (ATH)
+        'sp',  # separator of the bytes (ATS)
+        'nl',  # newline (ATL)
+        'no_prompt_nl',  # no newline before the prompt (cmd_linefeeds > 2)
+        'cra_pattern',  # regular expression of the ATCRA filter
+        'pci',  # PCI byte included in the requests (ATCAF0)
+        'header',  # value of cmd_set_header, or None (ATSH)
+    )
+
+    def __init__(self, *args, **kwargs):
+        self.values = {}
+        self.pids = PidCounters()
+        for key in SETTING_KEYS:
+            setattr(self, key, _UNSET)
+        self.update_settings()
+        self.update(*args, **kwargs)
+
+    def update_settings(self):
+        """
+        Recompute the values derived from the settings.
+        """
+        echo = self.cmd_echo
+        self.echo = echo is _UNSET or bool(echo)
+        self.use_headers = (self.cmd_use_header is not _UNSET and
+                            self.cmd_use_header)
+        self.sp = '' if (self.cmd_spaces is not _UNSET and
+                         self.cmd_spaces == 0) else ' '
+        linefeeds = self.cmd_linefeeds
+        self.nl = "\r"
+        self.no_prompt_nl = False
+        if linefeeds is not _UNSET:
+            try:
+                self.nl = NL_TYPES[int(linefeeds)]
+            except Exception:
+                logging.error(
+                    'Invalid "cmd_linefeeds" value: %s.', repr(linefeeds))
+            try:
+                self.no_prompt_nl = linefeeds > 2
+            except TypeError:
+                pass
+        cra = self.cmd_cra
+        self.cra_pattern = r'[0-9A-F]+'
+        if cra is not _UNSET and cra:
+            self.cra_pattern = (
+                r'^' + cra.replace('X', '[0-9A-F]').replace('W', '[0-9A-F]+')
+                + r'$')
+        self.pci = self.cmd_caf is not _UNSET and not self.cmd_caf
+        header = self.cmd_set_header
+        self.header = None if header is _UNSET else header
+
+    def __getitem__(self, key):
+        if key in SETTING_KEYS:
+            value = getattr(self, key)
+            if value is _UNSET:
+                raise KeyError(key)
+            return value
+        slot = PID_SLOTS.get(key)
+        if slot is not None:
+            value = self.pids.get(slot)
+            if value is not None:
+                return value
+        return self.values[key]
+
+    def __setitem__(self, key, value):
+        if key in SETTING_KEYS:
+            setattr(self, key, value)
+            self.update_settings()
+            return
+        slot = PID_SLOTS.get(key)
+        if slot is not None and type(value) is int:
+            self.pids.set(slot, value)
+            self.values.pop(key, None)
+            return
+        if slot is not None:
+            self.pids.discard(slot)
+        self.values[key] = value
+
+    def __delitem__(self, key):
+        if key in SETTING_KEYS:
+            if getattr(self, key) is _UNSET:
+                raise KeyError(key)
+            setattr(self, key, _UNSET)
+            self.update_settings()
+            return
+        slot = PID_SLOTS.get(key)
+        if slot is None or not self.pids.discard(slot):
+            del self.values[key]
+
+    def __contains__(self, key):
+        if key in SETTING_KEYS:
+            return getattr(self, key) is not _UNSET
+        slot = PID_SLOTS.get(key)
+        if slot is not None and self.pids.get(slot) is not None:
+            return True
+        return key in self.values
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        for key in SETTING_KEYS:
+            if getattr(self, key) is not _UNSET:
+                yield key
+        for key, _ in self.pids.items():
+            yield key
+        yield from self.values
+
+    def __len__(self):
+        return len(self.values) + len(self.pids.items()) + sum(
+            getattr(self, key) is not _UNSET for key in SETTING_KEYS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ElmSession:
+    """
+    State of a single client connected to the emulator.
+    The Elm instance processes a request with the attributes listed in
+    SESSION_ATTRIBUTES, which are swapped by Elm.switch_session(); the
+    simulated car and its database are shared among all sessions.
+    """
+    __slots__ = ('session_id', 'peer', 'writer',
+                 'output') + SESSION_ATTRIBUTES
+
+    def __init__(self, newline=False, writer=None, peer=None, output=None):
+        self.session_id = next(_session_ids)
+        self.peer = peer  # address of the client (if any)
+        self.writer = writer  # function writing bytes to the client
+        self.output = output  # scheduled output of the writer (PacedOutput)
+        self.counters = SessionCounters()
+        self.tasks = {}
+        self.task_shared_ns = {}
+        self.request_timer = {}
+        self.shared = None
+        self.framer = LineFramer(newline)
+
+    def __repr__(self):
+        return '<ElmSession %s %s>' % (self.session_id, self.peer)
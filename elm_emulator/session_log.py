@@ -0,0 +1,254 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import logging
+import queue
+import struct
+import threading
+import time
+
+# Record layout: payload length, record type, monotonic timestamp, session id
+RECORD_HEADER = struct.Struct('<IBdI')
+# Record types
+REC_SCENARIO = 1  # payload: scenario name (UTF-8)
+REC_COMMAND = 2  # payload: received command (UTF-8)
+REC_OUTPUT = 3  # payload: bytes written by Elm.write_to_device()
+
+
+class SessionRecorder:
+    """
+    Append-only binary log of the commands received by the emulator and of
+    the bytes written to the device, with monotonic timestamps, session id
+    and scenario. Records are queued by the caller and written by a
+    background thread, so that the I/O loop never waits for the disk.
+    """
+
+    def __init__(self, path, clock=time.monotonic):
+        """
+        :param path: log file name (data are appended)
+        :param clock: function returning the timestamp of the records
+        """
+        self.path = path
+        self.clock = clock
+        self.file = open(path, 'ab')
+        self.queue = queue.SimpleQueue()
+        self.scenarios = {}  # session id -> last recorded scenario
+        self.records = 0
+        self.thread = threading.Thread(
+            target=self.writer, name='session-recorder', daemon=True)
+        self.thread.start()
+
+    def record(self, rec_type, session_id, payload):
+        """
+        Queue a record.
+        :param rec_type: REC_SCENARIO, REC_COMMAND or REC_OUTPUT
+        :param session_id: id of the client session (0 = single client)
+        :param payload: bytes
+        """
+        self.queue.put(RECORD_HEADER.pack(
+            len(payload), rec_type, self.clock(), session_id) + payload)
+
+    def command(self, session_id, scenario, cmd):
+        """
+        Queue a received command, preceded by the scenario if it changed.
+        """
+        if self.scenarios.get(session_id) != scenario:
+            self.scenarios[session_id] = scenario
+            self.record(REC_SCENARIO, session_id, scenario.encode())
+        self.record(REC_COMMAND, session_id, cmd.encode())
+
+    def output(self, session_id, data):
+        """
+        Queue the bytes written to the device.
+        """
+        self.record(REC_OUTPUT, session_id, bytes(data))
+
+    def writer(self):
+        while True:
+            data = self.queue.get()
+            if data is None:
+                break
+            try:
+                self.file.write(data)
+                self.records += 1
+                if self.queue.empty():
+                    self.file.flush()
+            except Exception as e:
+                logging.error("Cannot write session log %s: %s",
+                              self.path, e)
+        self.file.close()
+
+    def close(self):
+        """
+        Write the queued records and close the log.
+        """
+        self.queue.put(None)
+        self.thread.join()
+        logging.debug("Session log %s closed: %s records written.",
+                      self.path, self.records)
+
+
+def read_records(path):
+    """
+    Read a session log.
+    :param path: log file name
+    :return: iterator of (rec_type, timestamp, session_id, payload)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    offset = 0
+    while offset + RECORD_HEADER.size <= len(data):
+        length, rec_type, timestamp, session_id = RECORD_HEADER.unpack_from(
+            data, offset)
+        offset += RECORD_HEADER.size
+        if offset + length > len(data):
+            logging.warning("Truncated record at the end of %s", path)
+            return
+        yield rec_type, timestamp, session_id, data[offset:offset + length]
+        offset += length
+
+
+class FastTime:
+    """
+    Replacement of the time module used by the emulator during a fast
+    replay (ref. Elm.time): sleeps return immediately and advance a virtual
+    offset added to the returned times.
+    """
+
+    def __init__(self):
+        self.offset = 0.0  # skipped seconds
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.offset += seconds
+
+    def time(self):
+        return time.time() + self.offset
+
+    def monotonic(self):
+        return time.monotonic() + self.offset
+
+    def perf_counter(self):
+        return time.perf_counter() + self.offset
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class ReplayResult:
+    """
+    Outcome of a replay: commands, mismatching outputs and timing.
+    """
+
+    def __init__(self):
+        self.commands = 0
+        self.mismatches = []  # (session_id, cmd, expected, actual)
+        self.elapsed = 0.0  # seconds spent by the replay
+        self.recorded_duration = 0.0  # seconds spanned by the recording
+
+    @property
+    def speedup(self):
+        return self.recorded_duration / self.elapsed if self.elapsed else 0.0
+
+    def __bool__(self):
+        return not self.mismatches
+
+    def __repr__(self):
+        return ('<ReplayResult %s commands, %s mismatches, %.1fx>' %
+                (self.commands, len(self.mismatches), self.speedup))
+
+
+class SessionReplayer:
+    """
+    Feed a session log back through Elm.process_command() (i.e.,
+    handle_request() and handle_response()) and compare the bytes written
+    by the emulator with the recorded ones. Each recorded session is
+    replayed in its own ElmSession.
+    """
+
+    def __init__(self, emulator, path):
+        """
+        :param emulator: Elm instance (not running a port)
+        :param path: session log file name
+        """
+        self.emulator = emulator
+        self.path = path
+
+    def load(self):
+        """
+        Group the log into commands with their expected output.
+        :return: list of [timestamp, session_id, scenario, cmd, expected]
+        """
+        steps = []
+        last_step = {}  # session id -> last step of the session
+        scenarios = {}
+        for rec_type, timestamp, session_id, payload in read_records(
+                self.path):
+            if rec_type == REC_SCENARIO:
+                scenarios[session_id] = payload.decode()
+            elif rec_type == REC_COMMAND:
+                step = [timestamp, session_id, scenarios.get(session_id),
+                        payload.decode(), bytearray()]
+                steps.append(step)
+                last_step[session_id] = step
+            elif rec_type == REC_OUTPUT and session_id in last_step:
+                last_step[session_id][4] += payload
+        return steps
+
+    def replay(self, pace=None):
+        """
+        Replay the log.
+        :param pace: None to replay as fast as possible, skipping the
+                simulated delays (ref. FastTime), otherwise the speed factor
+                of the recorded pace (e.g., 1.0 = real time)
+        :return: ReplayResult
+        """
+        steps = self.load()
+        if not steps:
+            return ReplayResult()
+        emulator = self.emulator
+        emulator_time = emulator.time
+        if not pace:
+            emulator.time = FastTime()
+        try:
+            return self.run_steps(steps, pace)
+        finally:
+            emulator.time = emulator_time
+
+    def run_steps(self, steps, pace):
+        emulator = self.emulator
+        result = ReplayResult()
+        sessions = {}
+        output = bytearray()
+        start_time = time.monotonic()
+        first_timestamp = steps[0][0]
+        for timestamp, session_id, scenario, cmd, expected in steps:
+            if pace:
+                delay = ((timestamp - first_timestamp) / pace -
+                         (time.monotonic() - start_time))
+                if delay > 0:
+                    time.sleep(delay)
+            with emulator.session_lock:
+                if session_id not in sessions:
+                    sessions[session_id] = emulator.new_session(
+                        writer=output.extend, peer=('replay', session_id))
+                emulator.switch_session(sessions[session_id])
+                if scenario and scenario != emulator.scenario:
+                    emulator.set_sorted_obd_msg(scenario)
+                del output[:]
+                emulator.cmd = cmd
+                emulator.process_command()
+            result.commands += 1
+            if output != expected:
+                result.mismatches.append(
+                    (session_id, cmd, bytes(expected), bytes(output)))
+        result.elapsed = time.monotonic() - start_time
+        result.recorded_duration = steps[-1][0] - first_timestamp
+        for session in sessions.values():
+            with emulator.session_lock:
+                emulator.close_session(session)
+        return result
@@ -0,0 +1,154 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import logging
+import threading
+import time
+
+# Policies used when the simulation thread is late
+CATCH_UP = 'catch_up'  # run the missed steps (up to max_catch_up per tick)
+SKIP = 'skip'  # run a single step and drop the missed ones
+POLICIES = (CATCH_UP, SKIP)
+
+
+class CarSimulation:
+    """
+    Headless driver of the car physics: a dedicated thread advances the Car
+    with a fixed-step clock and publishes its state into the database of the
+    emulator, with no need of a GUI or a display.
+    The GUI (or any other client) sets the pedal inputs through set_inputs()
+    and reads the car state holding the lock.
+    """
+
+    def __init__(self, car, database=None, tick_rate=100, policy=CATCH_UP,
+                 max_catch_up=5, clock=time.monotonic):
+        """
+        :param car: Car instance to be simulated
+        :param database: dictionary where the car state is published
+                (e.g., Elm.database); None = no publishing
+        :param tick_rate: number of simulation steps per second
+        :param policy: CATCH_UP or SKIP, used when steps are missed
+        :param max_catch_up: maximum number of steps run at once with the
+                CATCH_UP policy
+        :param clock: monotonic clock function returning seconds
+        """
+        if policy not in POLICIES:
+            raise ValueError('Invalid simulation policy %s' % repr(policy))
+        if tick_rate <= 0:
+            raise ValueError('Invalid tick rate %s' % repr(tick_rate))
+        self.car = car
+        self.database = database
+        self.tick_rate = tick_rate
+        self.policy = policy
+        self.max_catch_up = max(1, max_catch_up)
+        self.clock = clock
+        self.lock = threading.RLock()  # held while the car is updated
+        self.paused = False  # the car is not updated, the clock goes on
+        self.ticks = 0  # number of executed steps
+        self.skipped_ticks = 0  # number of dropped steps
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def set_inputs(self, throttle_position, brake_position):
+        """
+        Set the pedal inputs used by the next steps.
+        :param throttle_position: throttle position in range [0, 1]
+        :param brake_position: brake position in range [0, 1]
+        """
+        with self.lock:
+            self.car.throttle_position = throttle_position
+            self.car.brake_position = brake_position
+
+    def step(self):
+        """
+        Advance the car of one step and publish its state.
+        """
+        with self.lock:
+            car = self.car
+            car.update(car.throttle_position, car.brake_position)
+            self.publish()
+
+    def publish(self):
+        """
+        Copy the car state into the database.
+        """
+        if self.database is None:
+            return
+        car = self.car
+        self.database.update(
+            rpm=car.rpm,
+            speed=car.speed,
+            engine_temp=car.engine_temp,
+            fuel_level=car.get_fuel_level_percentage(),
+            gear=car.gear,
+            gear_position=car.gear_position)
+
+    def advance(self, now, next_tick):
+        """
+        Run the steps due at a given time, according to the policy.
+        :param now: current clock time
+        :param next_tick: clock time of the next due step
+        :return: clock time of the following step
+        """
+        period = 1.0 / self.tick_rate
+        due = int((now - next_tick) / period) + 1
+        if self.policy == CATCH_UP:
+            steps = min(due, self.max_catch_up)
+        else:
+            steps = 1
+        if not self.paused:
+            for _ in range(steps):
+                self.step()
+            self.ticks += steps
+        self.skipped_ticks += due - steps
+        return next_tick + due * period
+
+    def run(self):
+        """
+        Simulation loop (ref. start()).
+        """
+        next_tick = self.clock()
+        while not self.stop_event.is_set():
+            now = self.clock()
+            if now < next_tick:
+                self.stop_event.wait(next_tick - now)
+                continue
+            try:
+                next_tick = self.advance(now, next_tick)
+            except Exception as e:
+                logging.error("Car simulation error: %s", e, exc_info=True)
+                self.stop_event.set()
+
+    def start(self):
+        """
+        Start the simulation thread.
+        :return: self
+        """
+        if self.thread and self.thread.is_alive():
+            return self
+        self.stop_event.clear()
+        self.publish()
+        self.thread = threading.Thread(
+            target=self.run, name='car-simulation', daemon=True)
+        self.thread.start()
+        logging.debug("Car simulation started at %s steps per second, "
+                      "policy %s.", self.tick_rate, self.policy)
+        return self
+
+    def stop(self):
+        """
+        Stop the simulation thread.
+        """
+        self.stop_event.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(1)
+        self.thread = None
+        logging.debug("Car simulation stopped after %s steps (%s skipped).",
+                      self.ticks, self.skipped_ticks)
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
@@ -0,0 +1,167 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+import threading
+from array import array
+
+MAX_UNKNOWN_COMMANDS = 256  # distinct unknown commands tracked
+
+# Counter slot of each PID name, assigned when the PID is first indexed
+# by a DispatchIndex (the number of slots is bounded by the PIDs of the
+# loaded scenarios)
+PID_SLOTS = {}
+PID_NAMES = []  # PID name of each counter slot
+_pid_slots_lock = threading.Lock()
+
+
+def pid_slot(pid):
+    """
+    :param pid: PID name
+    :return: counter slot of the PID (ref. PidCounters)
+    """
+    try:
+        return PID_SLOTS[pid]
+    except KeyError:
+        pass
+    with _pid_slots_lock:
+        if pid not in PID_SLOTS:
+            PID_SLOTS[pid] = len(PID_NAMES)
+            PID_NAMES.append(pid)
+        return PID_SLOTS[pid]
+
+
+class PidCounters:
+    """
+    Number of requests of each PID, stored in an array indexed by the
+    counter slot of the PID (ref. DispatchEntry.counter_slot).
+    """
+    __slots__ = ('counts',)
+
+    UNSET = -1  # the PID has no counter
+
+    def __init__(self):
+        self.counts = array('q')
+
+    def reserve(self, slot):
+        counts = self.counts
+        if slot >= len(counts):
+            counts.extend([self.UNSET] * (slot + 1 - len(counts)))
+
+    def hit(self, slot):
+        """
+        Increment the counter of a PID.
+        :param slot: counter slot of the PID
+        :return: the incremented counter
+        """
+        counts = self.counts
+        if slot >= len(counts):
+            self.reserve(slot)
+        count = counts[slot]
+        count = 1 if count == self.UNSET else count + 1
+        counts[slot] = count
+        return count
+
+    def get(self, slot):
+        """
+        :return: counter of the PID, or None if not set
+        """
+        if slot < len(self.counts):
+            count = self.counts[slot]
+            if count != self.UNSET:
+                return count
+        return None
+
+    def set(self, slot, count):
+        self.reserve(slot)
+        self.counts[slot] = count
+
+    def discard(self, slot):
+        """
+        :return: True if the counter was set
+        """
+        if self.get(slot) is None:
+            return False
+        self.counts[slot] = self.UNSET
+        return True
+
+    def items(self):
+        """
+        :return: list of (PID name, counter) of the counters which are set
+        """
+        counts = self.counts[:]  # copy: the array can grow meanwhile
+        return [(PID_NAMES[slot], count) for slot, count in enumerate(counts)
+                if count != self.UNSET]
+
+
+class UnknownCommands:
+    """
+    Bounded statistics of the requests which do not match any PID,
+    tracked with the Space-Saving algorithm: at most 'capacity' commands
+    are stored and, when a new command is received with a full table, it
+    replaces the least frequent one, inheriting its count (which becomes
+    the maximum overestimation 'error' of the new command).
+    The most frequent commands are always kept, whatever is the number of
+    distinct commands sent by the client.
+    """
+
+    def __init__(self, capacity=MAX_UNKNOWN_COMMANDS):
+        self.capacity = capacity
+        self.commands = {}  # cmd -> [count, error, last forwarded answer]
+        self.total = 0  # number of unknown requests
+        self.lock = threading.Lock()
+
+    def add(self, cmd):
+        """
+        Count an unknown command.
+        :param cmd: request
+        :return: estimated number of occurrences of the command
+        """
+        with self.lock:
+            self.total += 1
+            item = self.commands.get(cmd)
+            if item is None:
+                count = error = 0
+                if len(self.commands) >= self.capacity:
+                    evicted = min(self.commands,
+                                  key=lambda k: self.commands[k][0])
+                    count = error = self.commands.pop(evicted)[0]
+                item = self.commands[cmd] = [count, error, None]
+            item[0] += 1
+            return item[0]
+
+    def set_answer(self, cmd, answer):
+        """
+        Store the answer of the real adapter to an unknown command.
+        """
+        with self.lock:
+            item = self.commands.get(cmd)
+            if item is not None:
+                item[2] = answer
+
+    def count(self, cmd):
+        """
+        :return: estimated number of occurrences of the command (0 if not
+                tracked)
+        """
+        item = self.commands.get(cmd)
+        return item[0] if item else 0
+
+    def top(self, n=None):
+        """
+        :param n: max number of commands (None = all the tracked ones)
+        :return: list of (cmd, count, error, answer), most frequent first
+        """
+        with self.lock:
+            items = [(cmd, count, error, answer) for cmd, (
+                count, error, answer) in self.commands.items()]
+        items.sort(key=lambda i: i[1], reverse=True)
+        return items[:n] if n is not None else items
+
+    def clear(self):
+        with self.lock:
+            self.commands.clear()
+            self.total = 0
@@ -0,0 +1,109 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+SINGLE_FRAME_SIZE = 7  # ISO-TP: max data bytes of a Single Frame
+FIRST_FRAME_SIZE = 6  # ISO-TP: data bytes of a First Frame
+CONSECUTIVE_FRAME_SIZE = 7  # ISO-TP: data bytes of a Consecutive Frame
+
+# Uppercase hex representation of each byte value
+HEX_BYTE = tuple('%02X' % i for i in range(256))
+
+_hex_tables = {}
+
+
+def hex_table(sp):
+    """
+    Return the lookup table mapping each byte value to its uppercase hex
+    representation followed by the separator.
+    :param sp: separator (space string)
+    :return: tuple of 256 strings
+    """
+    try:
+        return _hex_tables[sp]
+    except KeyError:
+        table = tuple(h + sp for h in HEX_BYTE)
+        _hex_tables[sp] = table
+        return table
+
+
+def encode_iso_tp(payload, answer_header, use_headers, pci, sp, nl):
+    """
+    Encode an answer with ISO-TP 11 bit CAN identifier framing (Single
+    Frame, or First Frame followed by Consecutive Frames), rendered like
+    the ELM327 does.
+    :param payload: data bytes of the answer
+    :param answer_header: header of the answer (e.g., '7E8')
+    :param use_headers: True if headers are shown (ATH1)
+    :param pci: True if PCI bytes are shown without headers (ATCAF0)
+    :param sp: space string
+    :param nl: newline string
+    :return: string including the formatted answer
+    """
+    length = len(payload)
+    if length <= SINGLE_FRAME_SIZE:
+        data = sp.join([HEX_BYTE[x] for x in payload])
+        if use_headers:
+            return (answer_header + sp + "%02X" % length + sp + data +
+                    sp + nl)
+        if pci:
+            return "%02X" % length + sp + data + sp + nl
+        return data + sp + nl
+
+    # multiframe output: each frame is rendered with a trailing separator
+    table = hex_table(sp)
+    if use_headers:
+        parts = [answer_header, sp, "10", sp, "%02X" % length, sp]
+    elif pci:
+        parts = ["10", sp, "%02X" % length, sp]
+    else:
+        parts = ["%03X" % length, nl, "0: "]
+    parts += [table[x] for x in payload[:FIRST_FRAME_SIZE]]
+    parts.append(nl)
+    frame_count = 1
+    for offset in range(FIRST_FRAME_SIZE, length, CONSECUTIVE_FRAME_SIZE):
+        if use_headers:
+            parts += (answer_header, sp, HEX_BYTE[0x20 + frame_count], sp)
+        elif pci:
+            parts += (HEX_BYTE[0x20 + frame_count], sp)
+        else:
+            parts += ("%01X" % frame_count, ": ")
+        parts += [table[x] for x in
+                  payload[offset:offset + CONSECUTIVE_FRAME_SIZE]]
+        parts.append(nl)
+        frame_count = (frame_count + 1) & 0x0F
+    return "".join(parts)
+
+
+def encode_kwp(payload, request_header, sp, nl, min_size_length):
+    """
+    Encode an answer with KWP2000 framing (format byte, target, source,
+    optional length byte, data and checksum).
+    :param payload: data bytes of the answer
+    :param request_header: 6 hex digits header of the request (e.g., '8110F1')
+    :param sp: space string
+    :param nl: newline string
+    :param min_size_length: minimum size using the extra length byte
+    :return: string including the formatted answer; None if the length of
+            the payload cannot be represented (the caller shall
+            produce the answer without checksum)
+    """
+    length = len(payload)
+    if length > 0xFF or (length < min_size_length and length > 0x7F):
+        return None
+    target = request_header[4:6]
+    source = request_header[2:4]
+    if length < min_size_length:
+        head = (128 + length, int(target, 16), int(source, 16))
+    else:  # Extra length byte follows
+        head = (0x80, int(target, 16), int(source, 16), length)
+    table = hex_table(sp)
+    parts = [table[x] for x in head]
+    parts += [table[x] for x in payload]
+    if not payload:
+        parts.append(sp)  # empty data field between header and checksum
+    parts += (HEX_BYTE[(sum(head) + sum(payload)) & 0xFF], sp, nl)
+    return "".join(parts)
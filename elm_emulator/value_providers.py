@@ -0,0 +1,91 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+from functools import partial
+
+from .obd_message import PA, NA
+
+# Keys of a PID whose value can be a value provider
+PROVIDER_KEYS = ('ResponseHeader', 'ResponseFooter')
+PROVIDER_KEY = 'Provider'
+
+VALUE_PROVIDERS = {}
+
+
+def value_provider(name):
+    """
+    Decorator registering a function as a named value provider, which data
+    file scenarios can use in place of the lambdas of ObdMessage:
+
+        "ResponseFooter": {"Provider": "<name>", "<arg>": <value>, ...}
+
+    The function is invoked like the lambdas, with the additional
+    arguments of the data file:
+    function(self, cmd, pid, uc_val, **args) -> response string
+    :param name: name of the value provider
+    """
+    def register(function):
+        VALUE_PROVIDERS[name] = function
+        return function
+    return register
+
+
+def get_value_provider(spec):
+    """
+    :param spec: dictionary with the name of the provider (PROVIDER_KEY)
+            and its arguments
+    :return: function(self, cmd, pid, uc_val)
+    :raise ValueError: unknown provider
+    """
+    args = dict(spec)
+    name = args.pop(PROVIDER_KEY, None)
+    if name not in VALUE_PROVIDERS:
+        raise ValueError('Unknown value provider %s' % repr(name))
+    return partial(VALUE_PROVIDERS[name], **args)
+
+
+def resolve_providers(pids):
+    """
+    Replace the value provider specifications of a data file scenario with
+    the related functions (in place).
+    :param pids: dictionary of PIDs
+    :return: pids
+    :raise ValueError: unknown provider
+    """
+    for val in pids.values():
+        for key in PROVIDER_KEYS:
+            if isinstance(val.get(key), dict):
+                val[key] = get_value_provider(val[key])
+    return pids
+
+
+@value_provider('sequence')
+def sequence(self, cmd, pid, uc_val, base, max, factor, n_bytes):
+    """
+    Positive answer with a value generated by Elm.sequence().
+    """
+    return PA(self.sequence(
+        pid, base=base, max=max, factor=factor, n_bytes=n_bytes))
+
+
+@value_provider('request_data')
+def request_data(self, cmd, pid, uc_val, offset=2):
+    """
+    Positive answer repeating the request after the SID.
+    """
+    return PA(cmd[offset:])
+
+
+@value_provider('shared_flag')
+def shared_flag(self, cmd, pid, uc_val, flag, pos_answer, neg_answer):
+    """
+    Positive answer if the attribute 'flag' of self.shared is true,
+    otherwise negative answer.
+    """
+    if getattr(self.shared, flag):
+        return PA(pos_answer)
+    return NA(neg_answer)
@@ -1,10 +1,41 @@
 import logging
+import sys
 
 from elm_emulator import Elm, CarEmulatorGUI
+from elm_emulator.log_trace import QueuedLogging, TraceHandler
 
-logging.basicConfig(level=logging.DEBUG)
+# --debug: text logs at DEBUG level (default: INFO)
+# --trace FILE: DEBUG records written to a binary trace, text logs at INFO
+# --throughput: responses paced at the rate of the UART and of the bus
+logging.basicConfig(
+    level=logging.DEBUG if '--debug' in sys.argv else logging.INFO)
+trace = None
+if '--trace' in sys.argv[:-1]:
+    for handler in logging.getLogger().handlers:
+        handler.setLevel(logging.getLogger().level)
+    logging.getLogger().setLevel(logging.DEBUG)
+    trace = TraceHandler(sys.argv[sys.argv.index('--trace') + 1])
+    logging.getLogger().addHandler(trace)
+# log records are formatted and written by a background thread
+queued_logging = QueuedLogging().start()
 
-with Elm(net_port=3000) as emulator:
-    # Create and start the GUI
-    gui = CarEmulatorGUI(emulator)
-    gui.start()
+try:
+    with Elm(net_port=3000) as emulator:
+        if '--throughput' in sys.argv:
+            emulator.start_throughput()
+        if '--headless' in sys.argv:
+            # No display: the car is only driven by the simulation thread
+            emulator.start_simulation()
+            try:
+                emulator.thread.join()
+            except KeyboardInterrupt:
+                pass
+        else:
+            # Create and start the GUI
+            gui = CarEmulatorGUI(emulator)
+            gui.start()
+finally:
+    queued_logging.stop()
+    if trace:
+        logging.getLogger().removeHandler(trace)
+        trace.close()
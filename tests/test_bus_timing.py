@@ -0,0 +1,26 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+"""
+PacedOutput (ref. bus_timing), which replaces the time module of the
+emulator while a request of a multi-client session is processed.
+"""
+
+import time
+
+from elm_emulator.bus_timing import PacedOutput
+
+
+def test_paced_output_time_functions():
+    calls = []
+    output = PacedOutput(calls.append, lambda when, callback: None)
+    output.sleep(10)
+    assert output.monotonic() - time.monotonic() > 9
+    assert not calls
+    # the other functions are the ones of the time module
+    assert output.strftime('%Y', output.localtime(0)) == time.strftime(
+        '%Y', time.localtime(0))
@@ -0,0 +1,33 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+"""
+Custom PIDs answered by handle_request() with the values of the car
+emulator (ref. car_emulator.Car).
+"""
+
+import logging
+
+from elm_emulator import Elm
+
+
+def test_custom_pids():
+    logging.disable(logging.CRITICAL)
+    try:
+        emulator = Elm()
+        emulator.car.rpm = 2500.0
+        emulator.car.speed = 88
+        emulator.car.gear_position = 'D'
+        emulator.car.gear = 3
+        for cmd, response in (('010C', '41 0C 2710'),
+                              ('010D', '41 0D 58'),
+                              ('0120', '41 20 44'),
+                              ('0121', '41 21 03')):
+            header, request, answer = emulator.handle_request(cmd)
+            assert (header, request, answer) == ('7E0', cmd, response)
+    finally:
+        logging.disable(logging.NOTSET)
@@ -0,0 +1,68 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+"""
+Timing of the echo (ATE1): the ELM327 echoes a request at once, before the
+delays of the answer (ATZ, UDS P2 timer).
+"""
+
+import logging
+import socket
+import time
+
+from elm_emulator import Elm
+
+MAX_ECHO_TIME = 0.1  # seconds
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def read_response(conn):
+    """
+    :return: (data read until the prompt, seconds to the first byte, seconds
+            to the prompt)
+    """
+    start = time.monotonic()
+    first = None
+    data = b''
+    while not data.endswith(b'>'):
+        chunk = conn.recv(4096)
+        assert chunk, data
+        if first is None:
+            first = time.monotonic() - start
+        data += chunk
+    return data, first, time.monotonic() - start
+
+
+def test_echo_before_sleep():
+    logging.disable(logging.CRITICAL)
+    port = free_port()
+    try:
+        with Elm(net_port=port) as emulator:
+            conn = None
+            for _ in range(50):
+                try:
+                    conn = socket.create_connection(('127.0.0.1', port))
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            assert conn is not None
+            conn.settimeout(5)
+            with conn:
+                for cmd, delay in (b'ATZ', 0), (b'0100', 0.5):
+                    emulator.delay = delay  # UDS P2 timer
+                    conn.sendall(cmd + b'\r')
+                    data, first, last = read_response(conn)
+                    assert data.startswith(cmd + b'\r'), data
+                    assert first < MAX_ECHO_TIME, (cmd, first)
+                    assert last >= 0.4, (cmd, last)
+    finally:
+        logging.disable(logging.NOTSET)
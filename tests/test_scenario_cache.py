@@ -0,0 +1,60 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+"""
+Scenario cache (ref. scenario_cache): compiled scenarios written to the
+cache directory and read back on the following loads.
+"""
+
+import logging
+import os
+
+from elm_emulator.scenario_cache import (
+    SCENARIO_CACHE_EXT, emulator_version, load_dispatch_index)
+
+BAD_SIZE = [
+    ('BAD_SIZE', {
+        'Request': '^22F190$',
+        'Response': '<header>7E8</header><size>ZZ</size>'
+                    '<data>62 F1 90</data>'}),
+]
+
+BAD_EXEC = [
+    ('BAD_EXEC', {
+        'Request': '^22F191$',
+        'Exec': 'x = (',
+        'Response': '62 F1 91 00'}),
+]
+
+
+def cache_files(directory):
+    return [f for f in os.listdir(directory)
+            if f.endswith(SCENARIO_CACHE_EXT)]
+
+
+def test_invalid_size_is_cached(tmp_path):
+    index = load_dispatch_index(BAD_SIZE, str(tmp_path))
+    assert len(cache_files(tmp_path)) == 1
+    cached = load_dispatch_index(BAD_SIZE, str(tmp_path))
+    assert [e.pid for e in cached.entries] == [e.pid for e in index.entries]
+
+
+def test_invalid_code_is_reported(tmp_path, caplog):
+    for _ in range(2):
+        caplog.clear()
+        with caplog.at_level(logging.ERROR):
+            load_dispatch_index(BAD_EXEC, str(tmp_path))
+        assert 'Invalid Python code in <BAD_EXEC Exec>' in caplog.text
+    assert not cache_files(tmp_path)
+
+
+def test_stale_files_are_removed(tmp_path):
+    stale = tmp_path / ('00000000-0' + SCENARIO_CACHE_EXT)
+    stale.write_bytes(b'')
+    load_dispatch_index(BAD_SIZE, str(tmp_path))
+    files = cache_files(tmp_path)
+    assert len(files) == 1 and files[0].startswith(emulator_version())
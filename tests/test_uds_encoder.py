@@ -0,0 +1,79 @@
+###########################################################################
+# ELM327-emulator
+# ELM327 Emulator for testing software interfacing OBDII via ELM327 adapter
+# https://github.com/Ircama/ELM327-emulator
+# (C) Ircama 2021 - CC-BY-NC-SA-4.0
+###########################################################################
+
+"""
+Golden corpus of the ISO-TP/KWP2000 answers: data/uds_encoder_golden.json
+holds the outputs of Elm.uds_answer() before the byte-oriented encoder
+(ref. uds_encoder) was introduced, for each request header, ATCAF setting,
+ATH, ATS and ATL setting and payload. Run with
+
+    python -m pytest tests
+"""
+
+import json
+import logging
+import os
+
+from elm_emulator import Elm
+from elm_emulator.elm_emulator import MIN_SIZE_UDS_LENGTH
+from elm_emulator.uds_encoder import encode_iso_tp, encode_kwp
+
+CORPUS = os.path.join(
+    os.path.dirname(__file__), 'data', 'uds_encoder_golden.json')
+
+
+def load_corpus():
+    """
+    :return: list of cases: header, cmd_caf, use_headers, sp, nl, payload
+            (hex string) and the expected output
+    """
+    with open(CORPUS) as f:
+        return json.load(f)
+
+
+def test_encode_iso_tp():
+    count = 0
+    for case in load_corpus():
+        if len(case['header']) != 3:
+            continue
+        answer_header = '%X' % (int(case['header'], 16) + 8)
+        assert encode_iso_tp(
+            bytes.fromhex(case['payload']), answer_header,
+            case['use_headers'], case['cmd_caf'] is False,
+            case['sp'], case['nl']) == case['output'], case
+        count += 1
+    assert count
+
+
+def test_encode_kwp():
+    count = 0
+    for case in load_corpus():
+        if len(case['header']) != 6 or not case['use_headers']:
+            continue
+        output = encode_kwp(
+            bytes.fromhex(case['payload']), case['header'],
+            case['sp'], case['nl'], MIN_SIZE_UDS_LENGTH)
+        if output is None:  # answer without checksum (ref. uds_answer)
+            continue
+        assert output == case['output'], case
+        count += 1
+    assert count
+
+
+def test_uds_answer():
+    logging.disable(logging.CRITICAL)
+    try:
+        emulator = Elm()
+        for case in load_corpus():
+            emulator.counters.pop('cmd_caf', None)
+            if case['cmd_caf'] is not None:
+                emulator.counters['cmd_caf'] = case['cmd_caf']
+            assert emulator.uds_answer(
+                case['payload'], case['header'], case['use_headers'], '.*',
+                case['sp'], case['nl']) == case['output'], case
+    finally:
+        logging.disable(logging.NOTSET)